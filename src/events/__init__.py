@@ -4,11 +4,13 @@ This package provides event emission, queues, cursor management, scheduling,
 and routing infrastructure. Phase 4 introduces "movement" without "interpretation".
 """
 
-from .cursor import CursorCodec, CursorManager
-from .emission import EventEmitter, EventFactory
-from .queue import EventQueue
-from .routing import EventBus
+from .cursor import CursorCodec, CursorManager, CursorTracker
+from .dispatch import AsyncDispatcher, DispatchMode, OverflowPolicy
+from .emission import EventEmitter, EventFactory, EventIdGenerator
+from .queue import EventQueue, HeapEventQueue
+from .routing import CascadeStats, EventBus
 from .scheduler import (
+    DeadlineScheduler,
     IntervalTrigger,
     OneShotTrigger,
     Scheduler,
@@ -16,16 +18,20 @@ from .scheduler import (
     Trigger,
     TriggerType,
 )
+from .store import SQLiteEventStore
 
 __all__ = [
     # Emission
     "EventFactory",
     "EventEmitter",
+    "EventIdGenerator",
     # Queue
     "EventQueue",
+    "HeapEventQueue",
     # Cursor
     "CursorCodec",
     "CursorManager",
+    "CursorTracker",
     # Scheduling
     "Trigger",
     "TriggerType",
@@ -33,8 +39,15 @@ __all__ = [
     "TimeOfDayTrigger",
     "OneShotTrigger",
     "Scheduler",
+    "DeadlineScheduler",
+    # Storage
+    "SQLiteEventStore",
     # Routing
     "EventBus",
+    "CascadeStats",
+    "AsyncDispatcher",
+    "DispatchMode",
+    "OverflowPolicy",
 ]
 
 
@@ -1,6 +1,7 @@
 """Cursor management infrastructure for Phase 4.
 
 Provides cursor encoding/decoding and cursor state management via StateContainer.
+CursorTracker keeps the high-water mark as a native int for hot consumption loops.
 
 Per spec/base1.0/nyrahome_cloud_spec.md §2: Cursor format is s:<seq>
 """
@@ -8,7 +9,8 @@ Per spec/base1.0/nyrahome_cloud_spec.md §2: Cursor format is s:<seq>
 from __future__ import annotations
 
 import re
-from typing import List, Optional, TYPE_CHECKING
+import time
+from typing import Iterable, List, Optional, TYPE_CHECKING
 
 from ..state.keys import SyncKeys
 from ..state.models.cursor import Cursor
@@ -189,7 +191,123 @@ class CursorManager:
         return new_cursor
 
 
+class CursorTracker:
+    """Tracks the consumed-seq high-water mark as an int and persists lazily.
 
+    `observe` / `observe_many` update the mark in O(1) per event; the
+    `s:<seq>` string and the `Cursor` model are only built when the mark is
+    persisted to the StateContainer. Persistence happens on `persist()` and,
+    optionally, automatically every `persist_every_events` advances or
+    `persist_interval_seconds`.
 
+    At-least-once semantics are unchanged: callers observe events only after
+    processing them, and the persisted cursor never runs ahead of the
+    observed mark, so a restart re-delivers at most the unpersisted tail.
+    """
+
+    def __init__(
+        self,
+        container: "StateContainer",
+        persist_every_events: Optional[int] = None,
+        persist_interval_seconds: Optional[float] = None,
+    ) -> None:
+        """Initialize the tracker from the cursor stored in state.
+
+        Args:
+            container: The state container for cursor storage.
+            persist_every_events: Persist after this many observed events
+                with seq > 0 (None disables).
+            persist_interval_seconds: Persist when this much time has passed
+                since the last persist (None disables; checked on observe).
+        """
+        self._manager = CursorManager(container)
+        stored = CursorCodec.decode(self._manager.get_current_cursor_string())
+        self._high_water = stored or 0
+        self._persisted = self._high_water
+        self._persist_every_events = persist_every_events
+        self._persist_interval_seconds = persist_interval_seconds
+        self._since_persist = 0
+        self._last_persist = time.monotonic()
+
+    @property
+    def high_water(self) -> int:
+        """Return the highest observed seq."""
+        return self._high_water
+
+    @property
+    def cursor_string(self) -> str:
+        """Return the current cursor string (`s:<high_water>`)."""
+        return CursorCodec.encode(self._high_water)
+
+    @property
+    def dirty(self) -> bool:
+        """Return True if the observed mark is ahead of the persisted cursor."""
+        return self._high_water != self._persisted
+
+    def observe(self, event: EventEnvelope) -> None:
+        """Record that an event has been processed.
+
+        Args:
+            event: The processed event (seq 0 is ignored).
+        """
+        seq = event.seq
+        if seq > 0:
+            if seq > self._high_water:
+                self._high_water = seq
+            self._since_persist += 1
+            self._maybe_persist()
 
+    def observe_many(self, events: Iterable[EventEnvelope]) -> None:
+        """Record that a batch of events has been processed.
 
+        Args:
+            events: The processed events (seq 0 entries are ignored).
+        """
+        high_water = self._high_water
+        count = 0
+        for event in events:
+            seq = event.seq
+            if seq > 0:
+                count += 1
+                if seq > high_water:
+                    high_water = seq
+        self._high_water = high_water
+        self._since_persist += count
+        self._maybe_persist()
+
+    def observe_seq(self, seq: int) -> None:
+        """Record a processed seq directly (e.g. a `since` page's last seq).
+
+        Args:
+            seq: The processed sequence number.
+        """
+        if seq > self._high_water:
+            self._high_water = seq
+        self._since_persist += 1
+        self._maybe_persist()
+
+    def _maybe_persist(self) -> None:
+        if (
+            self._persist_every_events is not None
+            and self._since_persist >= self._persist_every_events
+        ):
+            self.persist()
+        elif (
+            self._persist_interval_seconds is not None
+            and time.monotonic() - self._last_persist >= self._persist_interval_seconds
+        ):
+            self.persist()
+
+    def persist(self) -> bool:
+        """Write the cursor to the StateContainer if it has advanced.
+
+        Returns:
+            True if a new cursor was written, False if nothing changed.
+        """
+        self._since_persist = 0
+        self._last_persist = time.monotonic()
+        if not self.dirty:
+            return False
+        self._manager.update_cursor(Cursor(__root__=CursorCodec.encode(self._high_water)))
+        self._persisted = self._high_water
+        return True
@@ -0,0 +1,341 @@
+"""Asynchronous event dispatch infrastructure for Phase 4.
+
+Provides per-subscriber bounded mailboxes served by a worker thread pool, used
+by EventBus in `DispatchMode.ASYNC` so slow handlers do not add latency to the
+emitter's path.
+
+Phase 4: Pure delivery - no interpretation or semantic processing.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+from ..state.models.event_envelope import EventEnvelope
+
+
+class DispatchMode(str, Enum):
+    """How EventBus delivers events to handlers."""
+
+    SYNC = "sync"  # Handlers run on the emitter's thread
+    ASYNC = "async"  # Handlers run on a worker pool via per-subscriber mailboxes
+
+
+class OverflowPolicy(str, Enum):
+    """What to do when a subscriber's mailbox is full."""
+
+    BLOCK = "block"  # Emitter waits for space
+    DROP_OLDEST = "drop_oldest"  # Oldest pending event is discarded
+    COALESCE = "coalesce"  # Pending event of the same type is replaced, else drop oldest
+
+
+class _Mailbox:
+    """Bounded FIFO of pending events for one subscription.
+
+    Events are held in single-element cells so a pending event can be replaced
+    in place when coalescing by type.
+    """
+
+    def __init__(
+        self,
+        subscription_id: str,
+        handler: Callable[[EventEnvelope], None],
+        maxsize: int,
+        policy: OverflowPolicy,
+    ) -> None:
+        self.subscription_id = subscription_id
+        self.handler = handler
+        self.maxsize = maxsize
+        self.policy = policy
+        self.closed = False
+        self.scheduled = False
+        self.dropped = 0
+        self.coalesced = 0
+        self._items: Deque[List[EventEnvelope]] = deque()
+        self._latest_by_type: Dict[str, List[EventEnvelope]] = {}
+        self._cond = threading.Condition()
+
+    def _pop_locked(self) -> EventEnvelope:
+        cell = self._items.popleft()
+        event = cell[0]
+        if self._latest_by_type.get(event.type) is cell:
+            del self._latest_by_type[event.type]
+        return event
+
+    def offer(self, event: EventEnvelope, may_block: bool) -> Tuple[int, bool]:
+        """Add an event, applying the overflow policy if the mailbox is full.
+
+        Args:
+            event: The event to deliver.
+            may_block: Whether the BLOCK policy may wait for space.
+
+        Returns:
+            Tuple of (events released without delivery, whether the mailbox
+            must be scheduled on the worker pool).
+        """
+        with self._cond:
+            if self.closed:
+                return 1, False
+            released = 0
+            if len(self._items) >= self.maxsize:
+                if self.policy is OverflowPolicy.BLOCK:
+                    if may_block:
+                        while len(self._items) >= self.maxsize and not self.closed:
+                            self._cond.wait()
+                        if self.closed:
+                            return 1, False
+                    # Emits from worker threads exceed the bound rather than
+                    # risk every worker waiting on a full mailbox
+                else:
+                    if self.policy is OverflowPolicy.COALESCE:
+                        cell = self._latest_by_type.get(event.type)
+                        if cell is not None:
+                            cell[0] = event
+                            self.coalesced += 1
+                            return 1, False
+                    self._pop_locked()
+                    self.dropped += 1
+                    released = 1
+
+            cell = [event]
+            self._items.append(cell)
+            self._latest_by_type[event.type] = cell
+            schedule = not self.scheduled
+            self.scheduled = True
+            return released, schedule
+
+    def take(self) -> Optional[EventEnvelope]:
+        """Remove the next pending event, or unschedule if there is none."""
+        with self._cond:
+            if not self._items:
+                self.scheduled = False
+                return None
+            event = self._pop_locked()
+            self._cond.notify_all()
+            return event
+
+    def finish(self) -> bool:
+        """Return True if the mailbox should be rescheduled after a delivery."""
+        with self._cond:
+            if self._items and not self.closed:
+                return True
+            self.scheduled = False
+            return False
+
+    def close(self) -> int:
+        """Close the mailbox and discard pending events.
+
+        Returns:
+            The number of discarded events.
+        """
+        with self._cond:
+            self.closed = True
+            discarded = len(self._items)
+            self._items.clear()
+            self._latest_by_type.clear()
+            self._cond.notify_all()
+            return discarded
+
+    def size(self) -> int:
+        with self._cond:
+            return len(self._items)
+
+
+class AsyncDispatcher:
+    """Delivers events to per-subscriber mailboxes served by a worker pool.
+
+    Each subscriber is served by at most one worker at a time, so a
+    subscriber sees its events in emission order. Workers take one event per
+    turn and requeue the mailbox, so a slow subscriber does not starve others.
+    Worker threads are daemons started on first dispatch; after `shutdown()`
+    the dispatcher rejects new events.
+    """
+
+    def __init__(
+        self,
+        workers: int = 4,
+        queue_size: int = 1024,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+    ) -> None:
+        """Initialize the dispatcher.
+
+        Args:
+            workers: Number of worker threads.
+            queue_size: Maximum pending events per subscriber.
+            overflow_policy: Policy applied when a mailbox is full.
+
+        Raises:
+            ValueError: If workers or queue_size is not positive.
+        """
+        if workers <= 0:
+            raise ValueError(f"workers must be positive, got: {workers}")
+        if queue_size <= 0:
+            raise ValueError(f"queue_size must be positive, got: {queue_size}")
+        self._workers = workers
+        self._queue_size = queue_size
+        self._overflow_policy = OverflowPolicy(overflow_policy)
+        self._mailboxes: Dict[str, _Mailbox] = {}
+        self._ready: "queue.SimpleQueue[Optional[_Mailbox]]" = queue.SimpleQueue()
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._idle = threading.Condition()
+        self._pending = 0
+        self._stopped = False
+        self._local = threading.local()
+
+    def add_subscriber(
+        self, subscription_id: str, handler: Callable[[EventEnvelope], None]
+    ) -> None:
+        """Create a mailbox for a subscription."""
+        with self._lock:
+            self._mailboxes[subscription_id] = _Mailbox(
+                subscription_id, handler, self._queue_size, self._overflow_policy
+            )
+
+    def remove_subscriber(self, subscription_id: str) -> None:
+        """Close a subscription's mailbox, discarding pending events."""
+        with self._lock:
+            mailbox = self._mailboxes.pop(subscription_id, None)
+        if mailbox is not None:
+            self._release(mailbox.close())
+
+    def dispatch(self, event: EventEnvelope, subscription_ids: Iterable[str]) -> None:
+        """Queue an event for each listed subscription.
+
+        Args:
+            event: The event to deliver.
+            subscription_ids: Subscriptions whose patterns matched the event.
+
+        Raises:
+            RuntimeError: If the dispatcher has been shut down.
+        """
+        self._ensure_started()
+        may_block = not getattr(self._local, "is_worker", False)
+        with self._lock:
+            mailboxes = [
+                self._mailboxes[sid] for sid in subscription_ids if sid in self._mailboxes
+            ]
+        for mailbox in mailboxes:
+            # Count before offering so a fast worker cannot drive pending below zero
+            self._acquire(1)
+            released, schedule = mailbox.offer(event, may_block)
+            if released:
+                self._release(released)
+            if schedule:
+                self._ready.put(mailbox)
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Block until every queued event has been delivered.
+
+        Returns early once the dispatcher is shut down, since events still
+        pending then are never delivered.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely).
+
+        Returns:
+            True if the dispatcher became idle, False on timeout or if it was
+            shut down with events undelivered.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._idle:
+            while self._pending > 0:
+                if self._stopped:
+                    return False
+                if deadline is None:
+                    self._idle.wait()
+                    continue
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._idle.wait(remaining)
+            return True
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """Return pending, dropped and coalesced counts per subscription."""
+        with self._lock:
+            mailboxes = list(self._mailboxes.values())
+        return {
+            mailbox.subscription_id: {
+                "pending": mailbox.size(),
+                "dropped": mailbox.dropped,
+                "coalesced": mailbox.coalesced,
+            }
+            for mailbox in mailboxes
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker pool and close every mailbox.
+
+        Pending events are discarded, and emitters blocked on a full mailbox
+        wake up and return.
+
+        Args:
+            wait: Whether to join worker threads before returning.
+        """
+        with self._lock:
+            self._stopped = True
+            threads = self._threads
+            self._threads = []
+            mailboxes = list(self._mailboxes.values())
+            self._mailboxes.clear()
+        for mailbox in mailboxes:
+            self._release(mailbox.close())
+        with self._idle:
+            self._idle.notify_all()
+        for _ in threads:
+            self._ready.put(None)
+        if wait:
+            for thread in threads:
+                thread.join()
+
+    def _ensure_started(self) -> None:
+        if self._threads:
+            return
+        with self._lock:
+            if self._stopped:
+                raise RuntimeError("AsyncDispatcher has been shut down")
+            if self._threads:
+                return
+            for i in range(self._workers):
+                thread = threading.Thread(
+                    target=self._worker_loop, name=f"eventbus-worker-{i}", daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def _acquire(self, count: int) -> None:
+        with self._idle:
+            self._pending += count
+
+    def _release(self, count: int) -> None:
+        if count <= 0:
+            return
+        with self._idle:
+            self._pending -= count
+            if self._pending <= 0:
+                self._idle.notify_all()
+
+    def _worker_loop(self) -> None:
+        self._local.is_worker = True
+        while True:
+            mailbox = self._ready.get()
+            if mailbox is None:
+                return
+            event = mailbox.take()
+            if event is None:
+                continue
+            try:
+                mailbox.handler(event)
+            except Exception:
+                # Phase 4: Basic error handling - log and continue
+                pass
+            finally:
+                self._release(1)
+            if mailbox.finish():
+                self._ready.put(mailbox)
@@ -8,9 +8,11 @@ Phase 4: Structural validation only - no semantic validation or interpretation.
 
 from __future__ import annotations
 
+import itertools
+import secrets
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional, Protocol
+from typing import Any, Dict, Iterable, List, Optional, Protocol, Tuple
 
 from typing_extensions import Literal
 
@@ -32,6 +34,43 @@ class EventEmitter(Protocol):
         ...
 
 
+def _utc_timestamp() -> str:
+    """Return the current time as ISO 8601 UTC (format: YYYY-MM-DDTHH:mm:ss.sssZ)."""
+    # Remove timezone offset before appending Z
+    return datetime.now(timezone.utc).replace(tzinfo=None).isoformat(timespec="milliseconds") + "Z"
+
+
+class EventIdGenerator:
+    """Fast generator of UUIDv4-format event IDs.
+
+    Combines a random 64-bit per-generator prefix with a counter that starts
+    at a random offset and increments per ID, so no syscall or RNG call is
+    needed per ID. The version nibble is forced to 4 and the variant bits to
+    RFC 4122, so IDs parse as UUIDv4 strings.
+
+    IDs are unique per generator; the random prefix keeps collisions between
+    generators (and processes) as unlikely as for random 64-bit values.
+    Thread-safe: `itertools.count` increments atomically under the GIL.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with a fresh random prefix and counter offset."""
+        prefix = f"{secrets.randbits(64):016x}"
+        # Force version nibble (hex digit 12) to 4
+        self._head = f"{prefix[:8]}-{prefix[8:12]}-4{prefix[13:16]}-"
+        self._counter = itertools.count(secrets.randbits(48))
+
+    def next_id(self) -> str:
+        """Return the next event ID.
+
+        Returns:
+            A UUIDv4-format string.
+        """
+        n = next(self._counter) & 0x3FFF_FFFF_FFFF_FFFF
+        tail = f"{n | 0x8000_0000_0000_0000:016x}"
+        return f"{self._head}{tail[:4]}-{tail[4:]}"
+
+
 class EventFactory:
     """Factory for creating properly structured EventEnvelope instances.
 
@@ -41,9 +80,15 @@ class EventFactory:
     - Required field validation
     - Structural validation (format checks only)
 
+    Use `create_many` to build batches with shared validation, a fast ID
+    generator and optional shared timestamps.
+
     Phase 4: No semantic validation or interpretation.
     """
 
+    _VALID_SOURCE_KINDS = frozenset({"home", "secondary", "transient", "clone"})
+    _id_generator: Optional[EventIdGenerator] = None
+
     @staticmethod
     def create(
         source_instance_id: str,
@@ -73,8 +118,7 @@ class EventFactory:
         event_id = str(uuid.uuid4())
 
         # Generate ISO 8601 UTC timestamp (format: YYYY-MM-DDTHH:mm:ss.sssZ)
-        # Remove timezone offset before appending Z
-        ts_utc = datetime.now(timezone.utc).replace(tzinfo=None).isoformat(timespec="milliseconds") + "Z"
+        ts_utc = _utc_timestamp()
 
         # Validate event_type format (must be namespaced: domain.action)
         if "." not in event_type:
@@ -83,11 +127,7 @@ class EventFactory:
             )
 
         # Validate source_kind
-        valid_kinds = {"home", "secondary", "transient", "clone"}
-        if source_kind not in valid_kinds:
-            raise ValueError(
-                f"source_kind must be one of {valid_kinds}, got: {source_kind}"
-            )
+        EventFactory._validate_source_kind(source_kind)
 
         # Create and return envelope
         return EventEnvelope(
@@ -101,8 +141,80 @@ class EventFactory:
             meta=meta,
         )
 
+    @staticmethod
+    def _validate_source_kind(source_kind: str) -> None:
+        """Raise ValueError if source_kind is not a known instance kind."""
+        if source_kind not in EventFactory._VALID_SOURCE_KINDS:
+            raise ValueError(
+                f"source_kind must be one of {set(EventFactory._VALID_SOURCE_KINDS)}, "
+                f"got: {source_kind}"
+            )
 
+    @classmethod
+    def _get_id_generator(cls) -> EventIdGenerator:
+        """Return the shared EventIdGenerator, creating it on first use."""
+        if cls._id_generator is None:
+            cls._id_generator = EventIdGenerator()
+        return cls._id_generator
 
+    @staticmethod
+    def create_many(
+        source_instance_id: str,
+        source_kind: Literal["home", "secondary", "transient", "clone"],
+        events: Iterable[Tuple[str, Dict[str, Any]]],
+        meta: Optional[Dict[str, Any]] = None,
+        shared_timestamp: bool = False,
+        validate: bool = True,
+    ) -> List[EventEnvelope]:
+        """Create a batch of EventEnvelopes from one source in a single call.
 
+        Source fields are validated once per batch and each distinct event
+        type once. Event IDs come from the fast `EventIdGenerator`.
 
+        Args:
+            source_instance_id: Identifier of the instance emitting the events.
+            source_kind: Type of instance (home, secondary, transient, clone).
+            events: (event_type, payload) pairs.
+            meta: Optional metadata dictionary applied to every event.
+            shared_timestamp: Stamp every event with one timestamp taken at
+                the start of the batch.
+            validate: Build envelopes with full pydantic validation. Pass
+                False to use `construct` when inputs are already trusted.
+
+        Returns:
+            The created envelopes, in input order (seq is 0 for all).
 
+        Raises:
+            ValueError: If source_kind or any event type is invalid.
+        """
+        EventFactory._validate_source_kind(source_kind)
+        next_id = EventFactory._get_id_generator().next_id
+        if validate:
+            build = EventEnvelope
+        else:
+            # Support both Pydantic v1 and v2
+            build = getattr(EventEnvelope, "model_construct", None) or EventEnvelope.construct
+        ts_utc = _utc_timestamp() if shared_timestamp else None
+        checked_types: set = set()
+
+        envelopes: List[EventEnvelope] = []
+        for event_type, payload in events:
+            if event_type not in checked_types:
+                if "." not in event_type:
+                    raise ValueError(
+                        f"Event type must be namespaced (domain.action), got: {event_type}"
+                    )
+                checked_types.add(event_type)
+            envelopes.append(
+                build(
+                    event_id=next_id(),
+                    seq=0,
+                    ts_utc=ts_utc or _utc_timestamp(),
+                    source_instance_id=source_instance_id,
+                    source_kind=source_kind,
+                    type=event_type,
+                    payload=payload,
+                    meta=meta,
+                )
+            )
+        return envelopes
@@ -1,14 +1,20 @@
 """Event queue infrastructure for Phase 4.
 
-Provides in-memory FIFO queue for event buffering and ordering.
+Provides in-memory FIFO queues for event buffering and ordering:
+- EventQueue: sorted-list queue (re-sorts on every enqueue)
+- HeapEventQueue: binary-heap queue with O(log n) enqueue/dequeue, bulk
+  operations and blocking `get(timeout)`
 
 Phase 4: In-memory only - no persistence.
 """
 
 from __future__ import annotations
 
+import heapq
+import itertools
 import threading
-from typing import List, Optional
+import time
+from typing import Iterable, List, Optional, Tuple
 
 from ..state.models.event_envelope import EventEnvelope
 
@@ -87,7 +93,151 @@ class EventQueue:
             self._events.clear()
 
 
+# Heap entry layout: (seq_key, ts_utc, insertion_counter, event).
+# The insertion counter keeps ordering stable for equal keys (matching the
+# stable sort used by EventQueue) and prevents EventEnvelope comparisons.
+_HeapEntry = Tuple[float, str, int, EventEnvelope]
 
 
+class HeapEventQueue:
+    """Heap-backed FIFO queue for EventEnvelope instances.
 
+    Same ordering as EventQueue: events with `seq > 0` first by `seq`, then
+    events with `seq == 0` by `ts_utc`. Ties keep insertion order.
 
+    Enqueue and dequeue are O(log n). A condition variable backs the blocking
+    `get(timeout)` call so consumers can wait for events without polling.
+
+    Phase 4: No persistence - all events are in-memory only.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty heap event queue."""
+        self._heap: List[_HeapEntry] = []
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+
+    def _entry(self, event: EventEnvelope) -> _HeapEntry:
+        """Build the heap entry for an event (caller must hold the lock)."""
+        seq_key = event.seq if event.seq > 0 else float("inf")
+        return (seq_key, event.ts_utc, next(self._counter), event)
+
+    def enqueue(self, event: EventEnvelope) -> None:
+        """Add an event to the queue.
+
+        Args:
+            event: The event envelope to add to the queue.
+        """
+        with self._not_empty:
+            heapq.heappush(self._heap, self._entry(event))
+            self._not_empty.notify()
+
+    def enqueue_many(self, events: Iterable[EventEnvelope]) -> int:
+        """Add a batch of events to the queue under a single lock acquisition.
+
+        Large batches are appended and re-heapified in O(n) rather than
+        pushed one at a time.
+
+        Args:
+            events: The event envelopes to add.
+
+        Returns:
+            The number of events added.
+        """
+        with self._not_empty:
+            entries = [self._entry(event) for event in events]
+            if not entries:
+                return 0
+            if len(entries) > len(self._heap):
+                self._heap.extend(entries)
+                heapq.heapify(self._heap)
+            else:
+                for entry in entries:
+                    heapq.heappush(self._heap, entry)
+            self._not_empty.notify_all()
+            return len(entries)
+
+    def dequeue(self) -> Optional[EventEnvelope]:
+        """Remove and return the first event from the queue.
+
+        Returns:
+            The first event in the queue, or None if the queue is empty.
+        """
+        with self._lock:
+            if not self._heap:
+                return None
+            return heapq.heappop(self._heap)[3]
+
+    def get(self, timeout: Optional[float] = None) -> Optional[EventEnvelope]:
+        """Remove and return the first event, blocking until one is available.
+
+        Args:
+            timeout: Maximum seconds to wait. None waits indefinitely;
+                0 behaves like `dequeue()`.
+
+        Returns:
+            The first event in the queue, or None if the timeout expired.
+        """
+        with self._not_empty:
+            if timeout is None:
+                while not self._heap:
+                    self._not_empty.wait()
+            else:
+                deadline = time.monotonic() + timeout
+                while not self._heap:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return None
+                    self._not_empty.wait(remaining)
+            return heapq.heappop(self._heap)[3]
+
+    def drain(self, max_events: Optional[int] = None) -> List[EventEnvelope]:
+        """Remove and return up to `max_events` events in queue order.
+
+        Args:
+            max_events: Maximum number of events to return (None for all).
+
+        Returns:
+            List of events in order (may be empty).
+        """
+        with self._lock:
+            if max_events is None or max_events >= len(self._heap):
+                entries = sorted(self._heap)
+                self._heap.clear()
+                return [entry[3] for entry in entries]
+            heappop = heapq.heappop
+            return [heappop(self._heap)[3] for _ in range(max(max_events, 0))]
+
+    def peek(self) -> Optional[EventEnvelope]:
+        """Return the first event without removing it.
+
+        Returns:
+            The first event in the queue, or None if the queue is empty.
+        """
+        with self._lock:
+            if not self._heap:
+                return None
+            return self._heap[0][3]
+
+    def size(self) -> int:
+        """Return the number of events in the queue.
+
+        Returns:
+            The number of events currently in the queue.
+        """
+        with self._lock:
+            return len(self._heap)
+
+    def is_empty(self) -> bool:
+        """Check if the queue is empty.
+
+        Returns:
+            True if the queue is empty, False otherwise.
+        """
+        return self.size() == 0
+
+    def clear(self) -> None:
+        """Remove all events from the queue."""
+        with self._lock:
+            self._heap.clear()
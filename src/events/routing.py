@@ -7,11 +7,128 @@ Phase 4: Pure routing - no interpretation or semantic processing.
 
 from __future__ import annotations
 
+import itertools
 import threading
+import time
 import uuid
-from typing import Callable, Dict, List
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
 
 from ..state.models.event_envelope import EventEnvelope
+from .dispatch import AsyncDispatcher, DispatchMode, OverflowPolicy
+
+# Resolved route entry: (subscription_id, handler)
+_Route = Tuple[str, Callable[[EventEnvelope], None]]
+
+# Handler timing observer: (subscription_id, handler, elapsed_seconds)
+HandlerObserver = Callable[[str, Callable[[EventEnvelope], None], float], None]
+
+
+@dataclass
+class CascadeStats:
+    """Statistics for one root event and the cascade it triggered."""
+
+    root_event_id: str
+    root_type: str
+    events: int = 0  # Events delivered, including the root
+    handlers: int = 0  # Handler invocations
+    max_depth: int = 0  # Deepest cascade level reached (root = 0)
+    dropped_depth: int = 0  # Events dropped for exceeding max_cascade_depth
+    dropped_budget: int = 0  # Events dropped for exceeding max_cascade_events
+    wall_time_ms: float = 0.0
+
+
+class _CascadeState:
+    """Per-thread state of the cascade currently being drained."""
+
+    def __init__(self, stats: CascadeStats) -> None:
+        self.stats = stats
+        self.pending: Deque[Tuple[EventEnvelope, int]] = deque()
+        self.depth = 0
+
+
+class _PatternIndex:
+    """Compiled index of subscription patterns.
+
+    Mirrors `EventBus._match_pattern` semantics:
+    - every pattern matches an identical event type (exact hash map)
+    - `domain.*` patterns live in a segment trie keyed by their prefix
+    - `*.action` patterns live in a hash map keyed by their suffix
+    - `*` patterns live in a wildcard set
+
+    Not thread-safe on its own; EventBus guards it with its lock.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty pattern index."""
+        self._exact: Set[str] = set()
+        # Trie nodes map segment -> child node; the None key holds the pattern
+        self._prefix_root: Dict[Optional[str], Any] = {}
+        self._suffix: Set[str] = set()
+        self._wildcard: Set[str] = set()
+
+    def add(self, pattern: str) -> None:
+        """Index a pattern."""
+        self._exact.add(pattern)
+        if pattern.endswith(".*"):
+            node = self._prefix_root
+            for segment in pattern[:-2].split("."):
+                node = node.setdefault(segment, {})
+            node[None] = pattern
+        elif pattern.startswith("*."):
+            self._suffix.add(pattern)
+        elif pattern == "*":
+            self._wildcard.add(pattern)
+
+    def remove(self, pattern: str) -> None:
+        """Remove a pattern from the index."""
+        self._exact.discard(pattern)
+        if pattern.endswith(".*"):
+            path = [self._prefix_root]
+            segments = pattern[:-2].split(".")
+            for segment in segments:
+                child = path[-1].get(segment)
+                if child is None:
+                    return
+                path.append(child)
+            path[-1].pop(None, None)
+            # Prune empty trie nodes bottom-up
+            for depth in range(len(segments), 0, -1):
+                if path[depth]:
+                    break
+                path[depth - 1].pop(segments[depth - 1], None)
+        elif pattern.startswith("*."):
+            self._suffix.discard(pattern)
+        elif pattern == "*":
+            self._wildcard.discard(pattern)
+
+    def match(self, event_type: str) -> Set[str]:
+        """Return all indexed patterns that match an event type."""
+        matched: Set[str] = set(self._wildcard)
+        if event_type in self._exact:
+            matched.add(event_type)
+
+        segments = event_type.split(".")
+
+        # Prefix trie: `p.*` matches when p's segments are a proper prefix
+        node = self._prefix_root
+        for segment in segments[:-1]:
+            node = node.get(segment)  # type: ignore[assignment]
+            if node is None:
+                break
+            terminal = node.get(None)
+            if terminal is not None:
+                matched.add(terminal)
+
+        # Suffix map: `*.s` matches when s's segments are a proper suffix
+        if self._suffix:
+            for i in range(1, len(segments)):
+                candidate = "*." + ".".join(segments[i:])
+                if candidate in self._suffix:
+                    matched.add(candidate)
+
+        return matched
 
 
 class EventBus:
@@ -22,13 +139,65 @@ class EventBus:
     - Prefix match: `interaction.*` matches all `interaction.*` event types
     - Suffix match: `*.message_received` matches all `*.message_received` event types
 
+    Patterns are compiled into a `_PatternIndex` and the resolved handler list
+    is cached per event type, so a steady-state emit is a single dict lookup.
+    The cache is invalidated on subscribe/unsubscribe.
+
+    Dispatch modes:
+    - `DispatchMode.SYNC` (default): handlers run on the emitter's thread
+    - `DispatchMode.ASYNC`: each subscription gets a bounded mailbox served by
+      a worker pool (see `AsyncDispatcher`); `emit` returns once the event is
+      queued, and `wait_idle()` waits for delivery to finish
+
+    Cascade mode (SYNC only): events emitted from inside a handler are queued
+    and drained breadth-first by the outermost `emit` instead of recursing on
+    the Python stack. Each root event gets a depth limit and a fan-out budget,
+    and its statistics are kept in `get_cascade_stats()`.
+
     Phase 4: Simple string pattern matching - no regex, no semantic interpretation.
     """
 
-    def __init__(self) -> None:
-        """Initialize an empty event bus."""
+    def __init__(
+        self,
+        dispatch_mode: DispatchMode = DispatchMode.SYNC,
+        workers: int = 4,
+        queue_size: int = 1024,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        cascade: bool = False,
+        max_cascade_depth: int = 16,
+        max_cascade_events: int = 1000,
+        cascade_stats_size: int = 100,
+    ) -> None:
+        """Initialize an empty event bus.
+
+        Args:
+            dispatch_mode: SYNC (default) or ASYNC delivery.
+            workers: Worker threads for ASYNC mode.
+            queue_size: Maximum pending events per subscriber in ASYNC mode.
+            overflow_policy: Policy applied when a subscriber's mailbox is
+                full in ASYNC mode (block, drop_oldest or coalesce).
+            cascade: Enable breadth-first cascade draining in SYNC mode.
+            max_cascade_depth: Deepest cascade level delivered (root = 0).
+            max_cascade_events: Maximum events delivered per root, including
+                the root itself.
+            cascade_stats_size: Number of recent root cascades to keep stats for.
+        """
         self._subscriptions: Dict[str, Dict[str, Callable[[EventEnvelope], None]]] = {}
+        self._subscription_patterns: Dict[str, str] = {}
+        self._pattern_order: Dict[str, int] = {}
+        self._pattern_counter = itertools.count()
+        self._index = _PatternIndex()
+        self._route_cache: Dict[str, List[_Route]] = {}
         self._lock = threading.Lock()
+        self._dispatcher: Optional[AsyncDispatcher] = None
+        if DispatchMode(dispatch_mode) is DispatchMode.ASYNC:
+            self._dispatcher = AsyncDispatcher(workers, queue_size, overflow_policy)
+        self._cascade = cascade
+        self._max_cascade_depth = max_cascade_depth
+        self._max_cascade_events = max_cascade_events
+        self._cascade_stats: Deque[CascadeStats] = deque(maxlen=cascade_stats_size)
+        self._local = threading.local()
+        self._handler_observer: Optional[HandlerObserver] = None
 
     def _match_pattern(self, pattern: str, event_type: str) -> bool:
         """Check if an event type matches a pattern.
@@ -77,7 +246,13 @@ class EventBus:
         with self._lock:
             if pattern not in self._subscriptions:
                 self._subscriptions[pattern] = {}
+                self._pattern_order[pattern] = next(self._pattern_counter)
+                self._index.add(pattern)
             self._subscriptions[pattern][subscription_id] = handler
+            self._subscription_patterns[subscription_id] = pattern
+            if self._dispatcher is not None:
+                self._dispatcher.add_subscriber(subscription_id, handler)
+            self._route_cache.clear()
 
         return subscription_id
 
@@ -88,40 +263,167 @@ class EventBus:
             subscription_id: The subscription ID returned by subscribe().
         """
         with self._lock:
-            for pattern_subscriptions in self._subscriptions.values():
-                pattern_subscriptions.pop(subscription_id, None)
+            pattern = self._subscription_patterns.pop(subscription_id, None)
+            if pattern is None:
+                return
+            pattern_subscriptions = self._subscriptions.get(pattern, {})
+            pattern_subscriptions.pop(subscription_id, None)
 
             # Clean up empty patterns
-            empty_patterns = [
-                pattern
-                for pattern, subs in self._subscriptions.items()
-                if not subs
-            ]
-            for pattern in empty_patterns:
+            if not pattern_subscriptions:
                 self._subscriptions.pop(pattern, None)
+                self._pattern_order.pop(pattern, None)
+                self._index.remove(pattern)
+            self._route_cache.clear()
+
+        if self._dispatcher is not None:
+            self._dispatcher.remove_subscriber(subscription_id)
+
+    def _resolve_routes(self, event_type: str) -> List[_Route]:
+        """Resolve (and cache) the handler list for an event type.
+
+        Handlers are ordered by pattern registration order, then by
+        subscription order within a pattern. Caller must hold the lock.
+
+        Args:
+            event_type: The event type to resolve.
+
+        Returns:
+            The list of matching (subscription_id, handler) routes.
+        """
+        routes = self._route_cache.get(event_type)
+        if routes is None:
+            patterns = sorted(
+                self._index.match(event_type), key=self._pattern_order.__getitem__
+            )
+            routes = [
+                route
+                for pattern in patterns
+                for route in self._subscriptions[pattern].items()
+            ]
+            self._route_cache[event_type] = routes
+        return routes
 
     def emit(self, event: EventEnvelope) -> None:
         """Emit an event to all matching subscribers.
 
         Routes the event to all handlers whose patterns match the event type.
+        In ASYNC mode the event is queued to each subscriber's mailbox.
 
         Args:
             event: The event envelope to emit.
+
+        Raises:
+            RuntimeError: In ASYNC mode, if the bus has been shut down.
         """
-        matching_handlers: List[Callable[[EventEnvelope], None]] = []
+        if self._dispatcher is not None:
+            with self._lock:
+                routes = self._resolve_routes(event.type)
+            self._dispatcher.dispatch(event, [sid for sid, _ in routes])
+            return
+
+        if not self._cascade:
+            self._deliver(event)
+            return
 
+        state: Optional[_CascadeState] = getattr(self._local, "cascade", None)
+        if state is not None:
+            # Emitted from inside a handler: queue one level below the current event
+            state.pending.append((event, state.depth + 1))
+            return
+
+        self._run_cascade(event)
+
+    def _deliver(self, event: EventEnvelope) -> int:
+        """Call every matching handler synchronously.
+
+        Args:
+            event: The event envelope to deliver.
+
+        Returns:
+            The number of handlers called.
+        """
         with self._lock:
-            for pattern, handlers in self._subscriptions.items():
-                if self._match_pattern(pattern, event.type):
-                    matching_handlers.extend(handlers.values())
+            routes = self._resolve_routes(event.type)
+
+        observer = self._handler_observer
+        if observer is not None:
+            return self._deliver_observed(event, routes, observer)
 
         # Call handlers outside the lock to avoid deadlocks
-        for handler in matching_handlers:
+        for _, handler in routes:
+            try:
+                handler(event)
+            except Exception:
+                # Phase 4: Basic error handling - log and continue
+                pass
+        return len(routes)
+
+    def _deliver_observed(
+        self, event: EventEnvelope, routes: List[_Route], observer: HandlerObserver
+    ) -> int:
+        """Like `_deliver`, but reports each handler's wall time to the observer."""
+        perf_counter = time.perf_counter
+        for subscription_id, handler in routes:
+            start = perf_counter()
             try:
                 handler(event)
             except Exception:
                 # Phase 4: Basic error handling - log and continue
                 pass
+            observer(subscription_id, handler, perf_counter() - start)
+        return len(routes)
+
+    def set_handler_observer(self, observer: Optional[HandlerObserver]) -> None:
+        """Install (or clear, with None) a handler timing observer.
+
+        The observer is called after every synchronous handler invocation with
+        (subscription_id, handler, elapsed_seconds). Used by replay and load
+        tooling; ASYNC deliveries are not observed.
+
+        Args:
+            observer: Timing callback, or None to disable timing.
+        """
+        self._handler_observer = observer
+
+    def _run_cascade(self, root: EventEnvelope) -> None:
+        """Deliver a root event and drain its cascade breadth-first.
+
+        Args:
+            root: The root event emitted from outside any handler.
+        """
+        stats = CascadeStats(root_event_id=root.event_id, root_type=root.type)
+        state = _CascadeState(stats)
+        state.pending.append((root, 0))
+        self._local.cascade = state
+        start = time.perf_counter()
+        try:
+            while state.pending:
+                event, depth = state.pending.popleft()
+                if depth > self._max_cascade_depth:
+                    stats.dropped_depth += 1
+                    continue
+                if stats.events >= self._max_cascade_events:
+                    stats.dropped_budget += 1
+                    continue
+                state.depth = depth
+                stats.events += 1
+                stats.max_depth = max(stats.max_depth, depth)
+                stats.handlers += self._deliver(event)
+        finally:
+            self._local.cascade = None
+            stats.wall_time_ms = (time.perf_counter() - start) * 1000.0
+            with self._lock:
+                self._cascade_stats.append(stats)
+
+    def get_cascade_stats(self) -> List[CascadeStats]:
+        """Get statistics for the most recent root cascades (oldest first).
+
+        Returns:
+            List of CascadeStats; empty unless cascade mode is enabled.
+        """
+        with self._lock:
+            return list(self._cascade_stats)
 
     def get_subscription_count(self) -> int:
         """Get the total number of active subscriptions.
@@ -132,8 +434,38 @@ class EventBus:
         with self._lock:
             return sum(len(handlers) for handlers in self._subscriptions.values())
 
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all queued events have been delivered.
+
+        SYNC mode is always idle once `emit` returns.
 
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely).
 
+        Returns:
+            True if the bus is idle, False on timeout or if it was shut
+            down with events undelivered.
+        """
+        if self._dispatcher is None:
+            return True
+        return self._dispatcher.wait_idle(timeout)
 
+    def get_dispatch_stats(self) -> Dict[str, Dict[str, int]]:
+        """Get per-subscription mailbox statistics (ASYNC mode only).
 
+        Returns:
+            Mapping of subscription ID to pending/dropped/coalesced counts;
+            empty in SYNC mode.
+        """
+        if self._dispatcher is None:
+            return {}
+        return self._dispatcher.get_stats()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop ASYNC worker threads (no-op in SYNC mode).
 
+        Args:
+            wait: Whether to join worker threads before returning.
+        """
+        if self._dispatcher is not None:
+            self._dispatcher.shutdown(wait)
@@ -2,19 +2,27 @@
 
 Provides trigger types and scheduler for time-based event emission.
 
+Two schedulers are provided:
+- Scheduler: evaluates every trigger on each `tick()` (poll-driven)
+- DeadlineScheduler: keeps each trigger's next deadline in a min-heap and
+  sleeps until the earliest one (deadline-driven)
+
 Phase 4: Scheduling primitives - triggers fire callbacks which handle event emission.
 """
 
 from __future__ import annotations
 
+import heapq
+import itertools
+import math
 import threading
 import time
 import uuid
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from datetime import datetime, time as dt_time, timezone
+from datetime import datetime, time as dt_time, timedelta, timezone
 from enum import Enum
-from typing import Callable, Dict, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 from typing_extensions import Literal
 
@@ -34,7 +42,8 @@ class Trigger(ABC):
     Phase 4: Infrastructure only - no behavior beyond timing.
     """
 
-    trigger_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    # Keyword-only so subclasses can declare required fields positionally
+    trigger_id: str = field(default_factory=lambda: str(uuid.uuid4()), kw_only=True)
     trigger_type: TriggerType = field(init=False)
 
     @abstractmethod
@@ -49,6 +58,19 @@ class Trigger(ABC):
         """
         pass
 
+    @abstractmethod
+    def next_fire_time(self, now: datetime) -> Optional[datetime]:
+        """Compute the next time the trigger is due, given its current state.
+
+        Args:
+            now: The current UTC datetime.
+
+        Returns:
+            The next UTC deadline (may equal `now` if already due), or None
+            if the trigger will never fire again.
+        """
+        pass
+
     @abstractmethod
     def mark_fired(self, now: datetime) -> None:
         """Mark that the trigger has fired at the given time.
@@ -102,6 +124,23 @@ class IntervalTrigger(Trigger):
         elapsed = (now - self.last_fired).total_seconds()
         return elapsed >= self.interval_seconds
 
+    def next_fire_time(self, now: datetime) -> Optional[datetime]:
+        """Return the next tick on the last_fired + k * interval grid.
+
+        Whole periods already in the past are skipped, keeping the cadence.
+
+        Args:
+            now: The current UTC datetime.
+
+        Returns:
+            The next UTC deadline (`now` for the first fire).
+        """
+        if self.last_fired is None:
+            return now
+        behind = (now - self.last_fired).total_seconds()
+        periods = max(1, math.ceil(behind / self.interval_seconds))
+        return self.last_fired + timedelta(seconds=periods * self.interval_seconds)
+
     def mark_fired(self, now: datetime) -> None:
         """Record that the trigger fired at the given time.
 
@@ -165,6 +204,31 @@ class TimeOfDayTrigger(Trigger):
             and current_time.second == target_time.second
         )
 
+    def next_fire_time(self, now: datetime) -> Optional[datetime]:
+        """Return the next occurrence of the target time not yet fired.
+
+        A trigger that last fired on an earlier day and has missed today's
+        target time returns today's target, so the missed fire runs once.
+        A trigger that has never fired skips occurrences already in the past,
+        so registering after today's target time schedules tomorrow's.
+
+        Args:
+            now: The current UTC datetime.
+
+        Returns:
+            The next UTC deadline.
+        """
+        day = now.date()
+        target_time = dt_time(self.hour, self.minute, self.second)
+        if self.last_fired_date is not None:
+            if day.isoformat() <= self.last_fired_date:
+                day = datetime.fromisoformat(self.last_fired_date).date() + timedelta(days=1)
+            return datetime.combine(day, target_time, tzinfo=timezone.utc)
+        target = datetime.combine(day, target_time, tzinfo=timezone.utc)
+        if target < now:
+            target += timedelta(days=1)
+        return target
+
     def mark_fired(self, now: datetime) -> None:
         """Record that the trigger fired today.
 
@@ -214,6 +278,19 @@ class OneShotTrigger(Trigger):
         elapsed = (now - self.created_at).total_seconds()
         return elapsed >= self.delay_seconds
 
+    def next_fire_time(self, now: datetime) -> Optional[datetime]:
+        """Return creation time + delay, or None once fired.
+
+        Args:
+            now: The current UTC datetime.
+
+        Returns:
+            The UTC deadline, or None if already fired.
+        """
+        if self.fired:
+            return None
+        return self.created_at + timedelta(seconds=self.delay_seconds)
+
     def mark_fired(self, now: datetime) -> None:
         """Mark that the trigger has fired.
 
@@ -320,7 +397,227 @@ class Scheduler:
             return [t for t in self._triggers.values() if t.is_active()]
 
 
+class DeadlineScheduler:
+    """Deadline-driven scheduler backed by a min-heap.
+
+    Each registered trigger's next deadline (`Trigger.next_fire_time`) is kept
+    in a min-heap, so only due triggers are touched and `run_forever` sleeps
+    exactly until the earliest deadline. Register and cancel are O(log n);
+    cancelled entries are skipped lazily and the heap is compacted when stale
+    entries dominate.
+
+    Catch-up semantics: a deadline that passes while the loop is not running
+    (late wake-up, suspended host, busy callbacks) fires once as soon as the
+    loop runs again; further missed periods are skipped rather than replayed.
+    Triggers are marked fired with their scheduled deadline, so interval
+    triggers keep their cadence and a late time-of-day fire counts for the
+    day it was scheduled.
+
+    Drop-in replacement for Scheduler: `tick()` runs all due triggers.
+
+    Phase 4: Callbacks handle event emission - scheduler only manages timing.
+    """
+
+    def __init__(
+        self,
+        clock: Optional[Callable[[], datetime]] = None,
+        max_sleep_seconds: float = 60.0,
+    ) -> None:
+        """Initialize an empty deadline scheduler.
+
+        Args:
+            clock: Returns the current UTC datetime (default: system clock).
+            max_sleep_seconds: Upper bound on a single sleep, so wall-clock
+                adjustments are noticed.
+        """
+        self._clock = clock or (lambda: datetime.now(timezone.utc))
+        self._max_sleep_seconds = max_sleep_seconds
+        self._triggers: Dict[str, Trigger] = {}
+        self._callbacks: Dict[str, Callable[[], None]] = {}
+        # trigger_id -> (deadline timestamp, heap entry counter) of the live entry
+        self._entries: Dict[str, Tuple[float, int]] = {}
+        self._heap: List[Tuple[float, int, str]] = []
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    def _schedule_locked(self, trigger_id: str, trigger: Trigger, now: datetime) -> bool:
+        """Push the trigger's next deadline onto the heap (caller holds the lock).
+
+        Returns:
+            True if scheduled, False if the trigger is exhausted.
+        """
+        deadline = trigger.next_fire_time(now) if trigger.is_active() else None
+        if deadline is None:
+            self._entries.pop(trigger_id, None)
+            return False
+        entry_ts = deadline.timestamp()
+        counter = next(self._counter)
+        self._entries[trigger_id] = (entry_ts, counter)
+        heapq.heappush(self._heap, (entry_ts, counter, trigger_id))
+        return True
+
+    def _compact_locked(self) -> None:
+        """Rebuild the heap from live entries when stale entries dominate."""
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = [(ts, c, tid) for tid, (ts, c) in self._entries.items()]
+            heapq.heapify(self._heap)
+
+    def register_trigger(
+        self, trigger: Trigger, callback: Callable[[], None]
+    ) -> str:
+        """Register a trigger with a callback.
+
+        Args:
+            trigger: The trigger to register.
+            callback: Function to call when trigger fires (no arguments).
+
+        Returns:
+            The trigger_id for later cancellation.
+        """
+        with self._wakeup:
+            self._triggers[trigger.trigger_id] = trigger
+            self._callbacks[trigger.trigger_id] = callback
+            if not self._schedule_locked(trigger.trigger_id, trigger, self._clock()):
+                self._triggers.pop(trigger.trigger_id, None)
+                self._callbacks.pop(trigger.trigger_id, None)
+            self._wakeup.notify_all()
+            return trigger.trigger_id
+
+    def cancel_trigger(self, trigger_id: str) -> None:
+        """Cancel a registered trigger.
+
+        Args:
+            trigger_id: The ID of the trigger to cancel.
+        """
+        with self._wakeup:
+            self._triggers.pop(trigger_id, None)
+            self._callbacks.pop(trigger_id, None)
+            self._entries.pop(trigger_id, None)
+            self._compact_locked()
+            self._wakeup.notify_all()
+
+    def next_deadline(self) -> Optional[datetime]:
+        """Return the earliest pending deadline, or None if nothing is scheduled."""
+        with self._lock:
+            if not self._has_live_head_locked():
+                return None
+            return datetime.fromtimestamp(self._heap[0][0], timezone.utc)
+
+    def _has_live_head_locked(self) -> bool:
+        """Pop stale entries off the heap head; True if a live entry remains."""
+        while self._heap:
+            entry_ts, counter, trigger_id = self._heap[0]
+            if self._entries.get(trigger_id, (None, None))[1] == counter:
+                return True
+            heapq.heappop(self._heap)
+        return False
+
+    def run_pending(self, now: Optional[datetime] = None) -> int:
+        """Fire every trigger whose deadline is at or before `now`.
+
+        Callbacks are executed outside the lock to avoid deadlocks if they
+        attempt to register or cancel triggers.
+
+        Args:
+            now: The current UTC datetime (default: the scheduler clock).
+
+        Returns:
+            The number of triggers fired.
+        """
+        now = now or self._clock()
+        now_ts = now.timestamp()
+
+        to_fire: List[Tuple[str, Callable[[], None], Trigger, float]] = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now_ts:
+                entry_ts, counter, trigger_id = heapq.heappop(self._heap)
+                if self._entries.get(trigger_id, (None, None))[1] != counter:
+                    continue  # Cancelled or rescheduled
+                del self._entries[trigger_id]
+                to_fire.append(
+                    (trigger_id, self._callbacks[trigger_id], self._triggers[trigger_id], entry_ts)
+                )
+
+        for trigger_id, callback, trigger, entry_ts in to_fire:
+            try:
+                callback()
+            except Exception:
+                # Phase 4: Basic error handling - log and continue
+                pass
+
+        with self._lock:
+            for trigger_id, callback, trigger, entry_ts in to_fire:
+                if self._triggers.get(trigger_id) is not trigger:
+                    continue  # Cancelled or replaced by its callback
+                trigger.mark_fired(datetime.fromtimestamp(entry_ts, timezone.utc))
+                if not self._schedule_locked(trigger_id, trigger, now):
+                    self._triggers.pop(trigger_id, None)
+                    self._callbacks.pop(trigger_id, None)
+
+        return len(to_fire)
+
+    def tick(self) -> None:
+        """Fire all due triggers (Scheduler-compatible entry point)."""
+        self.run_pending()
+
+    def run_forever(self) -> None:
+        """Sleep until the next deadline and fire due triggers until `stop()`.
 
+        Registering or cancelling a trigger wakes the loop so an earlier
+        deadline is honoured.
+        """
+        with self._lock:
+            self._running = True
+        self._loop()
+
+    def _loop(self) -> None:
+        while True:
+            with self._wakeup:
+                if not self._running:
+                    return
+                if not self._has_live_head_locked():
+                    timeout = self._max_sleep_seconds
+                else:
+                    delay = self._heap[0][0] - self._clock().timestamp()
+                    timeout = min(max(delay, 0.0), self._max_sleep_seconds)
+                if timeout > 0:
+                    self._wakeup.wait(timeout)
+                if not self._running:
+                    return
+            self.run_pending()
+
+    def start(self) -> None:
+        """Run `run_forever` on a daemon thread."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._running = True
+            self._thread = threading.Thread(
+                target=self._loop, name="deadline-scheduler", daemon=True
+            )
+        self._thread.start()
 
+    def stop(self, wait: bool = True) -> None:
+        """Stop the `run_forever` loop.
 
+        Args:
+            wait: Whether to join the scheduler thread before returning.
+        """
+        with self._wakeup:
+            self._running = False
+            thread, self._thread = self._thread, None
+            self._wakeup.notify_all()
+        if wait and thread is not None and thread is not threading.current_thread():
+            thread.join()
 
+    def get_active_triggers(self) -> list[Trigger]:
+        """Get list of all active triggers.
+
+        Returns:
+            List of active trigger instances.
+        """
+        with self._lock:
+            return [t for t in self._triggers.values() if t.is_active()]
@@ -0,0 +1,303 @@
+"""Local append-only event store for Phase 4.
+
+Provides SQLiteEventStore, a local stand-in for the NyraHome event log
+(`POST /events/append`, `GET /events/since`) per
+spec/base1.0/nyrahome_cloud_spec.md §3 and §7.
+
+SQLite is single-writer: one writer thread assigns monotonic `seq` values and
+commits queued appends in group transactions.
+"""
+
+from __future__ import annotations
+
+import json
+import queue
+import sqlite3
+import threading
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, List, Optional, Sequence, Tuple, Union
+
+from ..state.models.event_envelope import EventEnvelope
+from .cursor import CursorCodec
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    seq INTEGER PRIMARY KEY,
+    event_id TEXT NOT NULL,
+    ts_utc TEXT NOT NULL,
+    source_instance_id TEXT NOT NULL,
+    source_kind TEXT NOT NULL,
+    type TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    meta TEXT
+)
+"""
+
+_INSERT = "INSERT INTO events VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+
+_SELECT_SINCE = (
+    "SELECT seq, event_id, ts_utc, source_instance_id, source_kind, type, payload, meta "
+    "FROM events WHERE seq > ? ORDER BY seq LIMIT ?"
+)
+
+
+class _AppendRequest:
+    """Events queued for the writer thread and the future for their seqs."""
+
+    __slots__ = ("events", "future")
+
+    def __init__(self, events: Sequence[EventEnvelope]) -> None:
+        self.events = events
+        self.future: "Future[List[int]]" = Future()
+
+
+def _with_seq(event: EventEnvelope, seq: int) -> EventEnvelope:
+    """Return a copy of the event carrying the assigned seq."""
+    # Support both Pydantic v1 and v2
+    if hasattr(event, "model_copy"):
+        return event.model_copy(update={"seq": seq})
+    return event.copy(update={"seq": seq})
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+class SQLiteEventStore:
+    """Append-only event log backed by SQLite with authoritative `seq`.
+
+    - Appends are queued to a single writer thread, which assigns `seq` and
+      commits everything queued since the last commit in one transaction
+      (group commit), up to `max_batch_events` per transaction.
+    - `since(cursor, limit)` reads ordered ranges from the `seq` primary key.
+    - Client-provided `seq` values are ignored, per spec.
+
+    Reads use one connection per thread; WAL mode lets them run alongside
+    the writer.
+    """
+
+    DEFAULT_LIMIT = 100
+    MAX_LIMIT = 500
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_batch_events: int = 10_000,
+        synchronous: str = "NORMAL",
+    ) -> None:
+        """Open (or create) the event store.
+
+        Args:
+            path: SQLite database file path.
+            max_batch_events: Maximum events committed per transaction.
+            synchronous: SQLite `synchronous` pragma (OFF, NORMAL or FULL).
+        """
+        self._path = str(path)
+        self._max_batch_events = max_batch_events
+        self._synchronous = synchronous
+        self._local = threading.local()
+        self._requests: "queue.SimpleQueue[Optional[_AppendRequest]]" = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._closed = False
+
+        conn = self._connect()
+        with conn:
+            conn.execute(_SCHEMA)
+        row = conn.execute("SELECT MAX(seq) FROM events").fetchone()
+        self._last_seq = row[0] or 0
+        conn.close()
+
+        self._writer = threading.Thread(
+            target=self._writer_loop, name="event-store-writer", daemon=True
+        )
+        self._writer.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(f"PRAGMA synchronous={self._synchronous}")
+        return conn
+
+    def _reader(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+        return conn
+
+    def submit(self, events: Sequence[EventEnvelope]) -> "Future[List[int]]":
+        """Queue events for appending without waiting for the commit.
+
+        Args:
+            events: Events to append, in order.
+
+        Returns:
+            Future resolving to the assigned seqs once committed.
+
+        Raises:
+            RuntimeError: If the store is closed.
+        """
+        request = _AppendRequest(events)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Event store is closed")
+            self._requests.put(request)
+        return request.future
+
+    def append(self, event: EventEnvelope) -> EventEnvelope:
+        """Append one event and wait for it to be committed.
+
+        Args:
+            event: The event to append.
+
+        Returns:
+            The stored envelope with its assigned seq.
+        """
+        return self.append_many([event])[0]
+
+    def append_many(self, events: Sequence[EventEnvelope]) -> List[EventEnvelope]:
+        """Append events in one transaction and wait for the commit.
+
+        Args:
+            events: Events to append, in order.
+
+        Returns:
+            The stored envelopes with their assigned seqs.
+        """
+        if not events:
+            return []
+        seqs = self.submit(events).result()
+        return [_with_seq(event, seq) for event, seq in zip(events, seqs)]
+
+    def since(
+        self, cursor: str, limit: int = DEFAULT_LIMIT
+    ) -> Tuple[List[EventEnvelope], str]:
+        """Return events with seq greater than the cursor.
+
+        Stored events were validated on append, so rows are rebuilt with
+        `construct` rather than re-validated.
+
+        Args:
+            cursor: Cursor string (`s:<seq>`).
+            limit: Maximum events to return (clamped to 1..MAX_LIMIT).
+
+        Returns:
+            Tuple of (events ordered by seq, next cursor). The next cursor is
+            `s:<max seq returned>`, or the input cursor if nothing was returned.
+
+        Raises:
+            ValueError: If the cursor format is invalid.
+        """
+        last_seq = CursorCodec.decode(cursor)
+        if last_seq is None:
+            raise ValueError(f"invalid_cursor: {cursor}")
+        limit = min(max(limit, 1), self.MAX_LIMIT)
+
+        rows = self._reader().execute(_SELECT_SINCE, (last_seq, limit)).fetchall()
+        # Support both Pydantic v1 and v2
+        build = getattr(EventEnvelope, "model_construct", None) or EventEnvelope.construct
+        events = [
+            build(
+                event_id=event_id,
+                seq=seq,
+                ts_utc=ts_utc,
+                source_instance_id=source_instance_id,
+                source_kind=source_kind,
+                type=event_type,
+                payload=json.loads(payload),
+                meta=json.loads(meta) if meta is not None else None,
+            )
+            for seq, event_id, ts_utc, source_instance_id, source_kind, event_type, payload, meta in rows
+        ]
+        next_cursor = CursorCodec.encode(rows[-1][0]) if rows else cursor
+        return events, next_cursor
+
+    def last_seq(self) -> int:
+        """Return the highest committed seq (0 if the store is empty)."""
+        return self._last_seq
+
+    def close(self) -> None:
+        """Commit queued appends, stop the writer and close connections."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._requests.put(None)
+        self._writer.join()
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def _writer_loop(self) -> None:
+        conn = self._connect()
+        try:
+            while True:
+                request = self._requests.get()
+                if request is None:
+                    return
+                batch = [request]
+                count = len(request.events)
+                stop = False
+                # Group commit: take everything queued while the last commit ran
+                while count < self._max_batch_events:
+                    try:
+                        request = self._requests.get_nowait()
+                    except queue.Empty:
+                        break
+                    if request is None:
+                        stop = True
+                        break
+                    batch.append(request)
+                    count += len(request.events)
+                try:
+                    self._commit(conn, batch)
+                except Exception as e:
+                    # Keep the writer alive; fail whatever the batch left unresolved
+                    for pending in batch:
+                        if not pending.future.done():
+                            pending.future.set_exception(e)
+                if stop:
+                    return
+        finally:
+            conn.close()
+
+    def _commit(self, conn: sqlite3.Connection, batch: List[_AppendRequest]) -> None:
+        seq = self._last_seq
+        rows: List[Tuple[Any, ...]] = []
+        accepted: List[Tuple[_AppendRequest, List[int]]] = []
+        for request in batch:
+            # Serialize per request, so one bad payload fails only its own future
+            try:
+                request_rows = [
+                    (
+                        event.event_id,
+                        event.ts_utc,
+                        event.source_instance_id,
+                        event.source_kind,
+                        event.type,
+                        _dumps(event.payload),
+                        _dumps(event.meta) if event.meta is not None else None,
+                    )
+                    for event in request.events
+                ]
+            except Exception as e:
+                request.future.set_exception(e)
+                continue
+            seqs = list(range(seq + 1, seq + 1 + len(request_rows)))
+            rows.extend((row_seq, *row) for row_seq, row in zip(seqs, request_rows))
+            accepted.append((request, seqs))
+            seq += len(request_rows)
+
+        try:
+            with conn:
+                conn.executemany(_INSERT, rows)
+        except Exception as e:
+            for request, _ in accepted:
+                request.future.set_exception(e)
+            return
+
+        self._last_seq = seq
+        for request, seqs in accepted:
+            request.future.set_result(seqs)
@@ -2,19 +2,35 @@
 
 from .candidate_tracker import CandidateTracker
 from .cli_handler import CLIHandler
-from .event_logger import EventLogger
+from .event_logger import DurabilityMode, EventLogger
 from .models import GateState, SessionMetadata, SessionSummary
+from .session_log import (
+    BinarySessionLogReader,
+    BinarySessionLogWriter,
+    Compression,
+    convert_binary_to_jsonl,
+    convert_jsonl_to_binary,
+)
 from .session_manager import SessionManager
-from .state_manager import StateManager
+from .session_stats import SessionLogStats
+from .state_manager import StateCheckpointer, StateManager
 
 __all__ = [
+    "BinarySessionLogReader",
+    "BinarySessionLogWriter",
     "CandidateTracker",
     "CLIHandler",
+    "Compression",
+    "convert_binary_to_jsonl",
+    "convert_jsonl_to_binary",
+    "DurabilityMode",
     "EventLogger",
     "GateState",
+    "SessionLogStats",
     "SessionManager",
     "SessionMetadata",
     "SessionSummary",
+    "StateCheckpointer",
     "StateManager",
 ]
 
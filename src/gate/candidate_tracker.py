@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
 
-from ..memory.models import STMMemoryEntry
+from ..memory.models import LTMMemoryEntry, STMMemoryEntry
 from ..memory.pipeline import MemoryPipeline
 from .session_manager import SessionManager
 
@@ -62,20 +62,49 @@ class CandidateTracker:
         ltm_entry = self._memory_pipeline.process_stm_entry(stm_entry, dry_run=dry_run)
 
         if ltm_entry:
-            candidate_data = {
-                "memory_id": ltm_entry.memory_id,
-                "timestamp": ltm_entry.timestamp.isoformat(),
-                "type": ltm_entry.type.value,
-                "content_summary": ltm_entry.content_summary,
-                "significance_score": stm_entry.raw_payload.get("significance_score", 0.0),
-                "promoted": not dry_run,
-            }
-            self._candidates.append(candidate_data)
-            self._session_manager.increment_candidate_count()
-            return candidate_data
+            return self._record_candidate(stm_entry, ltm_entry, dry_run)
 
         return None
 
+    def process_candidates(self, stm_entries: List[STMMemoryEntry]) -> List[Dict[str, Any]]:
+        """Process a batch of memory candidates.
+
+        Uses MemoryPipeline.process_batch (bulk evaluation and a single index
+        insert) with the same dry-run rules as `process_candidate`.
+
+        Args:
+            stm_entries: STM entries to process as candidates.
+
+        Returns:
+            Candidate data dictionaries for entries that were not discarded.
+        """
+        if not self._memory_pipeline:
+            return [self.process_candidate(stm_entry) for stm_entry in stm_entries]
+
+        dry_run = not self._promote_memory
+        result = self._memory_pipeline.process_batch(stm_entries, dry_run=dry_run)
+        return [
+            self._record_candidate(stm_entry, ltm_entry, dry_run)
+            for stm_entry, ltm_entry in zip(stm_entries, result.entries)
+            if ltm_entry is not None
+        ]
+
+    def _record_candidate(
+        self, stm_entry: STMMemoryEntry, ltm_entry: LTMMemoryEntry, dry_run: bool
+    ) -> Dict[str, Any]:
+        """Store candidate data for a consolidated entry."""
+        candidate_data = {
+            "memory_id": ltm_entry.memory_id,
+            "timestamp": ltm_entry.timestamp.isoformat(),
+            "type": ltm_entry.type.value,
+            "content_summary": ltm_entry.content_summary,
+            "significance_score": stm_entry.raw_payload.get("significance_score", 0.0),
+            "promoted": not dry_run,
+        }
+        self._candidates.append(candidate_data)
+        self._session_manager.increment_candidate_count()
+        return candidate_data
+
     def get_candidates(self) -> List[Dict[str, Any]]:
         """Get all tracked candidates.
 
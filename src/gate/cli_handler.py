@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
-import json
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 from ..memory.pipeline import MemoryPipeline
+from ..serialization import codec_for
 from .candidate_tracker import CandidateTracker
 from .models import SessionSummary
 from .session_manager import SessionManager
+from .session_stats import SessionLogStats
+
+_SUMMARY_CODEC = codec_for(SessionSummary)
 
 
 class CLIHandler:
@@ -21,6 +24,7 @@ class CLIHandler:
         session_manager: SessionManager,
         candidate_tracker: CandidateTracker,
         memory_pipeline: Optional[MemoryPipeline] = None,
+        flush_log: Optional[Callable[[], None]] = None,
     ):
         """Initialize CLI handler.
 
@@ -28,10 +32,15 @@ class CLIHandler:
             session_manager: SessionManager for session metadata.
             candidate_tracker: CandidateTracker for memory candidates.
             memory_pipeline: Optional MemoryPipeline for promotion.
+            flush_log: Optional callable that writes buffered session log
+                events to disk (e.g. `EventLogger.flush`), called before the
+                log is scanned for a summary.
         """
         self._session_manager = session_manager
         self._candidate_tracker = candidate_tracker
         self._memory_pipeline = memory_pipeline
+        self._flush_log = flush_log
+        self._log_stats: Optional[SessionLogStats] = None
 
     def handle_command(self, command: str) -> Optional[str]:
         """Handle a chat command.
@@ -64,11 +73,19 @@ class CLIHandler:
         if not session:
             return "No active session to summarize."
 
-        # Build event summary (simplified - would need to read from log file)
-        event_summary: Dict[str, Any] = {
-            "total_events": session.event_count,
-            "session_duration_seconds": None,  # Would calculate from timestamps
-        }
+        # Build event summary from the session log, resuming where the last summary stopped
+        event_summary: Dict[str, Any] = {"total_events": session.event_count}
+        log_file = self._session_manager.get_current_log_file()
+        if log_file:
+            # Buffered events must reach the file, or per-type counts lag total_events
+            if self._flush_log is not None:
+                self._flush_log()
+            if self._log_stats is None or self._log_stats.log_file != log_file:
+                self._log_stats = SessionLogStats(log_file)
+            self._log_stats.scan()
+            event_summary.update(self._log_stats.to_summary())
+        else:
+            event_summary["session_duration_seconds"] = None
 
         # Get memory candidates
         memory_candidates = self._candidate_tracker.get_candidates()
@@ -85,13 +102,8 @@ class CLIHandler:
         summary_file = Path("data") / f"session_summary_{timestamp_str}.json"
 
         summary_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(summary_file, "w", encoding="utf-8") as f:
-            # Support both Pydantic v1 and v2
-            if hasattr(summary, "model_dump"):
-                data = summary.model_dump()
-            else:
-                data = summary.dict()
-            json.dump(data, f, indent=2)
+        with open(summary_file, "wb") as f:
+            f.write(_SUMMARY_CODEC.encode(summary, indent=True))
 
         return f"Summary saved to {summary_file}"
 
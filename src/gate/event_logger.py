@@ -3,25 +3,69 @@
 from __future__ import annotations
 
 import json
+import os
 import threading
+import time
+from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import IO, Optional
 
+from ..serialization import codec_for
 from ..state.models.event_envelope import EventEnvelope
 from .session_manager import SessionManager
 
+_EVENT_CODEC = codec_for(EventEnvelope)
+
+
+class DurabilityMode(str, Enum):
+    """How eagerly logged events are pushed to disk."""
+
+    FLUSH = "flush"  # Flush to the OS after every event (visible to readers immediately)
+    FSYNC = "fsync"  # Group fsync every N events or N milliseconds
+    BUFFERED = "buffered"  # OS-buffered; background flusher pushes the buffer periodically
+
 
 class EventLogger:
-    """Thread-safe event logger that writes EventEnvelope instances as JSONL."""
+    """Thread-safe event logger that writes EventEnvelope instances as JSONL.
+
+    Keeps one buffered file handle open per session instead of opening the
+    log for every event. In FSYNC and BUFFERED modes a background flusher
+    thread pushes the buffer (and fsyncs, in FSYNC mode) on a timer or once
+    `fsync_every_events` events are pending. `flush()` is a durability
+    barrier; `close()` flushes and releases the file.
+    """
 
-    def __init__(self, session_manager: SessionManager):
+    def __init__(
+        self,
+        session_manager: SessionManager,
+        durability: DurabilityMode = DurabilityMode.FLUSH,
+        flush_interval_ms: float = 50.0,
+        fsync_every_events: int = 256,
+        buffer_size: int = 64 * 1024,
+    ):
         """Initialize event logger.
 
         Args:
             session_manager: SessionManager for getting current log file.
+            durability: Durability mode (default: flush per event).
+            flush_interval_ms: Background flush/fsync period for FSYNC and
+                BUFFERED modes.
+            fsync_every_events: In FSYNC mode, wake the flusher once this
+                many events are pending.
+            buffer_size: Write buffer size in bytes.
         """
         self._session_manager = session_manager
+        self._durability = DurabilityMode(durability)
+        self._flush_interval = flush_interval_ms / 1000.0
+        self._fsync_every_events = fsync_every_events
+        self._buffer_size = buffer_size
         self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._file: Optional[IO[bytes]] = None
+        self._file_path: Optional[Path] = None
+        self._pending = 0
+        self._flusher: Optional[threading.Thread] = None
+        self._closed = False
 
     def log_event(self, event: EventEnvelope) -> None:
         """Log an event to the current session JSONL file.
@@ -33,21 +77,141 @@ class EventLogger:
         if not log_file:
             return
 
-        # Serialize event to JSON
-        # Support both Pydantic v1 and v2
-        if hasattr(event, "model_dump"):
-            event_dict = event.model_dump()
-        else:
-            event_dict = event.dict()
+        # Serialize event to one JSON line via the pre-compiled codec
+        # (outside the lock, but guarded like the write)
+        try:
+            line = _EVENT_CODEC.encode_line(event)
+        except Exception:
+            # Log error but don't crash
+            return
 
         # Write as JSONL (one JSON object per line)
         with self._lock:
             try:
-                with open(log_file, "a", encoding="utf-8") as f:
-                    json.dump(event_dict, f, ensure_ascii=False)
-                    f.write("\n")
+                handle = self._handle_for(log_file)
+                handle.write(line)
+                if self._durability is DurabilityMode.FLUSH:
+                    handle.flush()
+                else:
+                    self._pending += 1
+                    if self._pending >= self._fsync_every_events:
+                        self._wakeup.notify()
                 self._session_manager.increment_event_count()
             except Exception:
                 # Log error but don't crash
                 pass
 
+    def flush(self) -> None:
+        """Write buffered events to the file and fsync it (durability barrier)."""
+        with self._lock:
+            handle = self._file
+            if handle is None:
+                return
+            handle.flush()
+            self._pending = 0
+            fd = handle.fileno()
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+
+    def close(self) -> None:
+        """Flush, stop the background flusher and close the session file."""
+        self.flush()
+        with self._wakeup:
+            self._closed = True
+            self._close_file_locked()
+            flusher, self._flusher = self._flusher, None
+            self._wakeup.notify_all()
+        if flusher is not None:
+            flusher.join()
+        with self._lock:
+            self._closed = False
+
+    def _handle_for(self, log_file: Path) -> IO[bytes]:
+        """Return the open handle for `log_file`, rotating on session change.
+
+        Caller must hold the lock.
+        """
+        if self._file is None or self._file_path != log_file:
+            self._close_file_locked()
+            self._file = open(log_file, "ab", buffering=self._buffer_size)
+            self._file_path = log_file
+            if self._durability is not DurabilityMode.FLUSH and self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._flush_loop, name="gate-event-flusher", daemon=True
+                )
+                self._flusher.start()
+        return self._file
+
+    def _close_file_locked(self) -> None:
+        if self._file is None:
+            return
+        try:
+            self._file.flush()
+            if self._durability is DurabilityMode.FSYNC:
+                os.fsync(self._file.fileno())
+            self._file.close()
+        except (OSError, ValueError):
+            pass
+        self._file = None
+        self._file_path = None
+        self._pending = 0
+
+    def _flush_loop(self) -> None:
+        while True:
+            with self._wakeup:
+                deadline = time.monotonic() + self._flush_interval
+                while not self._closed and self._pending < self._fsync_every_events:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._wakeup.wait(remaining)
+                if self._closed:
+                    return
+                if self._file is None or self._pending == 0:
+                    continue
+                try:
+                    self._file.flush()
+                    fd = self._file.fileno()
+                except (OSError, ValueError):
+                    continue
+                self._pending = 0
+            if self._durability is DurabilityMode.FSYNC:
+                # fsync outside the lock so loggers keep appending meanwhile
+                try:
+                    os.fsync(fd)
+                except OSError:
+                    pass
+
+
+def read_last_logged_event_id(log_file: Path, tail_bytes: int = 64 * 1024) -> Optional[str]:
+    """Return the event_id of the last complete JSONL record in a session log.
+
+    Only the tail of the file is read. A torn final line (e.g. after a
+    crash mid-write) is skipped.
+
+    Args:
+        log_file: Session JSONL file.
+        tail_bytes: How many bytes from the end to inspect.
+
+    Returns:
+        The last logged event_id, or None if none could be read.
+    """
+    try:
+        with open(log_file, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            f.seek(max(0, size - tail_bytes))
+            tail = f.read()
+    except OSError:
+        return None
+
+    for line in reversed(tail.splitlines()):
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(record, dict) and record.get("event_id"):
+            return record["event_id"]
+    return None
@@ -0,0 +1,476 @@
+"""Compact binary session log format for gate persistence system.
+
+An optional alternative to the JSONL session logs in logs/runtime_sessions/.
+
+Log file (`*.nslog`):
+    header  b"NYSL" | u8 version | u8 compression
+    frames  u32 stored_len | u32 raw_len | u32 record_count | u32 crc32 | stored bytes
+
+Each frame is self-contained so it can be decoded on its own. Its raw bytes
+start with a dictionary block interning the frame's repeated strings
+(type, source_instance_id, source_kind), followed by records:
+    u32 body_len | u16 type_ref | u16 instance_ref | u16 kind_ref | i64 seq | body
+where body is the JSON object {event_id, ts_utc, payload, meta}.
+Frames are optionally compressed with zlib or zstd (if `zstandard` is installed).
+
+Sidecar index (`*.nslog.idx`), one fixed-layout entry per record:
+    u64 frame_offset | u32 record_in_frame | i64 seq | f64 ts_epoch | u8 id_len | event_id
+
+The JSONL converters keep existing tooling working.
+"""
+
+from __future__ import annotations
+
+import bisect
+import struct
+import zlib
+from collections import OrderedDict
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import IO, Dict, Iterator, List, Optional, Tuple, Union
+
+from ..serialization import codec_for, get_backend
+from ..state.models.event_envelope import EventEnvelope
+
+_MAGIC = b"NYSL"
+_INDEX_MAGIC = b"NYSI"
+_VERSION = 1
+_FILE_HEADER = struct.Struct("<4sBB")
+_FRAME_HEADER = struct.Struct("<IIII")
+_RECORD_HEADER = struct.Struct("<IHHHq")
+_INDEX_ENTRY = struct.Struct("<QIqdB")
+_U16 = struct.Struct("<H")
+
+_EVENT_CODEC = codec_for(EventEnvelope)
+
+
+class Compression(int, Enum):
+    """Frame compression codecs."""
+
+    NONE = 0
+    ZLIB = 1
+    ZSTD = 2
+
+
+def _compressor(compression: Compression):
+    if compression is Compression.ZLIB:
+        return lambda data: zlib.compress(data, 6)
+    if compression is Compression.ZSTD:
+        import zstandard
+
+        return zstandard.ZstdCompressor(level=3).compress
+    return lambda data: data
+
+
+def _decompressor(compression: Compression):
+    if compression is Compression.ZLIB:
+        return zlib.decompress
+    if compression is Compression.ZSTD:
+        import zstandard
+
+        decompressor = zstandard.ZstdDecompressor()
+        return lambda data: decompressor.decompress(data)
+    return lambda data: data
+
+
+def _ts_epoch(ts_utc: str) -> float:
+    """Convert an ISO 8601 UTC timestamp (with `Z` suffix) to epoch seconds."""
+    try:
+        return datetime.fromisoformat(ts_utc.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return 0.0
+
+
+def index_path_for(log_path: Path) -> Path:
+    """Return the sidecar index path for a binary session log."""
+    return log_path.with_name(log_path.name + ".idx")
+
+
+class BinarySessionLogWriter:
+    """Appends EventEnvelopes to a binary session log and its sidecar index.
+
+    Records are buffered into frames of about `frame_bytes` raw bytes; a
+    frame is compressed and written when full, on `flush()` and on `close()`.
+    Not thread-safe; EventLogger-style callers should serialize access.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        compression: Compression = Compression.ZLIB,
+        frame_bytes: int = 64 * 1024,
+    ) -> None:
+        """Create (truncate) a binary session log.
+
+        Args:
+            path: Log file path (conventionally `*.nslog`).
+            compression: Frame compression codec.
+            frame_bytes: Target raw frame size in bytes.
+        """
+        self._path = Path(path)
+        self._compression = Compression(compression)
+        self._compress = _compressor(self._compression)
+        self._frame_bytes = frame_bytes
+        self._json = get_backend()
+        self._file: IO[bytes] = open(self._path, "wb")
+        self._index: IO[bytes] = open(index_path_for(self._path), "wb")
+        self._file.write(_FILE_HEADER.pack(_MAGIC, _VERSION, self._compression))
+        self._index.write(_INDEX_MAGIC)
+        self._reset_frame()
+
+    def _reset_frame(self) -> None:
+        self._strings: Dict[str, int] = {}
+        self._records: List[bytes] = []
+        self._frame_size = 0
+        self._frame_index: List[Tuple[int, float, bytes]] = []
+
+    def _intern(self, value: str) -> int:
+        ref = self._strings.get(value)
+        if ref is None:
+            ref = len(self._strings)
+            self._strings[value] = ref
+        return ref
+
+    def append(self, event: EventEnvelope) -> None:
+        """Append one event.
+
+        Args:
+            event: The event to write.
+
+        Raises:
+            ValueError: If the event_id is longer than 255 UTF-8 bytes, or
+                type, source_instance_id or source_kind is longer than 65535.
+        """
+        event_id = event.event_id.encode("utf-8")
+        if len(event_id) > 0xFF:
+            raise ValueError(f"event_id must be at most 255 UTF-8 bytes, got: {len(event_id)}")
+        strings = (event.type, event.source_instance_id, event.source_kind)
+        for value in strings:
+            length = len(value.encode("utf-8"))
+            if length > 0xFFFF:
+                raise ValueError(f"Interned strings must be at most 65535 UTF-8 bytes, got: {length}")
+        body = self._json.dumps(
+            {
+                "event_id": event.event_id,
+                "ts_utc": event.ts_utc,
+                "payload": event.payload,
+                "meta": event.meta,
+            }
+        )
+        # Start a new frame before the string table outgrows its u16 refs
+        new_strings = len(set(strings).difference(self._strings))
+        if len(self._strings) + new_strings > 0xFFFF:
+            self._write_frame()
+
+        record = _RECORD_HEADER.pack(
+            len(body),
+            self._intern(event.type),
+            self._intern(event.source_instance_id),
+            self._intern(event.source_kind),
+            event.seq,
+        ) + body
+        self._records.append(record)
+        self._frame_size += len(record)
+        self._frame_index.append((event.seq, _ts_epoch(event.ts_utc), event_id))
+        if self._frame_size >= self._frame_bytes:
+            self._write_frame()
+
+    def _write_frame(self) -> None:
+        if not self._records:
+            return
+        parts = [_U16.pack(len(self._strings))]
+        for value in self._strings:
+            encoded = value.encode("utf-8")
+            parts.append(_U16.pack(len(encoded)))
+            parts.append(encoded)
+        parts.extend(self._records)
+        raw = b"".join(parts)
+        stored = self._compress(raw)
+
+        frame_offset = self._file.tell()
+        self._file.write(
+            _FRAME_HEADER.pack(len(stored), len(raw), len(self._records), zlib.crc32(stored))
+        )
+        self._file.write(stored)
+
+        index_parts = []
+        for i, (seq, ts_epoch, event_id) in enumerate(self._frame_index):
+            index_parts.append(_INDEX_ENTRY.pack(frame_offset, i, seq, ts_epoch, len(event_id)))
+            index_parts.append(event_id)
+        self._index.write(b"".join(index_parts))
+        self._reset_frame()
+
+    def flush(self) -> None:
+        """Write the current partial frame and flush both files."""
+        self._write_frame()
+        self._file.flush()
+        self._index.flush()
+
+    def close(self) -> None:
+        """Flush and close the log and its index."""
+        self.flush()
+        self._file.close()
+        self._index.close()
+
+    def __enter__(self) -> "BinarySessionLogWriter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class _IndexEntry:
+    __slots__ = ("frame_offset", "record", "seq", "ts_epoch", "event_id")
+
+    def __init__(self, frame_offset: int, record: int, seq: int, ts_epoch: float, event_id: str):
+        self.frame_offset = frame_offset
+        self.record = record
+        self.seq = seq
+        self.ts_epoch = ts_epoch
+        self.event_id = event_id
+
+
+class BinarySessionLogReader:
+    """Random-access and streaming reader for binary session logs.
+
+    Loads the sidecar index (rebuilding it in memory by scanning frames if it
+    is missing or truncated) and keeps a small LRU cache of decoded frames.
+    Records are rebuilt with `construct` since the log is a trusted local file.
+    """
+
+    def __init__(self, path: Union[str, Path], frame_cache_size: int = 8) -> None:
+        """Open a binary session log.
+
+        Args:
+            path: Log file path.
+            frame_cache_size: Number of decoded frames to keep cached.
+
+        Raises:
+            ValueError: If the file is not a binary session log.
+        """
+        self._path = Path(path)
+        self._file: IO[bytes] = open(self._path, "rb")
+        magic, version, compression = _FILE_HEADER.unpack(self._file.read(_FILE_HEADER.size))
+        if magic != _MAGIC or version != _VERSION:
+            self._file.close()
+            raise ValueError(f"Not a binary session log: {self._path}")
+        self._decompress = _decompressor(Compression(compression))
+        self._json = get_backend()
+        self._construct = getattr(EventEnvelope, "model_construct", None) or EventEnvelope.construct
+        self._frame_cache: "OrderedDict[int, List[EventEnvelope]]" = OrderedDict()
+        self._frame_cache_size = frame_cache_size
+
+        self._entries = self._load_index()
+        self._by_event_id = {entry.event_id: entry for entry in self._entries}
+        self._by_seq = {entry.seq: entry for entry in self._entries if entry.seq > 0}
+        by_time = sorted(self._entries, key=lambda entry: entry.ts_epoch)
+        self._time_keys = [entry.ts_epoch for entry in by_time]
+        self._by_time = by_time
+
+    def _load_index(self) -> List[_IndexEntry]:
+        index_path = index_path_for(self._path)
+        entries: List[_IndexEntry] = []
+        try:
+            data = index_path.read_bytes()
+        except OSError:
+            data = b""
+        if data[:4] == _INDEX_MAGIC:
+            pos = 4
+            while pos + _INDEX_ENTRY.size <= len(data):
+                frame_offset, record, seq, ts_epoch, id_len = _INDEX_ENTRY.unpack_from(data, pos)
+                pos += _INDEX_ENTRY.size
+                if pos + id_len > len(data):
+                    break
+                event_id = data[pos:pos + id_len].decode("utf-8")
+                pos += id_len
+                entries.append(_IndexEntry(frame_offset, record, seq, ts_epoch, event_id))
+
+        # Rebuild from the log if the index is missing or behind it; only
+        # frame headers are read for frames the index already covers
+        covered = {entry.frame_offset for entry in entries}
+        for frame_offset in list(self._frame_offsets()):
+            if frame_offset in covered:
+                continue
+            events = self._decode_frame(frame_offset)
+            if events is None:
+                break  # Torn or corrupt tail
+            for i, event in enumerate(events):
+                entries.append(
+                    _IndexEntry(frame_offset, i, event.seq, _ts_epoch(event.ts_utc), event.event_id)
+                )
+        entries.sort(key=lambda entry: (entry.frame_offset, entry.record))
+        return entries
+
+    def _read_frame_header(self, offset: int) -> Optional[Tuple[int, int, int, int]]:
+        self._file.seek(offset)
+        header = self._file.read(_FRAME_HEADER.size)
+        if len(header) < _FRAME_HEADER.size:
+            return None
+        return _FRAME_HEADER.unpack(header)
+
+    def _frame_offsets(self) -> Iterator[int]:
+        offset = _FILE_HEADER.size
+        while True:
+            header = self._read_frame_header(offset)
+            if header is None:
+                return
+            stored_len = header[0]
+            yield offset
+            offset += _FRAME_HEADER.size + stored_len
+
+    def _iter_frames(self) -> Iterator[Tuple[int, List[EventEnvelope]]]:
+        for offset in list(self._frame_offsets()):
+            events = self._decode_frame(offset)
+            if events is None:
+                return  # Torn or corrupt tail
+            yield offset, events
+
+    def _decode_frame(self, offset: int) -> Optional[List[EventEnvelope]]:
+        cached = self._frame_cache.get(offset)
+        if cached is not None:
+            self._frame_cache.move_to_end(offset)
+            return cached
+
+        header = self._read_frame_header(offset)
+        if header is None:
+            return None
+        stored_len, raw_len, record_count, crc = header
+        stored = self._file.read(stored_len)
+        if len(stored) < stored_len or zlib.crc32(stored) != crc:
+            return None
+        raw = self._decompress(stored)
+
+        (string_count,) = _U16.unpack_from(raw, 0)
+        pos = _U16.size
+        strings: List[str] = []
+        for _ in range(string_count):
+            (length,) = _U16.unpack_from(raw, pos)
+            pos += _U16.size
+            strings.append(raw[pos:pos + length].decode("utf-8"))
+            pos += length
+
+        loads = self._json.loads
+        construct = self._construct
+        events: List[EventEnvelope] = []
+        for _ in range(record_count):
+            body_len, type_ref, instance_ref, kind_ref, seq = _RECORD_HEADER.unpack_from(raw, pos)
+            pos += _RECORD_HEADER.size
+            body = loads(raw[pos:pos + body_len])
+            pos += body_len
+            events.append(
+                construct(
+                    event_id=body["event_id"],
+                    seq=seq,
+                    ts_utc=body["ts_utc"],
+                    source_instance_id=strings[instance_ref],
+                    source_kind=strings[kind_ref],
+                    type=strings[type_ref],
+                    payload=body["payload"],
+                    meta=body.get("meta"),
+                )
+            )
+
+        self._frame_cache[offset] = events
+        if len(self._frame_cache) > self._frame_cache_size:
+            self._frame_cache.popitem(last=False)
+        return events
+
+    def _event_at(self, entry: _IndexEntry) -> Optional[EventEnvelope]:
+        events = self._decode_frame(entry.frame_offset)
+        if events is None or entry.record >= len(events):
+            return None
+        return events[entry.record]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[EventEnvelope]:
+        """Stream every event in write order."""
+        for _, events in self._iter_frames():
+            yield from events
+
+    def get_by_event_id(self, event_id: str) -> Optional[EventEnvelope]:
+        """Return the event with the given event_id, or None."""
+        entry = self._by_event_id.get(event_id)
+        return self._event_at(entry) if entry is not None else None
+
+    def get_by_seq(self, seq: int) -> Optional[EventEnvelope]:
+        """Return the event with the given seq (> 0), or None."""
+        entry = self._by_seq.get(seq)
+        return self._event_at(entry) if entry is not None else None
+
+    def scan_time_range(
+        self, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> Iterator[EventEnvelope]:
+        """Yield events with start <= ts_utc < end, in timestamp order.
+
+        Args:
+            start: Inclusive lower bound (None for unbounded).
+            end: Exclusive upper bound (None for unbounded).
+        """
+        lo = 0 if start is None else bisect.bisect_left(self._time_keys, start.timestamp())
+        hi = len(self._time_keys) if end is None else bisect.bisect_left(self._time_keys, end.timestamp())
+        for entry in self._by_time[lo:hi]:
+            event = self._event_at(entry)
+            if event is not None:
+                yield event
+
+    def close(self) -> None:
+        """Close the log file."""
+        self._file.close()
+
+    def __enter__(self) -> "BinarySessionLogReader":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def convert_jsonl_to_binary(
+    jsonl_path: Union[str, Path],
+    binary_path: Union[str, Path],
+    compression: Compression = Compression.ZLIB,
+) -> int:
+    """Convert a JSONL session log to the binary format.
+
+    Blank and unparseable lines (e.g. a torn final line) are skipped.
+
+    Args:
+        jsonl_path: Source JSONL log.
+        binary_path: Destination binary log (its index is written alongside).
+        compression: Frame compression codec.
+
+    Returns:
+        The number of events converted.
+    """
+    count = 0
+    with open(jsonl_path, "rb") as source, BinarySessionLogWriter(binary_path, compression) as writer:
+        for line in source:
+            if not line.strip():
+                continue
+            try:
+                event = _EVENT_CODEC.decode(line)
+            except Exception:
+                continue
+            writer.append(event)
+            count += 1
+    return count
+
+
+def convert_binary_to_jsonl(binary_path: Union[str, Path], jsonl_path: Union[str, Path]) -> int:
+    """Convert a binary session log back to JSONL.
+
+    Args:
+        binary_path: Source binary log.
+        jsonl_path: Destination JSONL log.
+
+    Returns:
+        The number of events converted.
+    """
+    count = 0
+    with BinarySessionLogReader(binary_path) as reader, open(jsonl_path, "wb") as out:
+        for event in reader:
+            out.write(_EVENT_CODEC.encode_line(event))
+            count += 1
+    return count
@@ -0,0 +1,193 @@
+"""Session log statistics for gate persistence system.
+
+Computes `/save-summary` statistics from a session JSONL log in a single
+pass over a memory-mapped view of the file. Envelope fields (event_id,
+type, ts_utc) are matched directly in the mapped bytes; only each event's
+payload object is decoded, to count its top-level keys.
+
+Scans are incremental: SessionLogStats remembers the offset after the last
+complete line, so the next scan only reads bytes appended since.
+"""
+
+from __future__ import annotations
+
+import mmap
+import re
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from ..serialization import get_backend
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+_TYPE_RE = re.compile(rb'"type":\s*"((?:[^"\\]|\\.)*)"')
+_TS_RE = re.compile(rb'"ts_utc":\s*"((?:[^"\\]|\\.)*)"')
+_EVENT_ID_RE = re.compile(rb'"event_id":\s*"((?:[^"\\]|\\.)*)"')
+_PAYLOAD_RE = re.compile(rb'"payload":\s*')
+_META_KEY = b'"meta":'
+
+# Bytes scanned per vectorised newline search
+_CHUNK_BYTES = 8 * 1024 * 1024
+
+
+def _newline_offsets(view: mmap.mmap, start: int, end: int) -> Iterator[int]:
+    """Yield offsets of newline bytes in view[start:end]."""
+    if np is not None:
+        for chunk_start in range(start, end, _CHUNK_BYTES):
+            chunk_end = min(chunk_start + _CHUNK_BYTES, end)
+            chunk = np.frombuffer(view, dtype=np.uint8, count=chunk_end - chunk_start, offset=chunk_start)
+            for offset in np.flatnonzero(chunk == 0x0A).tolist():
+                yield chunk_start + offset
+            del chunk  # Release the buffer export so the map can be closed
+        return
+
+    find = view.find
+    pos = find(b"\n", start, end)
+    while pos != -1:
+        yield pos
+        pos = find(b"\n", pos + 1, end)
+
+
+def _ts_epoch(ts_utc: str) -> Optional[float]:
+    try:
+        return datetime.fromisoformat(ts_utc.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+class SessionLogStats:
+    """Incrementally maintained statistics for one session JSONL log."""
+
+    def __init__(self, log_file: Path) -> None:
+        """Initialize empty statistics for a log file.
+
+        Args:
+            log_file: Session JSONL file.
+        """
+        self.log_file = Path(log_file)
+        self._loads = get_backend().loads
+        self._reset()
+
+    def _reset(self) -> None:
+        self.offset = 0  # Byte offset after the last complete line scanned
+        self.events = 0
+        self.skipped_lines = 0
+        self.type_counts: Counter = Counter()
+        self.payload_key_counts: Counter = Counter()
+        self.first_event: Optional[Tuple[bytes, bytes, bytes]] = None  # (event_id, type, ts_utc)
+        self.last_event: Optional[Tuple[bytes, bytes, bytes]] = None
+        self.min_ts: Optional[bytes] = None
+        self.max_ts: Optional[bytes] = None
+
+    def scan(self) -> int:
+        """Scan lines appended since the last scan.
+
+        A trailing partial line (still being written) is left for the next scan.
+
+        Returns:
+            The number of events added by this scan.
+        """
+        try:
+            with open(self.log_file, "rb") as f:
+                size = f.seek(0, 2)
+                if size < self.offset:
+                    # Log was truncated or replaced: start over
+                    self._reset()
+                if size <= self.offset:
+                    return 0
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                    return self._scan_view(view, size)
+        except (OSError, ValueError):
+            return 0
+
+    def _scan_view(self, view: mmap.mmap, size: int) -> int:
+        before = self.events
+        type_counts = self.type_counts
+        key_counts = self.payload_key_counts
+        start = self.offset
+        for newline in _newline_offsets(view, start, size):
+            line = view[start:newline]
+            start = newline + 1
+            event_type = _TYPE_RE.search(line)
+            ts = _TS_RE.search(line)
+            if event_type is None or ts is None:
+                if line.strip():
+                    self.skipped_lines += 1
+                continue
+
+            type_bytes = event_type.group(1)
+            ts_bytes = ts.group(1)
+            event_id = _EVENT_ID_RE.search(line)
+            summary = (event_id.group(1) if event_id else b"", type_bytes, ts_bytes)
+            if self.first_event is None:
+                self.first_event = summary
+            self.last_event = summary
+            # Timestamps share one ISO format, so byte order is time order
+            if self.min_ts is None or ts_bytes < self.min_ts:
+                self.min_ts = ts_bytes
+            if self.max_ts is None or ts_bytes > self.max_ts:
+                self.max_ts = ts_bytes
+
+            type_counts[type_bytes] += 1
+            keys = self._payload_keys(line)
+            if keys:
+                key_counts.update(keys)
+            self.events += 1
+        self.offset = start
+        return self.events - before
+
+    def _payload_keys(self, line: bytes) -> List[str]:
+        """Return the payload's top-level keys, decoding only the payload slice."""
+        match = _PAYLOAD_RE.search(line)
+        if match is None:
+            return []
+        # Envelopes are written with `meta` as the last field after `payload`
+        end = line.rfind(_META_KEY)
+        payload_slice = line[match.end():end].rstrip().rstrip(b",") if end > match.end() else None
+        try:
+            payload = self._loads(payload_slice) if payload_slice else self._loads(line).get("payload")
+        except ValueError:
+            try:
+                payload = self._loads(line).get("payload")
+            except ValueError:
+                return []
+        return list(payload) if isinstance(payload, dict) else []
+
+    def to_summary(self, top_keys: int = 10) -> Dict[str, Any]:
+        """Return the statistics as an event summary dictionary.
+
+        Args:
+            top_keys: Number of most frequent payload keys to include.
+        """
+
+        def event_info(event: Optional[Tuple[bytes, bytes, bytes]]) -> Optional[Dict[str, str]]:
+            if event is None:
+                return None
+            event_id, event_type, ts_utc = (value.decode("utf-8", "replace") for value in event)
+            return {"event_id": event_id, "type": event_type, "ts_utc": ts_utc}
+
+        duration = None
+        if self.min_ts is not None and self.max_ts is not None:
+            start = _ts_epoch(self.min_ts.decode("utf-8", "replace"))
+            end = _ts_epoch(self.max_ts.decode("utf-8", "replace"))
+            if start is not None and end is not None:
+                duration = end - start
+
+        return {
+            "logged_events": self.events,
+            "session_duration_seconds": duration,
+            "event_type_counts": {
+                event_type.decode("utf-8", "replace"): count
+                for event_type, count in self.type_counts.most_common()
+            },
+            "first_event": event_info(self.first_event),
+            "last_event": event_info(self.last_event),
+            "top_payload_keys": self.payload_key_counts.most_common(top_keys),
+            "scanned_bytes": self.offset,
+            "skipped_lines": self.skipped_lines,
+        }
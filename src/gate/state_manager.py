@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
-import json
+import threading
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
+from ..serialization import codec_for
 from .models import GateState
 
+_GATE_STATE_CODEC = codec_for(GateState)
+
 
 class StateManager:
     """Manages gate state persistence to data/gate_state.json."""
@@ -31,9 +35,8 @@ class StateManager:
             return None
 
         try:
-            with open(self._state_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return GateState(**data)
+            with open(self._state_file, "rb") as f:
+                return _GATE_STATE_CODEC.decode(f.read())
         except Exception:
             return None
 
@@ -46,13 +49,8 @@ class StateManager:
         # Atomic write: write to temp file, then rename
         temp_file = self._state_file.with_suffix(".json.tmp")
         try:
-            with open(temp_file, "w", encoding="utf-8") as f:
-                # Support both Pydantic v1 and v2
-                if hasattr(state, "model_dump"):
-                    data = state.model_dump()
-                else:
-                    data = state.dict()
-                json.dump(data, f, indent=2)
+            with open(temp_file, "wb") as f:
+                f.write(_GATE_STATE_CODEC.encode(state, indent=True))
             temp_file.replace(self._state_file)
         except Exception:
             # Clean up temp file on error
@@ -60,3 +58,116 @@ class StateManager:
                 temp_file.unlink()
             raise
 
+
+class StateCheckpointer:
+    """Coalescing background writer for an in-memory GateState.
+
+    Callers mutate the state in memory and call `mark_dirty()`; a background
+    thread writes it through StateManager at most once per
+    `flush_interval_ms`, so bursts of updates cost a single write.
+    `checkpoint()` writes synchronously; `close()` checkpoints and stops the
+    thread.
+    """
+
+    def __init__(self, state_manager: StateManager, flush_interval_ms: float = 200.0):
+        """Initialize state checkpointer.
+
+        Args:
+            state_manager: StateManager used for the actual writes.
+            flush_interval_ms: Minimum time between background writes.
+        """
+        self._state_manager = state_manager
+        self._flush_interval = flush_interval_ms / 1000.0
+        self._state: Optional[GateState] = None
+        self._dirty = False
+        self._last_write = 0.0
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._write_lock = threading.Lock()
+        # Snapshots are numbered; a write older than the last one saved is
+        # skipped, so a slow background write cannot overwrite a newer one
+        self._snapshot_seq = 0
+        self._written_seq = 0
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def mark_dirty(self, state: GateState) -> None:
+        """Schedule `state` to be written by the background thread.
+
+        Args:
+            state: The current in-memory GateState.
+        """
+        with self._wakeup:
+            self._state = state
+            if self._dirty:
+                return
+            self._dirty = True
+            if self._thread is None:
+                self._closed = False
+                self._thread = threading.Thread(
+                    target=self._run, name="gate-state-checkpointer", daemon=True
+                )
+                self._thread.start()
+            self._wakeup.notify()
+
+    def checkpoint(self, state: Optional[GateState] = None) -> None:
+        """Write the state now.
+
+        Args:
+            state: State to write (default: the last state marked dirty).
+        """
+        with self._lock:
+            if state is not None:
+                self._state = state
+            elif not self._dirty:
+                return
+            snapshot = self._snapshot_locked()
+        if snapshot is not None:
+            self._write(*snapshot)
+
+    def close(self) -> None:
+        """Write any pending state and stop the background thread."""
+        with self._wakeup:
+            self._closed = True
+            thread, self._thread = self._thread, None
+            self._wakeup.notify_all()
+        if thread is not None:
+            thread.join()
+        self.checkpoint()
+
+    def _snapshot_locked(self) -> Optional[Tuple[int, GateState]]:
+        self._dirty = False
+        if self._state is None:
+            return None
+        self._snapshot_seq += 1
+        return self._snapshot_seq, self._state.copy()
+
+    def _write(self, seq: int, snapshot: GateState) -> None:
+        with self._write_lock:
+            if seq <= self._written_seq:
+                return  # A newer snapshot is already on disk
+            try:
+                self._state_manager.save(snapshot)
+                self._written_seq = seq
+            except Exception:
+                # Keep running; the next checkpoint retries
+                with self._lock:
+                    self._dirty = True
+            self._last_write = time.monotonic()
+
+    def _run(self) -> None:
+        while True:
+            with self._wakeup:
+                while not self._dirty and not self._closed:
+                    self._wakeup.wait()
+                if self._closed:
+                    return
+                # Coalesce: wait out the rest of the flush interval
+                delay = self._last_write + self._flush_interval - time.monotonic()
+                if delay > 0:
+                    self._wakeup.wait(delay)
+                    if self._closed:
+                        return
+                snapshot = self._snapshot_locked()
+            if snapshot is not None:
+                self._write(*snapshot)
@@ -3,8 +3,16 @@
 Provides memory consolidation, indexing, compression, and pipeline infrastructure.
 """
 
-from .compression import CompressionResult, MemoryCompressor
+from .columnar import ColumnarMemoryStore
+from .compression import (
+    ClusterCompressionResult,
+    CompressionPlanner,
+    CompressionResult,
+    MemoryCompressor,
+)
 from .consolidation import MemoryConsolidator
+from .dedup import NearDuplicateDetector
+from .emotion_index import DEFAULT_EMOTION_DIMENSIONS, EmotionIndex, EmotionSearchMode
 from .indexing import MemoryIndex
 from .models import (
     LTMMemoryEntry,
@@ -13,7 +21,9 @@ from .models import (
     MemoryType,
     STMMemoryEntry,
 )
-from .pipeline import MemoryPipeline, PipelineStage
+from .pipeline import MemoryPipeline, PipelineBatchResult, PipelineStage
+from .storage import LTMStorage, SQLiteLTMStorage
+from .tagging import DEFAULT_TAG_RULES, TaggingEngine, TagRule
 
 __all__ = [
     # Models
@@ -26,12 +36,26 @@ __all__ = [
     "MemoryConsolidator",
     # Indexing
     "MemoryIndex",
+    "EmotionIndex",
+    "EmotionSearchMode",
+    "DEFAULT_EMOTION_DIMENSIONS",
+    # Storage
+    "ColumnarMemoryStore",
+    "LTMStorage",
+    "SQLiteLTMStorage",
     # Compression
     "MemoryCompressor",
     "CompressionResult",
+    "CompressionPlanner",
+    "ClusterCompressionResult",
     # Pipeline
     "MemoryPipeline",
     "PipelineStage",
+    "PipelineBatchResult",
+    "NearDuplicateDetector",
+    "TaggingEngine",
+    "TagRule",
+    "DEFAULT_TAG_RULES",
 ]
 
 
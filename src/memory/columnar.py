@@ -0,0 +1,556 @@
+"""Compact columnar storage for large long-term memory sets.
+
+A pydantic LTMMemoryEntry costs a few kilobytes once its dicts, lists and
+strings are counted, so millions of memories cost gigabytes. This module
+stores the same data as struct-of-arrays instead:
+
+- Fixed-width columns (`array` module) for timestamp, type, priority,
+  impact_level, xp_yield, source_subsystem and emotional magnitude.
+- Interned strings for tags and source_subsystem (one copy per distinct
+  value); each row's tags are a slice of a flat tag id array.
+- content_summary in a packed UTF-8 arena.
+- All-float emotional vectors as (key id, value) pairs in flat arrays; the
+  rarely used fields (symbolic_links, metadata, emotional vectors with a
+  non-float value) as JSON in a second arena, empty for most rows. Rows
+  whose extras JSON cannot encode keep them as Python objects.
+
+Entries are materialised as LTMMemoryEntry (without validation) only when a
+caller asks for one. Rows are stable: deleting a row leaves a tombstone and
+overwriting appends new arena bytes; `compact()` reclaims the space.
+"""
+
+from __future__ import annotations
+
+from array import array
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..serialization import get_backend
+from .models import LTMMemoryEntry, MemoryPriority, MemoryType
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+_TYPES: Tuple[MemoryType, ...] = tuple(MemoryType)
+_TYPE_CODES = {member: code for code, member in enumerate(_TYPES)}
+_PRIORITIES: Tuple[MemoryPriority, ...] = tuple(MemoryPriority)
+_PRIORITY_CODES = {member: code for code, member in enumerate(_PRIORITIES)}
+
+_NAIVE = -(2 ** 31)  # utc offset sentinel for naive timestamps
+_JSON = get_backend()
+_construct = getattr(LTMMemoryEntry, "model_construct", None) or LTMMemoryEntry.construct
+
+# Numeric columns exposed through `column()`
+_COLUMNS = (
+    "epoch", "type", "priority", "impact_level", "xp_yield", "source", "magnitude", "alive",
+    "flags", "stamp",
+)
+
+# Bits of the `flags` column
+FLAG_COVENANT = 1  # metadata["covenant_relevant"] is truthy
+
+
+class _StringPool:
+    """Interns strings to dense integer ids."""
+
+    __slots__ = ("ids", "values")
+
+    def __init__(self) -> None:
+        self.ids: Dict[str, int] = {}
+        self.values: List[str] = []
+
+    def intern(self, value: str) -> int:
+        string_id = self.ids.get(value)
+        if string_id is None:
+            string_id = self.ids[value] = len(self.values)
+            self.values.append(value)
+        return string_id
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+def emotional_magnitude(vector: Dict[str, Any]) -> float:
+    """Return the normalized L2 norm of an emotional vector, capped at 1.0.
+
+    Same formula as the memory pipeline and compressor.
+    """
+    values = [v for v in vector.values() if isinstance(v, (int, float))]
+    if not values:
+        return 0.0
+    return min(1.0, (sum(v * v for v in values) / len(values)) ** 0.5)
+
+
+class ColumnarMemoryStore:
+    """Struct-of-arrays store of LTM memories keyed by memory_id.
+
+    `len()` and iteration cover live memories; iteration materialises each
+    entry lazily. Row numbers are stable for the life of the store, so
+    other indexes (MemoryIndex dense ids) can use them directly.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self._rows: Dict[str, int] = {}  # memory_id -> row
+        self._memory_ids: List[Optional[str]] = []  # row -> memory_id (None if deleted)
+        self._tags = _StringPool()  # Tags and emotion keys
+        self._sources = _StringPool()
+
+        self._epoch = array("d")
+        self._utcoffset = array("i")
+        self._type = array("B")
+        self._priority = array("B")
+        self._impact = array("b")
+        self._xp = array("d")
+        self._source = array("I")
+        self._magnitude = array("d")
+        self._alive = array("B")
+        self._flags = array("B")
+        self._stamp = array("Q")  # Write counter value of each row's last change
+        self._write_count = 0
+
+        # Tag ids: row -> slice of _tag_data
+        self._tag_start = array("Q")
+        self._tag_count = array("H")
+        self._tag_data = array("I")
+
+        # Float emotional values: row -> slice of _emotion_keys/_emotion_values
+        self._emotion_start = array("Q")
+        self._emotion_count = array("H")
+        self._emotion_keys = array("I")
+        self._emotion_values = array("d")
+
+        # content_summary arena
+        self._text = bytearray()
+        self._text_start = array("Q")
+        self._text_len = array("I")
+
+        # JSON arena for symbolic_links, metadata and non-float emotional vectors
+        self._extra = bytearray()
+        self._extra_start = array("Q")
+        self._extra_len = array("I")
+        self._objects: Dict[int, Dict[str, Any]] = {}  # Rows whose extras cannot be encoded
+
+        self._garbage = 0  # Arena bytes and array slots no longer referenced
+
+    # Size and lookup
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, memory_id: object) -> bool:
+        return memory_id in self._rows
+
+    def __iter__(self) -> Iterator[LTMMemoryEntry]:
+        for row in self.iter_rows():
+            yield self.materialize(row)
+
+    @property
+    def row_count(self) -> int:
+        """Return the number of rows, including deleted ones."""
+        return len(self._memory_ids)
+
+    @property
+    def write_count(self) -> int:
+        """Return the number of row writes and deletes so far.
+
+        Rows whose `stamp` column exceeds an earlier value of this counter
+        have changed since then.
+        """
+        return self._write_count
+
+    def row_of(self, memory_id: str) -> Optional[int]:
+        """Return a memory's row, or None if not stored."""
+        return self._rows.get(memory_id)
+
+    def memory_id_of(self, row: int) -> Optional[str]:
+        """Return a row's memory_id, or None if the row is deleted."""
+        return self._memory_ids[row]
+
+    def iter_rows(self) -> Iterator[int]:
+        """Iterate over live rows in row order."""
+        for row, alive in enumerate(self._alive):
+            if alive:
+                yield row
+
+    def memory_ids_of(self, rows: Iterable[int]) -> List[Optional[str]]:
+        """Return the memory_ids of several rows."""
+        memory_ids = self._memory_ids
+        return [memory_ids[row] for row in rows]
+
+    def tag_substring_mask(self, words: Iterable[str], rows: Iterable[int]):
+        """Flag rows having a tag that contains any of the words.
+
+        Matching is case-insensitive. Each distinct tag is tested once.
+
+        Args:
+            words: Substrings to look for.
+            rows: Rows to test.
+
+        Returns:
+            Boolean array (NumPy if installed, else a list) aligned with rows.
+        """
+        words = [word.lower() for word in words]
+        hits = [any(word in tag.lower() for word in words) for tag in self._tags.values]
+        if np is None:
+            return [
+                any(hits[tag_id] for tag_id in self._tag_data[self._tag_start[row]:
+                                                           self._tag_start[row] + self._tag_count[row]])
+                for row in rows
+            ]
+
+        rows = np.asarray(rows, dtype=np.int64)
+        if not len(rows) or not any(hits):
+            return np.zeros(len(rows), dtype=bool)
+        starts = np.frombuffer(self._tag_start, dtype=np.uint64)[rows].astype(np.int64)
+        counts = np.frombuffer(self._tag_count, dtype=np.uint16)[rows].astype(np.int64)
+        total = int(counts.sum())
+        if not total:
+            return np.zeros(len(rows), dtype=bool)
+        # Position of every tag slot of the selected rows in _tag_data
+        ends = np.cumsum(counts)
+        positions = np.arange(total) + np.repeat(starts - (ends - counts), counts)
+        tag_ids = np.frombuffer(self._tag_data, dtype=np.uint32)[positions]
+        owners = np.repeat(np.arange(len(rows)), counts)
+        hit_rows = np.bincount(owners, weights=np.asarray(hits)[tag_ids], minlength=len(rows))
+        return hit_rows > 0
+
+    def get(self, memory_id: str) -> Optional[LTMMemoryEntry]:
+        """Materialise a memory by ID, or None if not stored."""
+        row = self._rows.get(memory_id)
+        return self.materialize(row) if row is not None else None
+
+    def tags_of(self, row: int) -> List[str]:
+        """Return a row's experience tags without materialising the entry."""
+        start = self._tag_start[row]
+        values = self._tags.values
+        return [values[tag_id] for tag_id in self._tag_data[start:start + self._tag_count[row]]]
+
+    def content_summary_of(self, row: int) -> str:
+        """Return a row's content_summary without materialising the entry."""
+        start = self._text_start[row]
+        return self._text[start:start + self._text_len[row]].decode("utf-8")
+
+    # Writes
+
+    def add(self, memory: LTMMemoryEntry) -> int:
+        """Insert or replace a memory.
+
+        Args:
+            memory: Memory to store.
+
+        Returns:
+            The memory's row.
+        """
+        row = self._rows.get(memory.memory_id)
+        if row is None:
+            row = len(self._memory_ids)
+            self._append_row()
+        else:
+            self._release(row)
+        self._write(row, memory)
+        return row
+
+    def add_many(self, memories: Iterable[LTMMemoryEntry]) -> List[int]:
+        """Insert or replace several memories.
+
+        Returns:
+            Rows, in input order.
+        """
+        return [self.add(memory) for memory in memories]
+
+    def remove(self, memory_id: str) -> None:
+        """Delete a memory, if stored."""
+        row = self._rows.get(memory_id)
+        if row is not None:
+            self._clear(row)
+
+    def write_row(self, row: int, memory: Optional[LTMMemoryEntry]) -> None:
+        """Write (or with None, delete) a specific row.
+
+        Used by MemoryIndex, which allocates rows as its dense ids. Writing
+        one past the last row appends.
+
+        Raises:
+            ValueError: If the memory is already stored in another row.
+        """
+        if row == len(self._memory_ids):
+            if memory is None:
+                raise ValueError("Cannot append an empty row")
+            self._append_row()
+        elif self._alive[row]:
+            if memory is None:
+                self._clear(row)
+                return
+            self._release(row)
+        elif memory is None:
+            return
+        existing = self._rows.get(memory.memory_id)
+        if existing is not None and existing != row:
+            raise ValueError(f"Memory {memory.memory_id} is already stored in row {existing}")
+        self._write(row, memory)
+
+    def compact(self) -> None:
+        """Rewrite the arenas and flat arrays without unreferenced data."""
+        text, extra = bytearray(), bytearray()
+        tag_data, emotion_keys, emotion_values = array("I"), array("I"), array("d")
+        for row in self.iter_rows():
+            start, length = self._text_start[row], self._text_len[row]
+            self._text_start[row] = len(text)
+            text += self._text[start:start + length]
+
+            start, length = self._extra_start[row], self._extra_len[row]
+            self._extra_start[row] = len(extra)
+            extra += self._extra[start:start + length]
+
+            start, count = self._tag_start[row], self._tag_count[row]
+            self._tag_start[row] = len(tag_data)
+            tag_data.extend(self._tag_data[start:start + count])
+
+            start, count = self._emotion_start[row], self._emotion_count[row]
+            self._emotion_start[row] = len(emotion_keys)
+            emotion_keys.extend(self._emotion_keys[start:start + count])
+            emotion_values.extend(self._emotion_values[start:start + count])
+        self._text, self._extra = text, extra
+        self._tag_data, self._emotion_keys, self._emotion_values = tag_data, emotion_keys, emotion_values
+        self._garbage = 0
+
+    # Reads
+
+    def materialize(self, row: int) -> LTMMemoryEntry:
+        """Build the LTMMemoryEntry for a live row (without validation).
+
+        Raises:
+            KeyError: If the row is deleted.
+        """
+        memory_id = self._memory_ids[row]
+        if memory_id is None:
+            raise KeyError(f"Row {row} is deleted")
+
+        offset = self._utcoffset[row]
+        if offset == _NAIVE:
+            timestamp = datetime.fromtimestamp(self._epoch[row])
+        else:
+            tz = timezone.utc if offset == 0 else timezone(timedelta(seconds=offset))
+            timestamp = datetime.fromtimestamp(self._epoch[row], tz)
+
+        extras = self._extras_of(row)
+        names = self._tags.values
+        start = self._emotion_start[row]
+        end = start + self._emotion_count[row]
+        emotions = extras.get("e")
+        if emotions is None:
+            emotions = {
+                names[key]: value
+                for key, value in zip(self._emotion_keys[start:end], self._emotion_values[start:end])
+            }
+        else:
+            emotions = dict(emotions)
+
+        return _construct(
+            memory_id=memory_id,
+            timestamp=timestamp,
+            type=_TYPES[self._type[row]],
+            content_summary=self.content_summary_of(row),
+            emotional_signature_vector=emotions,
+            symbolic_links=list(extras.get("l", [])),
+            experience_tags=self.tags_of(row),
+            xp_yield=self._xp[row],
+            impact_level=self._impact[row],
+            priority=_PRIORITIES[self._priority[row]],
+            source_subsystem=self._sources.values[self._source[row]],
+            metadata=dict(extras.get("m", {})),
+        )
+
+    def column(self, name: str):
+        """Return a copy of a numeric column, indexed by row.
+
+        Args:
+            name: One of epoch, type, priority, impact_level, xp_yield,
+                source, magnitude, alive, flags, stamp.
+
+        Returns:
+            A NumPy array if NumPy is installed, otherwise an `array.array`.
+
+        Raises:
+            KeyError: If the column name is unknown.
+        """
+        if name not in _COLUMNS:
+            raise KeyError(name)
+        values = {
+            "epoch": self._epoch,
+            "type": self._type,
+            "priority": self._priority,
+            "impact_level": self._impact,
+            "xp_yield": self._xp,
+            "source": self._source,
+            "magnitude": self._magnitude,
+            "alive": self._alive,
+            "flags": self._flags,
+            "stamp": self._stamp,
+        }[name]
+        if np is None:
+            return array(values.typecode, values)
+        return np.frombuffer(values, dtype=values.typecode).copy() if len(values) else np.empty(
+            0, dtype=values.typecode
+        )
+
+    @staticmethod
+    def type_code(memory_type: MemoryType) -> int:
+        """Return the `type` column code of a MemoryType."""
+        return _TYPE_CODES[MemoryType(memory_type)]
+
+    @staticmethod
+    def priority_code(priority: MemoryPriority) -> int:
+        """Return the `priority` column code of a MemoryPriority."""
+        return _PRIORITY_CODES[MemoryPriority(priority)]
+
+    def nbytes(self) -> int:
+        """Return the approximate memory footprint of the stored data.
+
+        Counts columns, arenas, interned strings and the memory_id map.
+        """
+        import sys
+
+        arrays = (
+            self._epoch, self._utcoffset, self._type, self._priority, self._impact, self._xp,
+            self._source, self._magnitude, self._alive, self._flags, self._stamp, self._tag_start,
+            self._tag_count, self._tag_data, self._emotion_start, self._emotion_count, self._emotion_keys,
+            self._emotion_values, self._text_start, self._text_len, self._extra_start,
+            self._extra_len,
+        )
+        total = sum(sys.getsizeof(values) for values in arrays)
+        total += sys.getsizeof(self._text) + sys.getsizeof(self._extra)
+        total += sys.getsizeof(self._rows) + sys.getsizeof(self._memory_ids)
+        total += sum(sys.getsizeof(memory_id) for memory_id in self._rows)
+        for pool in (self._tags, self._sources):
+            total += sys.getsizeof(pool.ids) + sys.getsizeof(pool.values)
+            total += sum(sys.getsizeof(value) for value in pool.values)
+        return total
+
+    # Internals
+
+    def _append_row(self) -> None:
+        self._memory_ids.append(None)
+        for values in (
+            self._epoch, self._utcoffset, self._type, self._priority, self._impact, self._xp,
+            self._source, self._magnitude, self._alive, self._flags, self._stamp, self._tag_start,
+            self._tag_count, self._emotion_start, self._emotion_count, self._text_start, self._text_len,
+            self._extra_start, self._extra_len,
+        ):
+            values.append(0)
+
+    def _write(self, row: int, memory: LTMMemoryEntry) -> None:
+        memory_id = memory.memory_id
+        self._rows[memory_id] = row
+        self._memory_ids[row] = memory_id
+        self._alive[row] = 1
+        self._write_count += 1
+        self._stamp[row] = self._write_count
+        self._flags[row] = FLAG_COVENANT if memory.metadata.get("covenant_relevant", False) else 0
+
+        timestamp = memory.timestamp
+        self._epoch[row] = timestamp.timestamp()
+        offset = timestamp.utcoffset()
+        self._utcoffset[row] = _NAIVE if offset is None else int(offset.total_seconds())
+
+        self._type[row] = _TYPE_CODES[MemoryType(memory.type)]
+        self._priority[row] = _PRIORITY_CODES[MemoryPriority(memory.priority)]
+        self._impact[row] = memory.impact_level
+        self._xp[row] = memory.xp_yield
+        self._source[row] = self._sources.intern(memory.source_subsystem)
+        self._magnitude[row] = emotional_magnitude(memory.emotional_signature_vector)
+
+        self._tag_start[row] = len(self._tag_data)
+        self._tag_count[row] = len(memory.experience_tags)
+        self._tag_data.extend(self._tags.intern(tag) for tag in memory.experience_tags)
+
+        extras: Dict[str, Any] = {}
+        emotions = memory.emotional_signature_vector
+        self._emotion_start[row] = len(self._emotion_keys)
+        if all(type(value) is float for value in emotions.values()):
+            self._emotion_keys.extend(self._tags.intern(key) for key in emotions)
+            self._emotion_values.extend(emotions.values())
+            self._emotion_count[row] = len(emotions)
+        else:
+            # Kept whole, so key order survives
+            self._emotion_count[row] = 0
+            extras["e"] = emotions
+        if memory.symbolic_links:
+            extras["l"] = memory.symbolic_links
+        if memory.metadata:
+            extras["m"] = memory.metadata
+
+        encoded = memory.content_summary.encode("utf-8")
+        self._text_start[row] = len(self._text)
+        self._text_len[row] = len(encoded)
+        self._text += encoded
+
+        self._extra_start[row] = len(self._extra)
+        self._extra_len[row] = 0
+        if extras:
+            try:
+                encoded = _JSON.dumps(extras)
+            except (TypeError, ValueError, OverflowError):
+                self._objects[row] = extras
+            else:
+                self._extra_len[row] = len(encoded)
+                self._extra += encoded
+
+    def _extras_of(self, row: int) -> Dict[str, Any]:
+        length = self._extra_len[row]
+        if length:
+            start = self._extra_start[row]
+            return _JSON.loads(bytes(self._extra[start:start + length]))
+        return self._objects.get(row, {})
+
+    def _release(self, row: int) -> None:
+        """Account a row's variable-length data as garbage before rewriting it."""
+        self._garbage += (
+            self._text_len[row] + self._extra_len[row] + self._tag_count[row] + self._emotion_count[row]
+        )
+        self._objects.pop(row, None)
+        memory_id = self._memory_ids[row]
+        if memory_id is not None:
+            self._rows.pop(memory_id, None)
+
+    def _clear(self, row: int) -> None:
+        self._release(row)
+        self._memory_ids[row] = None
+        self._alive[row] = 0
+        self._write_count += 1
+        self._stamp[row] = self._write_count
+        self._flags[row] = 0
+        self._tag_count[row] = 0
+        self._emotion_count[row] = 0
+        self._text_len[row] = 0
+        self._extra_len[row] = 0
+
+
+class ColumnarEntryList:
+    """List-like view of a ColumnarMemoryStore by row.
+
+    Indexing materialises the entry (None for deleted rows); assignment and
+    `append` write rows. MemoryIndex uses this in place of its entry list.
+    """
+
+    __slots__ = ("_store",)
+
+    def __init__(self, store: ColumnarMemoryStore) -> None:
+        self._store = store
+
+    def __len__(self) -> int:
+        return self._store.row_count
+
+    def __getitem__(self, row: int) -> Optional[LTMMemoryEntry]:
+        if self._store.memory_id_of(row) is None:
+            return None
+        return self._store.materialize(row)
+
+    def __setitem__(self, row: int, memory: Optional[LTMMemoryEntry]) -> None:
+        self._store.write_row(row, memory)
+
+    def append(self, memory: LTMMemoryEntry) -> None:
+        self._store.write_row(self._store.row_count, memory)
@@ -7,11 +7,32 @@ Per spec: subsystems/patches/base1.0/memory_compression_patch.md
 
 from __future__ import annotations
 
+import uuid
+from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Union
 
-from .models import LTMMemoryEntry, MemoryPriority
+from ..serialization import codec_for
+from .columnar import FLAG_COVENANT, ColumnarMemoryStore
+from .minhash import LSHIndex, MinHasher, jaccard
+from .models import LTMMemoryEntry, MemoryPriority, MemoryType
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+# Memories with a tag containing one of these are never compressed
+_PRESERVED_TAG_WORDS = ("slepp", "relational", "covenant")
+
+_LTM_CODEC = codec_for(LTMMemoryEntry)
+_PRIORITY_RANK = {priority: rank for rank, priority in enumerate(MemoryPriority)}
+
+# CompressionPlanner row decisions
+_UNDECIDED = 0  # Not evaluated, or newer than the threshold
+_PRESERVED = 1
+_COMPRESSED = 2
 
 
 @dataclass
@@ -25,6 +46,23 @@ class CompressionResult:
     compressed_memory_ids: List[str]
 
 
+@dataclass
+class ClusterCompressionResult:
+    """Result of cluster compression."""
+
+    summaries: List[LTMMemoryEntry]  # One merged entry per cluster
+    summary_ids: Dict[str, str]  # Original memory_id -> summary memory_id
+    preserved_memory_ids: List[str]  # Kept by preservation rules
+    unclustered_memory_ids: List[str]  # Compressible, but untagged or no similar neighbour
+    bytes_before: int  # Encoded size of the clustered originals
+    bytes_after: int  # Encoded size of the summaries
+
+    @property
+    def bytes_saved(self) -> int:
+        """Return the encoded bytes saved by replacing originals with summaries."""
+        return self.bytes_before - self.bytes_after
+
+
 class MemoryCompressor:
     """Compresses old memories using identity-safe rules.
 
@@ -34,7 +72,7 @@ class MemoryCompressor:
 
     def compress_old_memories(
         self,
-        memories: List[LTMMemoryEntry],
+        memories: Union[List[LTMMemoryEntry], ColumnarMemoryStore],
         threshold_date: datetime,
         preservation_rules: Optional[Dict[str, any]] = None,
     ) -> CompressionResult:
@@ -48,13 +86,17 @@ class MemoryCompressor:
         - Covenant-relevant information (never compressed)
 
         Args:
-            memories: List of LTM entries to consider for compression.
+            memories: LTM entries to consider for compression, as a list or a
+                ColumnarMemoryStore (entries are materialised one at a time).
             threshold_date: Memories older than this date are candidates.
             preservation_rules: Optional custom preservation rules.
 
         Returns:
             CompressionResult with statistics.
         """
+        if isinstance(memories, ColumnarMemoryStore):
+            return CompressionPlanner(memories, preservation_rules).plan(threshold_date)
+
         if preservation_rules is None:
             preservation_rules = {}
 
@@ -107,8 +149,7 @@ class MemoryCompressor:
             True if memory should be preserved, False if can be compressed.
         """
         # Check for Slepp-related tags
-        slepp_tags = ["slepp", "relational", "covenant"]
-        if any(tag.lower() in " ".join(memory.experience_tags).lower() for tag in slepp_tags):
+        if any(tag.lower() in " ".join(memory.experience_tags).lower() for tag in _PRESERVED_TAG_WORDS):
             return True
 
         # Check for identity-defining memories (high identity relevance)
@@ -165,20 +206,30 @@ class MemoryCompressor:
     ) -> Dict[str, LTMMemoryEntry]:
         """Compress a batch of memories using specified strategy.
 
-        Phase 6: Basic compression - marks memories for compression.
-        Full compression logic (redundancy removal, semantic clustering) deferred.
+        Phase 6: "conservative" and "aggressive" create simplified versions
+        (summary truncated, detailed emotional vector removed). "cluster"
+        merges similar memories into summary entries (see `cluster_memories`);
+        memories kept by preservation rules, untagged or without a similar
+        neighbour are left out of the result.
 
         Args:
             memories: List of memories to compress.
-            compression_strategy: Compression strategy ("conservative", "aggressive").
+            compression_strategy: Compression strategy ("conservative", "aggressive", "cluster").
 
         Returns:
             Dictionary mapping original memory_id to compressed memory entry.
         """
+        if compression_strategy == "cluster":
+            result = self.cluster_memories(memories)
+            summaries = {summary.memory_id: summary for summary in result.summaries}
+            return {
+                memory_id: summaries[summary_id]
+                for memory_id, summary_id in result.summary_ids.items()
+            }
+
         compressed: Dict[str, LTMMemoryEntry] = {}
 
         # Phase 6: Basic compression - create simplified versions
-        # Full compression (redundancy removal, clustering) deferred to later phases
         for memory in memories:
             # Create compressed version (simplified summary)
             compressed_memory = LTMMemoryEntry(
@@ -199,7 +250,272 @@ class MemoryCompressor:
 
         return compressed
 
+    def cluster_memories(
+        self,
+        memories: List[LTMMemoryEntry],
+        preservation_rules: Optional[Dict[str, any]] = None,
+        time_bucket: timedelta = timedelta(days=7),
+        similarity_threshold: float = 0.5,
+    ) -> ClusterCompressionResult:
+        """Merge clusters of similar memories into summary entries.
+
+        Memories are grouped by type and time bucket; within a group, each
+        memory joins the most similar earlier cluster leader whose tag set
+        has Jaccard similarity >= `similarity_threshold`, or starts a new
+        cluster. Candidate leaders come from a MinHash/LSH index over
+        `experience_tags`, so a group is not compared pairwise. Memories
+        kept by preservation rules are never merged, nor are untagged ones:
+        an empty tag set says nothing about what a memory is about.
+
+        Each cluster of two or more memories becomes one summary entry (see
+        `_merge_cluster`) whose metadata["linked"] lists the originals.
+
+        Args:
+            memories: Memories to compress (typically older than a threshold).
+            preservation_rules: Optional custom preservation rules.
+            time_bucket: Width of the time buckets.
+            similarity_threshold: Minimum tag-set Jaccard similarity to merge.
+
+        Returns:
+            ClusterCompressionResult with summaries, back-references and bytes saved.
+        """
+        if preservation_rules is None:
+            preservation_rules = {}
+        bucket_seconds = time_bucket.total_seconds()
+        hasher = MinHasher(num_perm=32)
+
+        preserved_ids: List[str] = []
+        unclustered_ids: List[str] = []
+        groups: Dict[Tuple[MemoryType, int], List[LTMMemoryEntry]] = {}
+        for memory in memories:
+            if self._should_preserve(memory, preservation_rules):
+                preserved_ids.append(memory.memory_id)
+                continue
+            if not memory.experience_tags:
+                unclustered_ids.append(memory.memory_id)
+                continue
+            bucket = int(memory.timestamp.timestamp() // bucket_seconds)
+            groups.setdefault((memory.type, bucket), []).append(memory)
+
+        clusters: List[List[LTMMemoryEntry]] = []
+        for group in groups.values():
+            group.sort(key=lambda memory: memory.timestamp)
+            lsh = LSHIndex(num_perm=32, bands=8)
+            leader_tags: Dict[int, set] = {}
+            for memory in group:
+                tags = set(memory.experience_tags)
+                signature = hasher.signature(tags)
+                best: Optional[int] = None
+                best_similarity = similarity_threshold
+                for leader in sorted(lsh.query(signature)):
+                    similarity = jaccard(tags, leader_tags[leader])
+                    if similarity >= best_similarity and (best is None or similarity > best_similarity):
+                        best, best_similarity = leader, similarity
+                if best is None:
+                    best = len(clusters)
+                    clusters.append([])
+                    leader_tags[best] = tags
+                    lsh.add(best, signature)
+                clusters[best].append(memory)
+
+        summaries: List[LTMMemoryEntry] = []
+        summary_ids: Dict[str, str] = {}
+        bytes_before = bytes_after = 0
+        for members in clusters:
+            if len(members) < 2:
+                unclustered_ids.append(members[0].memory_id)
+                continue
+            summary = self._merge_cluster(members)
+            summaries.append(summary)
+            bytes_after += len(_LTM_CODEC.encode(summary))
+            for member in members:
+                summary_ids[member.memory_id] = summary.memory_id
+                bytes_before += len(_LTM_CODEC.encode(member))
+
+        return ClusterCompressionResult(
+            summaries=summaries,
+            summary_ids=summary_ids,
+            preserved_memory_ids=preserved_ids,
+            unclustered_memory_ids=unclustered_ids,
+            bytes_before=bytes_before,
+            bytes_after=bytes_after,
+        )
+
+    def _merge_cluster(self, members: List[LTMMemoryEntry]) -> LTMMemoryEntry:
+        """Merge a cluster (sorted by timestamp) into one summary entry.
+
+        Tags and symbolic links are unioned in order, emotional values
+        averaged per key, xp_yield summed, impact_level and priority take
+        the maximum. metadata["linked"] holds the original memory_ids.
+        """
+        member_ids = [member.memory_id for member in members]
+
+        emotion_sums: Dict[str, float] = {}
+        emotion_counts: Counter = Counter()
+        for member in members:
+            for key, value in member.emotional_signature_vector.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    emotion_sums[key] = emotion_sums.get(key, 0.0) + value
+                    emotion_counts[key] += 1
+
+        summaries = list(dict.fromkeys(member.content_summary[:100] for member in members))
+        content = f"[Cluster of {len(members)}] " + " | ".join(summaries[:3])
+        sources = Counter(member.source_subsystem for member in members)
+
+        return LTMMemoryEntry(
+            memory_id=str(uuid.uuid5(uuid.NAMESPACE_URL, "memory-cluster:" + ",".join(member_ids))),
+            timestamp=members[0].timestamp,
+            type=members[0].type,
+            content_summary=content[:500],
+            emotional_signature_vector={
+                key: total / emotion_counts[key] for key, total in emotion_sums.items()
+            },
+            symbolic_links=list(dict.fromkeys(link for m in members for link in m.symbolic_links)),
+            experience_tags=list(dict.fromkeys(tag for m in members for tag in m.experience_tags)),
+            xp_yield=sum(member.xp_yield for member in members),
+            impact_level=max(member.impact_level for member in members),
+            priority=max((member.priority for member in members), key=_PRIORITY_RANK.__getitem__),
+            source_subsystem=sources.most_common(1)[0][0],
+            metadata={
+                "compressed": True,
+                "cluster_size": len(members),
+                "linked": member_ids,
+                "time_range": [members[0].timestamp.isoformat(), members[-1].timestamp.isoformat()],
+            },
+        )
+
+
+class CompressionPlanner:
+    """Incremental compression planning over a ColumnarMemoryStore.
+
+    Evaluates MemoryCompressor's preservation rules as vectorised masks over
+    the store's columns, without materialising entries. The planner keeps
+    each row's decision: a later `plan()` only evaluates rows that crossed
+    the threshold since the previous run or were written since then. An
+    earlier threshold replans from scratch.
+    """
+
+    def __init__(
+        self,
+        store: ColumnarMemoryStore,
+        preservation_rules: Optional[Dict[str, any]] = None,
+    ) -> None:
+        """Initialize planner.
+
+        Args:
+            store: Columnar memory store to plan over.
+            preservation_rules: Optional custom preservation rules.
+        """
+        self._store = store
+        self._rules = dict(preservation_rules or {})
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget previous decisions, so the next plan evaluates every row."""
+        self._decisions = np.zeros(0, dtype=np.uint8) if np is not None else bytearray()
+        self._threshold: Optional[float] = None
+        self._seen_writes = 0
 
+    def plan(self, threshold_date: datetime) -> CompressionResult:
+        """Plan compression of memories older than threshold date.
 
+        Same result as `MemoryCompressor.compress_old_memories` over the
+        store's memories (ids in row order).
 
+        Args:
+            threshold_date: Memories older than this date are candidates.
+
+        Returns:
+            CompressionResult with statistics.
+        """
+        store = self._store
+        threshold = threshold_date.timestamp()
+        replan = self._threshold is None or threshold < self._threshold
+        if np is None:
+            preserved, compressed = self._plan_python(threshold, replan)
+        else:
+            preserved, compressed = self._plan_vectorised(threshold, replan)
+        self._threshold = threshold
+        self._seen_writes = store.write_count
+
+        total = len(preserved) + len(compressed)
+        return CompressionResult(
+            memories_compressed=len(compressed),
+            memories_preserved=len(preserved),
+            compression_ratio=len(compressed) / total if total > 0 else 0.0,
+            preserved_memory_ids=store.memory_ids_of(preserved),
+            compressed_memory_ids=store.memory_ids_of(compressed),
+        )
+
+    def _plan_vectorised(self, threshold: float, replan: bool):
+        store = self._store
+        epoch = store.column("epoch")
+        alive = store.column("alive").astype(bool)
+        decisions = self._decisions
+        if len(decisions) < store.row_count:
+            grown = np.zeros(store.row_count, dtype=np.uint8)
+            grown[: len(decisions)] = decisions
+            decisions = self._decisions = grown
+
+        if replan:
+            decisions[:] = _UNDECIDED
+        else:
+            decisions[store.column("stamp") > self._seen_writes] = _UNDECIDED
+
+        # Only rows not decided yet (newly old, or changed) are evaluated
+        rows = np.flatnonzero((decisions == _UNDECIDED) & alive & (epoch < threshold))
+        if len(rows):
+            impact = store.column("impact_level")[rows]
+            priority = store.column("priority")[rows]
+            flags = store.column("flags")[rows]
+            magnitude = store.column("magnitude")[rows]
+            preserve = (
+                store.tag_substring_mask(_PRESERVED_TAG_WORDS, rows)
+                | (impact >= 5)
+                | (priority == store.priority_code(MemoryPriority.CRITICAL))
+                | ((flags & FLAG_COVENANT) != 0)
+                | (magnitude > 0.8)
+            )
+            if self._rules.get("preserve_all_important", False):
+                preserve |= priority == store.priority_code(MemoryPriority.IMPORTANT)
+            decisions[rows] = np.where(preserve, _PRESERVED, _COMPRESSED)
+
+        compressed_mask = decisions == _COMPRESSED
+        return (
+            np.flatnonzero(alive & ~compressed_mask).tolist(),
+            np.flatnonzero(alive & compressed_mask).tolist(),
+        )
 
+    def _plan_python(self, threshold: float, replan: bool):
+        store = self._store
+        epoch, alive, stamp = store.column("epoch"), store.column("alive"), store.column("stamp")
+        decisions = self._decisions
+        decisions.extend(bytes(store.row_count - len(decisions)))
+
+        rows = []
+        for row in range(store.row_count):
+            if replan or stamp[row] > self._seen_writes:
+                decisions[row] = _UNDECIDED
+            if decisions[row] == _UNDECIDED and alive[row] and epoch[row] < threshold:
+                rows.append(row)
+        if rows:
+            impact, priority = store.column("impact_level"), store.column("priority")
+            flags, magnitude = store.column("flags"), store.column("magnitude")
+            critical = store.priority_code(MemoryPriority.CRITICAL)
+            important = store.priority_code(MemoryPriority.IMPORTANT)
+            preserve_important = self._rules.get("preserve_all_important", False)
+            tag_hits = store.tag_substring_mask(_PRESERVED_TAG_WORDS, rows)
+            for row, tag_hit in zip(rows, tag_hits):
+                preserve = (
+                    tag_hit
+                    or impact[row] >= 5
+                    or priority[row] == critical
+                    or flags[row] & FLAG_COVENANT
+                    or magnitude[row] > 0.8
+                    or (preserve_important and priority[row] == important)
+                )
+                decisions[row] = _PRESERVED if preserve else _COMPRESSED
+
+        preserved = [r for r in range(store.row_count) if alive[r] and decisions[r] != _COMPRESSED]
+        compressed = [r for r in range(store.row_count) if alive[r] and decisions[r] == _COMPRESSED]
+        return preserved, compressed
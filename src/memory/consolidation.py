@@ -15,6 +15,25 @@ if TYPE_CHECKING:
     from ...state.container import StateContainer
 
 
+def payload_content_text(raw_payload: Dict[str, Any]) -> Optional[str]:
+    """Return the text an LTM content summary is built from.
+
+    Args:
+        raw_payload: Raw payload from STM entry.
+
+    Returns:
+        `content_summary`, else `description` (limited to 500 chars), or
+        None if the payload has neither.
+    """
+    if "content_summary" in raw_payload:
+        return str(raw_payload["content_summary"])[:500]  # Limit length
+
+    if "description" in raw_payload:
+        return str(raw_payload["description"])[:500]
+
+    return None
+
+
 class MemoryConsolidator:
     """Consolidates STM entries into structured LTM entries.
 
@@ -204,11 +223,9 @@ class MemoryConsolidator:
             Content summary string.
         """
         # Phase 6: Basic summary extraction
-        if "content_summary" in raw_payload:
-            return str(raw_payload["content_summary"])[:500]  # Limit length
-
-        if "description" in raw_payload:
-            return str(raw_payload["description"])[:500]
+        content = payload_content_text(raw_payload)
+        if content is not None:
+            return content
 
         return f"Memory entry: {raw_payload.get('event_type', 'unknown')}"
 
@@ -0,0 +1,200 @@
+"""Near-duplicate detection for the Phase 6 memory pipeline.
+
+Chatty sessions produce many near-identical STM entries. The detector keeps
+a bounded window of recent consolidated entries as MinHash signatures over
+word shingles of their summary text (the text the consolidator summarises)
+plus the tag set, and reports an earlier entry an incoming one nearly
+duplicates, so the pipeline can merge them instead of consolidating both.
+Entries without summary text are never treated as duplicates: their tags
+alone say nothing about their content.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+
+from .consolidation import payload_content_text
+from .minhash import LSHIndex, MinHasher, jaccard
+from .models import STMMemoryEntry
+
+
+# (epoch, tokens, MinHash signature) of an entry
+_Fingerprint = Tuple[float, FrozenSet[str], Tuple[int, ...]]
+
+
+def shingle_tokens(content: str, tags: Any, size: int = 3) -> FrozenSet[str]:
+    """Return the token set of an entry: word shingles of content, plus tags.
+
+    Args:
+        content: Content summary text.
+        tags: Iterable of tags.
+        size: Words per shingle (shorter texts form one shingle).
+    """
+    words = content.lower().split()
+    tokens = {" ".join(words[i:i + size]) for i in range(max(1, len(words) - size + 1))}
+    tokens.discard("")
+    tokens.update(f"tag:{tag}" for tag in tags)
+    return frozenset(tokens)
+
+
+def merge_duplicate(original: STMMemoryEntry, duplicate: STMMemoryEntry) -> None:
+    """Merge a near-duplicate into the entry it duplicates.
+
+    Tags are unioned (original order first), significance takes the maximum
+    and `duplicate_count` is bumped in the payload and its metadata.
+    """
+    payload = original.raw_payload
+    other = duplicate.raw_payload
+    payload["tags"] = list(dict.fromkeys([*payload.get("tags", []), *other.get("tags", [])]))
+    payload["significance_score"] = max(
+        payload.get("significance_score", 0.0), other.get("significance_score", 0.0)
+    )
+    count = payload.get("duplicate_count", 0) + 1 + other.get("duplicate_count", 0)
+    payload["duplicate_count"] = count
+    metadata = dict(payload.get("metadata", {}))
+    metadata["duplicate_count"] = count
+    payload["metadata"] = metadata
+
+
+class NearDuplicateDetector:
+    """MinHash/LSH near-duplicate detector over a bounded time window.
+
+    Only entries passed to `remember` (after they consolidate) can be
+    matched. Entries older than `window` (relative to the newest entry
+    remembered) and the oldest entries beyond `max_entries` are forgotten,
+    so memory stays bounded. Candidates from the LSH index are confirmed by
+    exact Jaccard similarity of their token sets.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        window: timedelta = timedelta(minutes=30),
+        max_entries: int = 10_000,
+        shingle_size: int = 3,
+        num_perm: int = 64,
+        bands: int = 16,
+    ) -> None:
+        """Initialize detector.
+
+        Args:
+            threshold: Minimum Jaccard similarity to count as a duplicate.
+            window: Maximum time between duplicate entries.
+            max_entries: Maximum number of remembered entries.
+            shingle_size: Words per content shingle.
+            num_perm: MinHash signature length.
+            bands: LSH bands (must divide num_perm).
+        """
+        self._threshold = threshold
+        self._window = window.total_seconds()
+        self._max_entries = max_entries
+        self._shingle_size = shingle_size
+        self._hasher = MinHasher(num_perm=num_perm)
+        self._lsh = LSHIndex(num_perm=num_perm, bands=bands)
+        # memory_id -> (epoch, tokens, entry), oldest first
+        self._recent: "OrderedDict[str, Tuple[float, FrozenSet[str], STMMemoryEntry]]" = OrderedDict()
+        self._newest = float("-inf")
+        self._checked = 0
+        self._duplicates = 0
+        # (memory_id, fingerprint) of the last entry checked, reused by remember()
+        self._last: Optional[Tuple[str, Optional[_Fingerprint]]] = None
+
+    def __len__(self) -> int:
+        return len(self._recent)
+
+    def _fingerprint(self, stm_entry: STMMemoryEntry) -> Optional[_Fingerprint]:
+        """Return (epoch, tokens, signature), or None if the entry has no summary text."""
+        last = self._last
+        if last is not None and last[0] == stm_entry.memory_id:
+            return last[1]
+        payload = stm_entry.raw_payload
+        content = payload_content_text(payload)
+        if not content or not content.split():
+            fingerprint = None
+        else:
+            tokens = shingle_tokens(content, payload.get("tags", []), self._shingle_size)
+            fingerprint = (stm_entry.timestamp.timestamp(), tokens, self._hasher.signature(tokens))
+        self._last = (stm_entry.memory_id, fingerprint)
+        return fingerprint
+
+    def find_duplicate(self, stm_entry: STMMemoryEntry) -> Optional[STMMemoryEntry]:
+        """Return the remembered entry this one nearly duplicates.
+
+        Args:
+            stm_entry: Evaluated STM entry.
+
+        Returns:
+            The earlier entry it duplicates, or None (always None for an
+            entry without summary text).
+        """
+        self._checked += 1
+        fingerprint = self._fingerprint(stm_entry)
+        if fingerprint is None:
+            return None
+        epoch, tokens, signature = fingerprint
+
+        best: Optional[STMMemoryEntry] = None
+        best_similarity = self._threshold
+        for key in self._lsh.query(signature):
+            other_epoch, other_tokens, other = self._recent[key]
+            if abs(epoch - other_epoch) > self._window or key == stm_entry.memory_id:
+                continue
+            similarity = jaccard(tokens, other_tokens)
+            if similarity >= best_similarity and (best is None or similarity > best_similarity):
+                best, best_similarity = other, similarity
+        if best is not None:
+            self._duplicates += 1
+        return best
+
+    def remember(self, stm_entry: STMMemoryEntry) -> None:
+        """Remember a consolidated entry so later entries can match it.
+
+        Entries without summary text are not remembered.
+
+        Args:
+            stm_entry: STM entry that was consolidated into LTM.
+        """
+        fingerprint = self._fingerprint(stm_entry)
+        if fingerprint is None:
+            return
+        epoch, tokens, signature = fingerprint
+        key = stm_entry.memory_id
+        self._recent.pop(key, None)
+        self._recent[key] = (epoch, tokens, stm_entry)
+        self._lsh.add(key, signature)
+        self._newest = max(self._newest, epoch)
+
+        # Forget entries outside the window, then the oldest beyond capacity
+        cutoff = self._newest - self._window
+        while self._recent:
+            oldest, (oldest_epoch, _, _) = next(iter(self._recent.items()))
+            if oldest_epoch >= cutoff and len(self._recent) <= self._max_entries:
+                break
+            del self._recent[oldest]
+            self._lsh.remove(oldest)
+
+    @property
+    def dedup_rate(self) -> float:
+        """Return the fraction of checked entries found to be duplicates."""
+        return self._duplicates / self._checked if self._checked else 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return dedup metrics."""
+        return {
+            "checked": self._checked,
+            "duplicates": self._duplicates,
+            "dedup_rate": self.dedup_rate,
+            "tracked": len(self._recent),
+        }
+
+    def reset(self) -> None:
+        """Forget all remembered entries and metrics."""
+        for key in list(self._recent):
+            self._lsh.remove(key)
+        self._recent.clear()
+        self._newest = float("-inf")
+        self._checked = 0
+        self._duplicates = 0
+        self._last = None
@@ -0,0 +1,270 @@
+"""Emotional similarity index for Phase 6 memory retrieval.
+
+Projects free-form `emotional_signature_vector` dicts onto a fixed dimension
+schema and answers k-nearest-neighbour queries ("memories that felt like
+this") by Euclidean distance.
+
+Vectors live in a contiguous float32 matrix. Search is exact brute force by
+default; IVF mode clusters rows around k-means centroids and only scans the
+lists nearest the query, for large stores. NumPy is used when installed;
+without it the index falls back to exact search over Python lists.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import random
+from enum import Enum
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+# Primary Mood Vector dimensions (subsystem_emotional_engine.md §3)
+DEFAULT_EMOTION_DIMENSIONS: Tuple[str, ...] = ("valence", "arousal", "stability")
+
+
+class EmotionSearchMode(str, Enum):
+    """Nearest-neighbour search strategy."""
+
+    EXACT = "exact"  # Brute force over every vector
+    IVF = "ivf"  # Inverted file: scan the lists of the nearest centroids
+
+
+class EmotionIndex:
+    """k-NN index over projected emotional signature vectors.
+
+    Rows are keyed by dense memory id (as assigned by MemoryIndex). Deleting
+    moves the last row into the freed slot, so the matrix stays contiguous.
+    In IVF mode the centroids are trained once `ivf_min_size` vectors are
+    stored and retrained whenever the store has doubled since training;
+    smaller stores are always searched exactly.
+    """
+
+    def __init__(
+        self,
+        dimensions: Sequence[str] = DEFAULT_EMOTION_DIMENSIONS,
+        mode: EmotionSearchMode = EmotionSearchMode.EXACT,
+        ivf_min_size: int = 10_000,
+        n_probe: int = 8,
+    ) -> None:
+        """Initialize an empty index.
+
+        Args:
+            dimensions: Emotion keys forming the vector schema, in order.
+            mode: EXACT or IVF search.
+            ivf_min_size: Minimum stored vectors before IVF is used.
+            n_probe: Number of nearest IVF lists scanned per query.
+        """
+        self._dimensions = tuple(dimensions)
+        self._mode = EmotionSearchMode(mode)
+        self._ivf_min_size = ivf_min_size
+        self._n_probe = n_probe
+
+        self._size = 0
+        self._slots: Dict[int, int] = {}  # dense id -> row
+        self._row_ids: List[int] = []  # row -> dense id
+        if np is not None:
+            self._matrix = np.empty((16, len(self._dimensions)), dtype=np.float32)
+        else:
+            self._matrix = []
+
+        # IVF state
+        self._centroids = None
+        self._lists: List[Set[int]] = []  # centroid -> rows
+        self._assignment: List[int] = []  # row -> centroid
+        self._trained_size = 0
+
+    @property
+    def dimensions(self) -> Tuple[str, ...]:
+        """Return the vector schema."""
+        return self._dimensions
+
+    def __len__(self) -> int:
+        return self._size
+
+    def project(self, vector: Dict[str, Any]) -> Optional[List[float]]:
+        """Project an emotional vector dict onto the schema.
+
+        Missing or non-numeric dimensions are 0.0.
+
+        Returns:
+            The projected vector, or None if no schema dimension is numeric.
+        """
+        projected = []
+        found = False
+        for dimension in self._dimensions:
+            value = vector.get(dimension)
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                projected.append(float(value))
+                found = True
+            else:
+                projected.append(0.0)
+        return projected if found else None
+
+    def add(self, dense_id: int, vector: Dict[str, Any]) -> None:
+        """Add or replace a memory's vector.
+
+        A vector with no numeric schema dimension removes the memory instead.
+
+        Args:
+            dense_id: Dense memory id.
+            vector: Emotional signature vector.
+        """
+        projected = self.project(vector)
+        if projected is None:
+            self.remove(dense_id)
+            return
+
+        row = self._slots.get(dense_id)
+        if row is not None:
+            self._matrix[row] = projected
+            if self._centroids is not None:
+                self._unassign(row)
+                self._assign(row)
+            return
+
+        row = self._size
+        if np is not None:
+            if row == len(self._matrix):
+                self._matrix = np.resize(self._matrix, (2 * len(self._matrix), len(self._dimensions)))
+            self._matrix[row] = projected
+        else:
+            self._matrix.append(projected)
+        self._slots[dense_id] = row
+        self._row_ids.append(dense_id)
+        self._size += 1
+        if self._centroids is not None:
+            self._assignment.append(-1)
+            self._assign(row)
+
+    def remove(self, dense_id: int) -> None:
+        """Remove a memory's vector, if present."""
+        row = self._slots.pop(dense_id, None)
+        if row is None:
+            return
+        last = self._size - 1
+        if self._centroids is not None:
+            self._unassign(row)
+        if row != last:
+            # Move the last row into the hole to keep the matrix contiguous
+            moved_id = self._row_ids[last]
+            self._matrix[row] = self._matrix[last]
+            self._row_ids[row] = moved_id
+            self._slots[moved_id] = row
+            if self._centroids is not None:
+                centroid = self._assignment[last]
+                self._lists[centroid].discard(last)
+                self._lists[centroid].add(row)
+                self._assignment[row] = centroid
+        self._row_ids.pop()
+        if np is None:
+            self._matrix.pop()
+        if self._centroids is not None:
+            self._assignment.pop()
+        self._size = last
+
+    def search(self, query_vector: Dict[str, Any], k: int = 5) -> List[Tuple[int, float]]:
+        """Find the k nearest stored vectors.
+
+        Args:
+            query_vector: Emotional vector dict to match.
+            k: Number of neighbours.
+
+        Returns:
+            List of (dense id, distance), nearest first.
+        """
+        query = self.project(query_vector)
+        if query is None or k <= 0 or self._size == 0:
+            return []
+        if np is None:
+            return self._search_python(query, k)
+
+        q = np.asarray(query, dtype=np.float32)
+        rows = None
+        if self._mode is EmotionSearchMode.IVF and self._size >= self._ivf_min_size:
+            if self._centroids is None or self._size >= 2 * self._trained_size:
+                self._train()
+            rows = self._probe(q, k)
+
+        matrix = self._matrix[: self._size] if rows is None else self._matrix[rows]
+        diff = matrix - q
+        distances = np.einsum("ij,ij->i", diff, diff)
+        if len(distances) > k:
+            top = np.argpartition(distances, k - 1)[:k]
+        else:
+            top = np.arange(len(distances))
+        top = top[np.argsort(distances[top], kind="stable")]
+        found = top if rows is None else rows[top]
+        return [
+            (self._row_ids[row], float(math.sqrt(distances[i])))
+            for row, i in zip(found.tolist(), top.tolist())
+        ]
+
+    def _search_python(self, query: List[float], k: int) -> List[Tuple[int, float]]:
+        def distance(row: int) -> float:
+            return sum((a - b) ** 2 for a, b in zip(self._matrix[row], query))
+
+        nearest = heapq.nsmallest(k, range(self._size), key=distance)
+        return [(self._row_ids[row], math.sqrt(distance(row))) for row in nearest]
+
+    # IVF
+
+    def _train(self, iterations: int = 10) -> None:
+        """Run k-means over the stored vectors and rebuild the inverted lists."""
+        data = self._matrix[: self._size]
+        n_lists = max(1, int(math.sqrt(self._size)))
+        rng = random.Random(0)
+        centroids = data[rng.sample(range(self._size), n_lists)].copy()
+        sample = data
+        if self._size > 64 * n_lists:
+            sample = data[rng.sample(range(self._size), 64 * n_lists)]
+        for _ in range(iterations):
+            labels = self._nearest_centroids(sample, centroids)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            counts = np.bincount(labels, minlength=n_lists)
+            filled = counts > 0
+            centroids[filled] = sums[filled] / counts[filled, None]
+
+        self._centroids = centroids
+        labels = self._nearest_centroids(data, centroids)
+        self._assignment = labels.tolist()
+        self._lists = [set() for _ in range(n_lists)]
+        for row, centroid in enumerate(self._assignment):
+            self._lists[centroid].add(row)
+        self._trained_size = self._size
+
+    @staticmethod
+    def _nearest_centroids(points, centroids):
+        distances = (
+            np.einsum("ij,ij->i", points, points)[:, None]
+            - 2.0 * points @ centroids.T
+            + np.einsum("ij,ij->i", centroids, centroids)[None, :]
+        )
+        return np.argmin(distances, axis=1)
+
+    def _assign(self, row: int) -> None:
+        centroid = int(self._nearest_centroids(self._matrix[row:row + 1], self._centroids)[0])
+        self._assignment[row] = centroid
+        self._lists[centroid].add(row)
+
+    def _unassign(self, row: int) -> None:
+        self._lists[self._assignment[row]].discard(row)
+
+    def _probe(self, q, k: int):
+        """Return the rows in the IVF lists nearest the query."""
+        diff = self._centroids - q
+        order = np.argsort(np.einsum("ij,ij->i", diff, diff))
+        rows: List[int] = []
+        for centroid in order[: self._n_probe].tolist():
+            rows.extend(self._lists[centroid])
+        # Widen the probe until at least k candidates are found
+        for centroid in order[self._n_probe:].tolist():
+            if len(rows) >= k:
+                break
+            rows.extend(self._lists[centroid])
+        return np.asarray(rows, dtype=np.int64)
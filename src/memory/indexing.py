@@ -7,11 +7,195 @@ Per spec: subsystems/base1.0/subsystem_memory_experience.md
 
 from __future__ import annotations
 
-from collections import defaultdict
-from datetime import datetime
-from typing import Any, Dict, List, Optional
-
+import bisect
+import heapq
+import re
+from collections import OrderedDict
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from .columnar import ColumnarEntryList, ColumnarMemoryStore
+from .emotion_index import EmotionIndex
 from .models import LTMMemoryEntry, MemoryType
+from .semantic_links import SemanticLinkEngine
+from .storage import LTMStorage
+
+# Runs of non-zero bytes in a bitmap
+_NONZERO_RUN = re.compile(rb"[^\x00]+")
+
+# Set bit positions for every byte value
+_BYTE_BITS = [tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256)]
+
+_EMPTY: Set[int] = frozenset()  # type: ignore[assignment]
+
+
+class _Bitmap:
+    """Growable bitmap over dense memory ids.
+
+    Backed by a bytearray so single-bit updates are O(1); queries convert it
+    to a Python int once so AND/OR run at C speed over the whole bitmap.
+    """
+
+    __slots__ = ("_bits", "count")
+
+    def __init__(self) -> None:
+        self._bits = bytearray()
+        self.count = 0
+
+    def add(self, dense_id: int) -> None:
+        byte = dense_id >> 3
+        if byte >= len(self._bits):
+            # Grow geometrically so ingestion stays amortized O(1)
+            self._bits.extend(bytes(max(byte + 1, 2 * len(self._bits)) - len(self._bits)))
+        mask = 1 << (dense_id & 7)
+        if not self._bits[byte] & mask:
+            self._bits[byte] |= mask
+            self.count += 1
+
+    def discard(self, dense_id: int) -> None:
+        byte = dense_id >> 3
+        mask = 1 << (dense_id & 7)
+        if byte < len(self._bits) and self._bits[byte] & mask:
+            self._bits[byte] &= ~mask
+            self.count -= 1
+
+    def to_int(self) -> int:
+        return int.from_bytes(self._bits, "little")
+
+
+def _iter_bits(value: int) -> Iterator[int]:
+    """Yield the positions of set bits in a bitmap int, in ascending order."""
+    data = value.to_bytes((value.bit_length() + 7) // 8, "little")
+    for run in _NONZERO_RUN.finditer(data):
+        base = run.start()
+        for offset, byte in enumerate(run.group()):
+            position = (base + offset) << 3
+            for bit in _BYTE_BITS[byte]:
+                yield position + bit
+
+
+class _TimeIndex:
+    """(epoch, dense id) pairs in timestamp order.
+
+    Stored as bounded sorted chunks with a list of chunk maxima, so an insert
+    is a bisect over chunks plus an insert into one chunk, and range scans
+    bisect to their bounds instead of scanning.
+    """
+
+    _CHUNK = 1024
+
+    def __init__(self) -> None:
+        self._keys: List[List[float]] = []
+        self._ids: List[List[int]] = []
+        self._maxes: List[float] = []
+        self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def add(self, key: float, dense_id: int) -> None:
+        """Insert one pair (after existing pairs with the same key)."""
+        self._len += 1
+        if not self._keys:
+            self._keys.append([key])
+            self._ids.append([dense_id])
+            self._maxes.append(key)
+            return
+        chunk = min(bisect.bisect_right(self._maxes, key), len(self._maxes) - 1)
+        keys = self._keys[chunk]
+        ids = self._ids[chunk]
+        pos = bisect.bisect_right(keys, key)
+        keys.insert(pos, key)
+        ids.insert(pos, dense_id)
+        self._maxes[chunk] = keys[-1]
+        if len(keys) > 2 * self._CHUNK:
+            half = self._CHUNK
+            self._keys[chunk:chunk + 1] = [keys[:half], keys[half:]]
+            self._ids[chunk:chunk + 1] = [ids[:half], ids[half:]]
+            self._maxes[chunk:chunk + 1] = [keys[half - 1], keys[-1]]
+
+    def remove(self, key: float, dense_id: int) -> None:
+        """Remove one pair, if present."""
+        chunk = bisect.bisect_left(self._maxes, key)
+        while chunk < len(self._maxes):
+            keys = self._keys[chunk]
+            ids = self._ids[chunk]
+            pos = bisect.bisect_left(keys, key)
+            while pos < len(keys) and keys[pos] == key:
+                if ids[pos] == dense_id:
+                    del keys[pos]
+                    del ids[pos]
+                    self._len -= 1
+                    if keys:
+                        self._maxes[chunk] = keys[-1]
+                    else:
+                        del self._keys[chunk]
+                        del self._ids[chunk]
+                        del self._maxes[chunk]
+                    return
+                pos += 1
+            if self._maxes[chunk] != key:
+                return
+            chunk += 1
+
+    def merge(self, pairs: List[Tuple[float, int]]) -> None:
+        """Merge a batch of pairs sorted by key.
+
+        A batch that starts at or after the newest entry is appended; a large
+        batch is merged with the existing pairs in one pass; a small batch
+        is inserted pair by pair.
+        """
+        if not pairs:
+            return
+        if self._len and pairs[0][0] < self._maxes[-1]:
+            if len(pairs) * self._CHUNK < self._len:
+                for key, dense_id in pairs:
+                    self.add(key, dense_id)
+                return
+            pairs = list(heapq.merge(self._pairs(), pairs, key=lambda pair: pair[0]))
+            self._keys, self._ids, self._maxes, self._len = [], [], [], 0
+        elif self._keys and len(self._keys[-1]) < self._CHUNK:
+            # Top up the last chunk before starting new ones
+            room = self._CHUNK - len(self._keys[-1])
+            head, pairs = pairs[:room], pairs[room:]
+            self._keys[-1].extend(key for key, _ in head)
+            self._ids[-1].extend(dense_id for _, dense_id in head)
+            self._maxes[-1] = self._keys[-1][-1]
+            self._len += len(head)
+
+        for start in range(0, len(pairs), self._CHUNK):
+            chunk = pairs[start:start + self._CHUNK]
+            self._keys.append([key for key, _ in chunk])
+            self._ids.append([dense_id for _, dense_id in chunk])
+            self._maxes.append(chunk[-1][0])
+            self._len += len(chunk)
+
+    def _pairs(self) -> Iterator[Tuple[float, int]]:
+        for keys, ids in zip(self._keys, self._ids):
+            yield from zip(keys, ids)
+
+    def count(self, low: float, high: float) -> int:
+        """Return the number of pairs with low <= key <= high."""
+        return self._rank(high, right=True) - self._rank(low, right=False)
+
+    def _rank(self, key: float, right: bool) -> int:
+        find = bisect.bisect_right if right else bisect.bisect_left
+        chunk = find(self._maxes, key)
+        if chunk == len(self._maxes):
+            return self._len
+        return sum(len(keys) for keys in self._keys[:chunk]) + find(self._keys[chunk], key)
+
+    def iter_desc(self, low: float, high: float) -> Iterator[int]:
+        """Yield dense ids with low <= key <= high, newest first."""
+        chunk = min(bisect.bisect_right(self._maxes, high), len(self._maxes) - 1)
+        while chunk >= 0:
+            keys = self._keys[chunk]
+            stop = bisect.bisect_right(keys, high)
+            start = bisect.bisect_left(keys, low, 0, stop)
+            yield from reversed(self._ids[chunk][start:stop])
+            if start > 0:
+                return
+            chunk -= 1
 
 
 class MemoryIndex:
@@ -19,42 +203,341 @@ class MemoryIndex:
 
     Per spec: subsystem_memory_experience.md
     Phase 6: Tag-based indexing, time-based indexing, conservative semantic linking.
+
+    Each memory gets a dense integer id. Type, priority and impact level
+    (one bucket per level) are low-cardinality and kept as bitmaps; tags are
+    kept as posting sets of dense ids, and a sorted time index serves time
+    ranges and recency. Queries drive from the cheapest source, test the
+    other filters per candidate and only materialise the final matches.
+
+    With an LTMStorage backend, writes go through to storage and the index
+    acts as a hot cache. If `max_cached` is set, least recently used
+    memories are evicted beyond that size; once anything has been evicted
+    (or storage holds more than was loaded), queries are answered by the
+    storage backend. Emotional similarity and semantic links consider the
+    cached memories only.
+
+    With a ColumnarMemoryStore, indexed entries are held in its compact
+    columns (dense id = store row) and materialised only when returned.
     """
 
-    def __init__(self) -> None:
-        """Initialize empty memory index."""
-        self._memories: Dict[str, LTMMemoryEntry] = {}
-        self._tag_index: Dict[str, List[str]] = defaultdict(list)  # tag -> [memory_ids]
-        self._time_index: List[str] = []  # Sorted list of memory_ids by timestamp
-        self._type_index: Dict[str, List[str]] = defaultdict(list)  # type -> [memory_ids]
+    def __init__(
+        self,
+        emotion_index: Optional[EmotionIndex] = None,
+        storage: Optional[LTMStorage] = None,
+        max_cached: Optional[int] = None,
+        records: Optional[ColumnarMemoryStore] = None,
+    ) -> None:
+        """Initialize memory index.
+
+        With storage, the most recent stored memories (up to `max_cached`)
+        are loaded into the index.
+
+        Args:
+            emotion_index: Optional emotional similarity index (default: exact
+                search over the Primary Mood Vector dimensions).
+            storage: Optional persistent LTM storage backend.
+            max_cached: Optional maximum number of memories held in memory
+                (requires storage).
+            records: Optional empty columnar store to hold the indexed entries
+                compactly instead of as model instances.
+
+        Raises:
+            ValueError: If max_cached is set without storage, or is not positive,
+                or if records is not empty.
+        """
+        if max_cached is not None and (storage is None or max_cached <= 0):
+            raise ValueError("max_cached must be positive and requires a storage backend")
+        if records is not None and records.row_count:
+            raise ValueError("records must be an empty ColumnarMemoryStore")
+        self._dense_ids: Dict[str, int] = {}  # memory_id -> dense id
+        # dense id -> memory (None if evicted)
+        self._entries: Union[List[Optional[LTMMemoryEntry]], ColumnarEntryList] = (
+            ColumnarEntryList(records) if records is not None else []
+        )
+        self._free_ids: List[int] = []  # Dense ids released by eviction
+        self._epochs: List[float] = []  # dense id -> timestamp (epoch seconds)
+        self._tag_postings: Dict[str, Set[int]] = {}  # tag -> {dense ids}
+        self._type_bitmaps: Dict[str, _Bitmap] = {}  # type value -> bitmap
+        self._priority_bitmaps: Dict[str, _Bitmap] = {}  # priority value -> bitmap
+        self._impact_bitmaps: Dict[int, _Bitmap] = {}  # impact level -> bitmap
+        self._time_index = _TimeIndex()  # (epoch, dense id) in timestamp order
+        self._links = SemanticLinkEngine()  # Sparse memory x tag incidence for linking
+        self._emotions = emotion_index or EmotionIndex()
+
+        # Hot cache state
+        self._storage = storage
+        self._max_cached = max_cached
+        self._lru: "OrderedDict[str, None]" = OrderedDict()  # Least recently used first
+        self._complete = True  # Whether every stored memory is in the index
+        if storage is not None:
+            stored = storage.count()
+            if stored:
+                self._cache_memories(islice(storage.iter_recent(), max_cached or stored))
+                self._complete = len(self._dense_ids) >= stored
 
     def index_memory(self, memory: LTMMemoryEntry) -> None:
         """Index a memory entry.
 
+        Re-indexing an existing memory_id replaces its previous postings.
+
         Args:
             memory: Long-term memory entry to index.
         """
-        memory_id = memory.memory_id
+        if self._storage is not None:
+            self._storage.upsert(memory)
+
+        dense_id, previous_epoch = self._store(memory)
+
+        # Index by time (insert sorted)
+        if previous_epoch is not None:
+            self._time_index.remove(previous_epoch, dense_id)
+        self._time_index.add(self._epochs[dense_id], dense_id)
+        self._evict()
 
-        # Store memory
-        self._memories[memory_id] = memory
+    def index_memories(self, memories: Iterable[LTMMemoryEntry]) -> None:
+        """Index a batch of memory entries.
+
+        The batch is sorted by timestamp once and merged into the time index
+        in a single pass, instead of one sorted insert per memory. With
+        storage, the batch is written in batched upserts.
+
+        Args:
+            memories: Long-term memory entries to index.
+        """
+        if self._storage is not None:
+            memories = list(memories)
+            self._storage.upsert_many(memories)
+        self._cache_memories(memories)
+
+    def _cache_memories(self, memories: Iterable[LTMMemoryEntry]) -> None:
+        """Index a batch in memory only (no write-through), then evict."""
+        pending: Dict[int, float] = {}
+        for memory in memories:
+            dense_id, previous_epoch = self._store(memory)
+            if previous_epoch is not None and dense_id not in pending:
+                self._time_index.remove(previous_epoch, dense_id)
+            pending[dense_id] = self._epochs[dense_id]
+        self._time_index.merge(sorted((epoch, dense_id) for dense_id, epoch in pending.items()))
+        self._evict()
+
+    def _touch(self, memory_id: str) -> None:
+        if self._max_cached is not None:
+            self._lru[memory_id] = None
+            self._lru.move_to_end(memory_id)
+
+    def _evict(self) -> None:
+        """Drop least recently used memories beyond `max_cached`."""
+        if self._max_cached is None:
+            return
+        while len(self._dense_ids) > self._max_cached:
+            memory_id, _ = self._lru.popitem(last=False)
+            self._drop(memory_id)
+            self._complete = False
+
+    def _drop(self, memory_id: str) -> None:
+        """Remove a memory from every in-memory structure."""
+        dense_id = self._dense_ids.pop(memory_id)
+        memory = self._entries[dense_id]
+        self._remove_postings(dense_id, memory)
+        self._time_index.remove(self._epochs[dense_id], dense_id)
+        self._links.remove(dense_id)
+        self._emotions.remove(dense_id)
+        self._entries[dense_id] = None
+        self._free_ids.append(dense_id)
+
+    def _store(self, memory: LTMMemoryEntry) -> Tuple[int, Optional[float]]:
+        """Store a memory and update every index except the time index.
+
+        Returns:
+            Tuple of (dense id, previous epoch if the memory was re-indexed).
+        """
+        memory_id = memory.memory_id
+        epoch = memory.timestamp.timestamp()
+
+        previous_epoch: Optional[float] = None
+        dense_id = self._dense_ids.get(memory_id)
+        if dense_id is None:
+            if self._free_ids:
+                dense_id = self._free_ids.pop()
+                self._entries[dense_id] = memory
+                self._epochs[dense_id] = epoch
+            else:
+                dense_id = len(self._entries)
+                self._entries.append(memory)
+                self._epochs.append(epoch)
+            self._dense_ids[memory_id] = dense_id
+        else:
+            previous_epoch = self._epochs[dense_id]
+            self._remove_postings(dense_id, self._entries[dense_id])
+            self._entries[dense_id] = memory
+            self._epochs[dense_id] = epoch
+
+        self._touch(memory_id)
 
         # Index by tags
         for tag in memory.experience_tags:
-            if memory_id not in self._tag_index[tag]:
-                self._tag_index[tag].append(memory_id)
-
-        # Index by type
-        if memory_id not in self._type_index[memory.type.value]:
-            self._type_index[memory.type.value].append(memory_id)
+            postings = self._tag_postings.get(tag)
+            if postings is None:
+                postings = self._tag_postings[tag] = set()
+            postings.add(dense_id)
+
+        # Index by type, priority and impact level
+        self._bitmap_for(self._type_bitmaps, memory.type.value).add(dense_id)
+        self._bitmap_for(self._priority_bitmaps, memory.priority.value).add(dense_id)
+        self._bitmap_for(self._impact_bitmaps, memory.impact_level).add(dense_id)
+        self._links.add(dense_id, memory.experience_tags, epoch)
+        self._emotions.add(dense_id, memory.emotional_signature_vector)
+        return dense_id, previous_epoch
+
+    @staticmethod
+    def _bitmap_for(bitmaps: Dict[Any, _Bitmap], key: Any) -> _Bitmap:
+        bitmap = bitmaps.get(key)
+        if bitmap is None:
+            bitmap = bitmaps[key] = _Bitmap()
+        return bitmap
+
+    def _remove_postings(self, dense_id: int, memory: LTMMemoryEntry) -> None:
+        for tag in memory.experience_tags:
+            postings = self._tag_postings.get(tag)
+            if postings is not None:
+                postings.discard(dense_id)
+                if not postings:
+                    del self._tag_postings[tag]
+        self._type_bitmaps[memory.type.value].discard(dense_id)
+        self._priority_bitmaps[memory.priority.value].discard(dense_id)
+        self._impact_bitmaps[memory.impact_level].discard(dense_id)
+
+    def _filter_bitmap(self, query: Dict[str, Any]) -> Optional[int]:
+        """AND together the type, priority and significance filters.
 
-        # Index by time (insert sorted)
-        if memory_id not in self._time_index:
-            self._time_index.append(memory_id)
-            # Sort by timestamp (most recent first)
-            self._time_index.sort(
-                key=lambda mid: self._memories[mid].timestamp, reverse=True
+        Returns:
+            The combined bitmap, or None if the query has none of these filters.
+        """
+        dimensions: List[Iterable[_Bitmap]] = []
+        if "type" in query:
+            bitmap = self._type_bitmaps.get(query["type"].value)
+            dimensions.append([bitmap] if bitmap is not None else [])
+        if "priority" in query:
+            priority = query["priority"]
+            bitmap = self._priority_bitmaps.get(getattr(priority, "value", priority))
+            dimensions.append([bitmap] if bitmap is not None else [])
+        if "min_significance" in query:
+            # Phase 6: Use impact_level as proxy for significance
+            min_impact = query["min_significance"]
+            dimensions.append(
+                [bitmap for level, bitmap in self._impact_bitmaps.items() if level >= min_impact]
             )
+        if not dimensions:
+            return None
+
+        # Cheapest (smallest) dimension first, so an empty one short-circuits
+        sized = [
+            ([b for b in bitmaps if b.count], sum(b.count for b in bitmaps)) for bitmaps in dimensions
+        ]
+        sized.sort(key=lambda item: item[1])
+        combined: Optional[int] = None
+        for bitmaps, count in sized:
+            if count == 0:
+                return 0
+            value = 0
+            for bitmap in bitmaps:
+                value |= bitmap.to_int()
+            combined = value if combined is None else combined & value
+            if not combined:
+                return 0
+        return combined
+
+    def _tag_candidates(self, query: Dict[str, Any]) -> Optional[Set[int]]:
+        """Resolve the tag filter to a set of dense ids.
+
+        `tag_mode` "any" (default) matches memories with at least one of the
+        tags; "all" requires every tag.
+
+        Returns:
+            Matching dense ids, or None if the query has no tag filter.
+        """
+        if "tags" not in query:
+            return None
+        tag_list = query["tags"]
+        if isinstance(tag_list, str):
+            tag_list = [tag_list]
+        postings = [self._tag_postings.get(tag, _EMPTY) for tag in tag_list]
+        if not postings:
+            return set()
+
+        if query.get("tag_mode", "any") == "all":
+            postings.sort(key=len)
+            result = set(postings[0])
+            for other in postings[1:]:
+                if not result:
+                    break
+                result &= other
+            return result
+
+        if len(postings) == 1:
+            return postings[0]
+        return set().union(*postings)
+
+    def _select(self, query: Dict[str, Any], limit: Optional[int]) -> List[int]:
+        """Return the dense ids matching a query, most recent first."""
+        tag_ids = self._tag_candidates(query)
+        bitmap = self._filter_bitmap(query)
+
+        start_time = query.get("start_time")
+        end_time = query.get("end_time")
+        low = start_time.timestamp() if start_time else float("-inf")
+        high = end_time.timestamp() if end_time else float("inf")
+
+        total = len(self._dense_ids)
+        in_range = self._time_index.count(low, high) if (start_time or end_time) else total
+        if in_range == 0 or tag_ids is not None and not tag_ids or bitmap == 0:
+            return []
+
+        bits: Optional[bytes] = None
+        if bitmap is not None:
+            bits = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little")
+            bitmap_count = bitmap.bit_count()
+        else:
+            bitmap_count = total
+        tag_count = len(tag_ids) if tag_ids is not None else total
+        driver_count = min(tag_count, bitmap_count)
+
+        # Walk the time index newest-first when the time range is the smallest
+        # source, or when matches are dense enough that `limit` hits are found
+        # sooner than materialising every candidate
+        if in_range <= driver_count or (
+            limit is not None and limit > 0 and driver_count * driver_count > limit * total
+        ):
+            candidates: Iterable[int] = self._time_index.iter_desc(low, high)
+            if tag_ids is not None:
+                candidates = (i for i in candidates if i in tag_ids)
+            if bits is not None:
+                size = len(bits)
+                candidates = (i for i in candidates if (i >> 3) < size and bits[i >> 3] >> (i & 7) & 1)
+            if limit is not None and limit > 0:
+                return list(islice(candidates, limit))
+            return list(candidates)
+
+        if tag_ids is not None and tag_count <= bitmap_count:
+            candidates = tag_ids
+            if bits is not None:
+                size = len(bits)
+                candidates = [i for i in candidates if (i >> 3) < size and bits[i >> 3] >> (i & 7) & 1]
+        else:
+            candidates = _iter_bits(bitmap)  # type: ignore[arg-type]
+            if tag_ids is not None:
+                candidates = [i for i in candidates if i in tag_ids]
+
+        # Time range filter
+        epochs = self._epochs
+        if start_time or end_time:
+            candidates = [i for i in candidates if low <= epochs[i] <= high]
+
+        # Sort by timestamp (most recent first)
+        if limit is not None and limit > 0:
+            return heapq.nlargest(limit, candidates, key=epochs.__getitem__)
+        return sorted(candidates, key=epochs.__getitem__, reverse=True)
 
     def query_memories(
         self,
@@ -66,6 +549,7 @@ class MemoryIndex:
         Args:
             query: Query dictionary with keys like:
                 - tags: List of tags to match
+                - tag_mode: "any" (default) or "all" tag semantics
                 - type: MemoryType value
                 - start_time: datetime start
                 - end_time: datetime end
@@ -74,78 +558,18 @@ class MemoryIndex:
             limit: Optional maximum number of results.
 
         Returns:
-            List of matching LTM entries.
+            List of matching LTM entries, most recent first.
         """
-        candidates: Optional[List[str]] = None
-
-        # Filter by tags
-        if "tags" in query:
-            tag_list = query["tags"]
-            if isinstance(tag_list, str):
-                tag_list = [tag_list]
-
-            tag_matches = set()
-            for tag in tag_list:
-                if tag in self._tag_index:
-                    tag_matches.update(self._tag_index[tag])
-
-            if candidates is None:
-                candidates = list(tag_matches)
-            else:
-                candidates = [mid for mid in candidates if mid in tag_matches]
-
-        # Filter by type
-        if "type" in query:
-            mem_type = query["type"]
-            type_matches = set(self._type_index.get(mem_type.value, []))
-
-            if candidates is None:
-                candidates = list(type_matches)
-            else:
-                candidates = [mid for mid in candidates if mid in type_matches]
-
-        # If no filters, start with all memories
-        if candidates is None:
-            candidates = list(self._memories.keys())
-
-        # Apply additional filters
-        results: List[LTMMemoryEntry] = []
-
-        for memory_id in candidates:
-            memory = self._memories.get(memory_id)
-            if not memory:
-                continue
-
-            # Time range filter
-            if "start_time" in query or "end_time" in query:
-                start_time = query.get("start_time")
-                end_time = query.get("end_time")
-                if start_time and memory.timestamp < start_time:
-                    continue
-                if end_time and memory.timestamp > end_time:
-                    continue
-
-            # Significance filter
-            if "min_significance" in query:
-                # Phase 6: Use impact_level as proxy for significance
-                min_impact = query["min_significance"]
-                if memory.impact_level < min_impact:
-                    continue
-
-            # Priority filter
-            if "priority" in query:
-                if memory.priority != query["priority"]:
-                    continue
-
-            results.append(memory)
-
-        # Sort by timestamp (most recent first)
-        results.sort(key=lambda m: m.timestamp, reverse=True)
-
-        # Apply limit
-        if limit is not None and limit > 0:
-            results = results[:limit]
-
+        if not self._complete:
+            results = self._storage.query(query, limit)  # type: ignore[union-attr]
+            if limit is not None and limit > 0:
+                self._cache_memories(results)
+            return results
+
+        entries = self._entries
+        results = [entries[i] for i in self._select(query, limit)]
+        for memory in results:
+            self._touch(memory.memory_id)
         return results
 
     def get_by_tags(self, tags: List[str], limit: Optional[int] = None) -> List[LTMMemoryEntry]:
@@ -192,12 +616,11 @@ class MemoryIndex:
         Returns:
             List of most recent LTM entries.
         """
-        results: List[LTMMemoryEntry] = []
-        for memory_id in self._time_index[:limit]:
-            memory = self._memories.get(memory_id)
-            if memory:
-                results.append(memory)
-        return results
+        if not self._complete:
+            return self.query_memories({}, limit=max(limit, 1)) if limit > 0 else []
+        entries = self._entries
+        recent = self._time_index.iter_desc(float("-inf"), float("inf"))
+        return [entries[i] for i in islice(recent, max(limit, 0))]
 
     def create_semantic_links(
         self, memory_id: str, max_links: int = 5
@@ -205,6 +628,8 @@ class MemoryIndex:
         """Create conservative semantic links to related memories.
 
         Phase 6: Conservative semantic linking based on tag overlap and temporal proximity.
+        A related memory sharing `s` tags scores `s * (s + 1)` if it is within
+        24 hours of this memory, `s * s` otherwise.
 
         Args:
             memory_id: Memory ID to create links for.
@@ -213,56 +638,100 @@ class MemoryIndex:
         Returns:
             List of related memory IDs.
         """
-        memory = self._memories.get(memory_id)
-        if not memory:
+        if memory_id not in self._dense_ids and self.get_memory(memory_id) is None:
+            return []
+        dense_id = self._dense_ids.get(memory_id)
+        if dense_id is None:
             return []
+        entries = self._entries
+        return [entries[i].memory_id for i in self._links.links_for(dense_id, max_links)]
 
-        # Find memories with overlapping tags
-        related_memories: Dict[str, int] = {}  # memory_id -> overlap_score
+    def create_semantic_links_batch(
+        self, memory_ids: List[str], max_links: int = 5
+    ) -> Dict[str, List[str]]:
+        """Create semantic links for several memories at once.
 
-        for tag in memory.experience_tags:
-            for related_id in self._tag_index.get(tag, []):
-                if related_id == memory_id:
-                    continue
-
-                # Calculate overlap score
-                related_mem = self._memories.get(related_id)
-                if not related_mem:
-                    continue
-
-                overlap = len(
-                    set(memory.experience_tags) & set(related_mem.experience_tags)
-                )
-                if overlap > 0:
-                    # Boost score for temporal proximity (within 24 hours)
-                    time_diff = abs(
-                        (memory.timestamp - related_mem.timestamp).total_seconds()
-                    )
-                    if time_diff < 86400:  # 24 hours
-                        overlap += 1
-
-                    related_memories[related_id] = (
-                        related_memories.get(related_id, 0) + overlap
-                    )
-
-        # Sort by score and return top links
-        sorted_links = sorted(
-            related_memories.items(), key=lambda x: x[1], reverse=True
-        )
-        return [mem_id for mem_id, _ in sorted_links[:max_links]]
+        Used after consolidating a batch of new memories; scores are the same
+        as `create_semantic_links`.
 
-    def get_memory(self, memory_id: str) -> Optional[LTMMemoryEntry]:
-        """Get memory by ID.
+        Args:
+            memory_ids: Memory IDs to create links for (unknown IDs are skipped).
+            max_links: Maximum number of links per memory.
+
+        Returns:
+            Mapping of memory ID to related memory IDs.
+        """
+        dense_ids = [self._dense_ids[mid] for mid in memory_ids if mid in self._dense_ids]
+        entries = self._entries
+        return {
+            entries[dense_id].memory_id: [entries[i].memory_id for i in linked]
+            for dense_id, linked in self._links.links_for_batch(dense_ids, max_links).items()
+        }
+
+    def similar_emotion(
+        self, query_vector: Dict[str, Any], k: int = 5
+    ) -> List[LTMMemoryEntry]:
+        """Get memories whose emotional signature is closest to a vector.
 
         Args:
-            memory_id: Memory ID.
+            query_vector: Emotional vector (e.g. {"valence": 0.6, "arousal": 0.2}).
+            k: Maximum number of results.
 
         Returns:
-            LTM entry if found, None otherwise.
+            List of LTM entries, most similar first.
+        """
+        entries = self._entries
+        return [entries[i] for i, _ in self._emotions.search(query_vector, k)]
+
+    def search_text(self, text: str, limit: int = 10) -> List[LTMMemoryEntry]:
+        """Full-text search over memory content summaries.
+
+        Uses the storage backend's full-text index when available; otherwise
+        scans the indexed memories for summaries containing every term
+        (case-insensitive), most recent first.
+
+        Args:
+            text: Search text.
+            limit: Maximum number of results.
+
+        Returns:
+            List of matching LTM entries.
         """
-        return self._memories.get(memory_id)
+        if self._storage is not None:
+            return self._storage.search_text(text, limit)
 
+        terms = text.lower().split()
+        if not terms or limit <= 0:
+            return []
+        entries = self._entries
+        results: List[LTMMemoryEntry] = []
+        for dense_id in self._time_index.iter_desc(float("-inf"), float("inf")):
+            summary = entries[dense_id].content_summary.lower()
+            if all(term in summary for term in terms):
+                results.append(entries[dense_id])
+                if len(results) >= limit:
+                    break
+        return results
 
+    def get_memory(self, memory_id: str) -> Optional[LTMMemoryEntry]:
+        """Get memory by ID.
 
+        With storage, a memory missing from the index is loaded from storage
+        and cached.
 
+        Args:
+            memory_id: Memory ID.
 
+        Returns:
+            LTM entry if found, None otherwise.
+        """
+        dense_id = self._dense_ids.get(memory_id)
+        if dense_id is not None:
+            self._touch(memory_id)
+            return self._entries[dense_id]
+        if self._storage is None or self._complete:
+            return None
+        memory = self._storage.get(memory_id)
+        if memory is not None:
+            self._cache_memories([memory])
+        return memory
@@ -0,0 +1,145 @@
+"""MinHash signatures and LSH banding for Phase 6 memory similarity.
+
+MinHash estimates the Jaccard similarity of token sets (tags, text
+shingles) from short fixed-size signatures; LSH banding finds candidate
+pairs above a similarity threshold without comparing every pair.
+
+Tokens are hashed with CRC-32, so signatures are stable across processes.
+NumPy is used when installed; otherwise signatures are computed in pure
+Python with identical results.
+"""
+
+from __future__ import annotations
+
+import random
+import zlib
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Set, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+_PRIME = (1 << 31) - 1  # Hash universe; a * h + b stays below 2**62
+_EMPTY_SLOT = _PRIME  # Signature value for an empty token set
+
+
+def jaccard(a: Set[Hashable], b: Set[Hashable]) -> float:
+    """Return the exact Jaccard similarity of two sets.
+
+    Two empty sets share nothing, so their similarity is 0.0.
+    """
+    if not a and not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class MinHasher:
+    """Computes MinHash signatures with `num_perm` universal hash functions."""
+
+    def __init__(self, num_perm: int = 32, seed: int = 1) -> None:
+        """Initialize hash functions.
+
+        Args:
+            num_perm: Signature length.
+            seed: Seed for the hash function coefficients.
+        """
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self._a = [rng.randrange(1, _PRIME) for _ in range(num_perm)]
+        self._b = [rng.randrange(0, _PRIME) for _ in range(num_perm)]
+        if np is not None:
+            self._a_array = np.asarray(self._a, dtype=np.uint64)
+            self._b_array = np.asarray(self._b, dtype=np.uint64)
+
+    def signature(self, tokens: Iterable[str]) -> Tuple[int, ...]:
+        """Return the MinHash signature of a token set."""
+        hashes = {zlib.crc32(token.encode("utf-8")) % _PRIME for token in tokens}
+        if not hashes:
+            return (_EMPTY_SLOT,) * self.num_perm
+        if np is not None:
+            values = np.fromiter(hashes, dtype=np.uint64, count=len(hashes))
+            permuted = (values[:, None] * self._a_array + self._b_array) % _PRIME
+            return tuple(permuted.min(axis=0).tolist())
+        return tuple(
+            min((a * h + b) % _PRIME for h in hashes) for a, b in zip(self._a, self._b)
+        )
+
+
+def estimate_jaccard(a: Sequence[int], b: Sequence[int]) -> float:
+    """Estimate Jaccard similarity from two MinHash signatures."""
+    return sum(x == y for x, y in zip(a, b)) / len(a) if a else 0.0
+
+
+class LSHIndex:
+    """Banded LSH index over MinHash signatures.
+
+    A signature of `bands * rows` values is cut into `bands` bands; two keys
+    are candidates if any band matches exactly. With b bands of r rows, pairs
+    of similarity s collide with probability 1 - (1 - s**r)**b, a threshold
+    near (1/b)**(1/r).
+    """
+
+    def __init__(self, num_perm: int = 32, bands: int = 8) -> None:
+        """Initialize an empty index.
+
+        Args:
+            num_perm: Signature length.
+            bands: Number of bands (must divide num_perm).
+
+        Raises:
+            ValueError: If bands does not divide num_perm.
+        """
+        if bands <= 0 or num_perm % bands:
+            raise ValueError(f"bands ({bands}) must divide num_perm ({num_perm})")
+        self._rows = num_perm // bands
+        self._bands = bands
+        self._buckets: List[Dict[Tuple[int, ...], Set[Hashable]]] = [{} for _ in range(bands)]
+        self._signatures: Dict[Hashable, Tuple[int, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._signatures
+
+    def _band_keys(self, signature: Sequence[int]) -> List[Tuple[int, ...]]:
+        rows = self._rows
+        return [tuple(signature[band * rows:(band + 1) * rows]) for band in range(self._bands)]
+
+    def add(self, key: Hashable, signature: Sequence[int]) -> None:
+        """Add (or replace) a key's signature."""
+        if key in self._signatures:
+            self.remove(key)
+        signature = tuple(signature)
+        self._signatures[key] = signature
+        for buckets, band_key in zip(self._buckets, self._band_keys(signature)):
+            members = buckets.get(band_key)
+            if members is None:
+                members = buckets[band_key] = set()
+            members.add(key)
+
+    def remove(self, key: Hashable) -> None:
+        """Remove a key, if present."""
+        signature = self._signatures.pop(key, None)
+        if signature is None:
+            return
+        for buckets, band_key in zip(self._buckets, self._band_keys(signature)):
+            members = buckets.get(band_key)
+            if members is not None:
+                members.discard(key)
+                if not members:
+                    del buckets[band_key]
+
+    def query(self, signature: Sequence[int]) -> Set[Hashable]:
+        """Return keys sharing at least one band with a signature."""
+        candidates: Set[Hashable] = set()
+        for buckets, band_key in zip(self._buckets, self._band_keys(signature)):
+            members = buckets.get(band_key)
+            if members:
+                candidates |= members
+        return candidates
+
+    def signature_of(self, key: Hashable) -> Optional[Tuple[int, ...]]:
+        """Return a key's stored signature, or None."""
+        return self._signatures.get(key)
@@ -1,18 +1,28 @@
 """Memory pipeline for Phase 6.
 
-5-stage pipeline: CAPTURE → TAG → EVALUATE → CONSOLIDATE → INTEGRATE
+5-stage pipeline: CAPTURE → TAG → EVALUATE → CONSOLIDATE → INTEGRATE,
+with an optional DEDUPLICATE step between EVALUATE and CONSOLIDATE.
 
 Per spec: subsystems/base1.0/subsystem_memory_experience.md §7
 """
 
 from __future__ import annotations
 
+import time
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Sequence, TYPE_CHECKING
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
 
 from .consolidation import MemoryConsolidator
+from .dedup import NearDuplicateDetector, merge_duplicate
 from .indexing import MemoryIndex
 from .models import LTMMemoryEntry, MemoryObject, STMMemoryEntry
+from .tagging import TaggingEngine
 
 if TYPE_CHECKING:
     from ...state.container import StateContainer
@@ -24,10 +34,33 @@ class PipelineStage(str, Enum):
     CAPTURE = "capture"
     TAG = "tag"
     EVALUATE = "evaluate"
+    DEDUPLICATE = "deduplicate"
     CONSOLIDATE = "consolidate"
     INTEGRATE = "integrate"
 
 
+# Entries scoring below this significance are discarded after EVALUATE
+MIN_SIGNIFICANCE = 0.1
+
+
+@dataclass
+class PipelineBatchResult:
+    """Result of processing a batch of STM entries."""
+
+    entries: List[Optional[LTMMemoryEntry]]  # Per input entry, None if discarded
+    processed: int = 0
+    consolidated: int = 0
+    discarded_low_significance: int = 0
+    discarded_safety: int = 0
+    discarded_duplicates: int = 0  # Merged into an earlier near-duplicate
+    stage_seconds: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def consolidated_entries(self) -> List[LTMMemoryEntry]:
+        """Return the consolidated entries, in input order."""
+        return [entry for entry in self.entries if entry is not None]
+
+
 class MemoryPipeline:
     """Executes 5-stage memory processing pipeline.
 
@@ -37,22 +70,33 @@ class MemoryPipeline:
     Stage 3: EVALUATE - Significance scoring
     Stage 4: CONSOLIDATE - Normalization, structure conversion, safety checks
     Stage 5: INTEGRATE - Connection to Experience System, XP engine, learning system
+
+    With a NearDuplicateDetector, entries that nearly duplicate a recent
+    entry that consolidated are merged into it after EVALUATE instead of
+    being consolidated separately; an already indexed original is
+    re-consolidated and re-indexed with the merged payload.
     """
 
     def __init__(
         self,
         state_container: Optional["StateContainer"] = None,
         index: Optional[MemoryIndex] = None,
+        deduplicator: Optional[NearDuplicateDetector] = None,
+        tagger: Optional[TaggingEngine] = None,
     ) -> None:
         """Initialize memory pipeline.
 
         Args:
             state_container: Optional state container for storage.
             index: Optional memory index for retrieval.
+            deduplicator: Optional near-duplicate detector (enables DEDUPLICATE).
+            tagger: Optional tagging engine (default: DEFAULT_TAG_RULES).
         """
         self._state_container = state_container
         self._consolidator = MemoryConsolidator(state_container)
         self._index = index or MemoryIndex()
+        self._deduplicator = deduplicator
+        self._tagger = tagger or TaggingEngine()
 
     def process_stm_entry(
         self, stm_entry: STMMemoryEntry, dry_run: bool = False
@@ -76,13 +120,26 @@ class MemoryPipeline:
         evaluated_entry = self._evaluate(tagged_entry)
 
         # If significance too low, discard
-        if evaluated_entry.raw_payload.get("significance_score", 0.0) < 0.1:
+        if evaluated_entry.raw_payload.get("significance_score", 0.0) < MIN_SIGNIFICANCE:
             return None
 
+        # DEDUPLICATE: merge into a recent near-duplicate, if any
+        if self._deduplicator is not None:
+            original = self._deduplicator.find_duplicate(evaluated_entry)
+            if original is not None:
+                merge_duplicate(original, evaluated_entry)
+                if not dry_run:
+                    refreshed = self._reconsolidate(original)
+                    if refreshed is not None:
+                        self._index.index_memory(refreshed)
+                return None
+
         # Stage 4: CONSOLIDATE
         ltm_entry = self._consolidator.consolidate_stm_to_ltm(evaluated_entry)
         if not ltm_entry:
             return None
+        if self._deduplicator is not None:
+            self._deduplicator.remember(evaluated_entry)
 
         # Stage 5: INTEGRATE (index the memory)
         # In dry_run mode, skip persistence
@@ -94,11 +151,106 @@ class MemoryPipeline:
 
         return ltm_entry
 
+    def process_batch(
+        self,
+        stm_entries: Sequence[STMMemoryEntry],
+        dry_run: bool = False,
+    ) -> PipelineBatchResult:
+        """Process a batch of STM entries through the pipeline.
+
+        Produces the same entries as calling `process_stm_entry` on each,
+        but evaluates significance for the whole batch at once and indexes
+        the survivors with one bulk insert.
+
+        Args:
+            stm_entries: Short-term memory entries to process.
+            dry_run: If True, process through all stages but skip final persistence.
+
+        Returns:
+            PipelineBatchResult with per-entry results, discard counts and
+            per-stage timings.
+        """
+        result = PipelineBatchResult(entries=[None] * len(stm_entries), processed=len(stm_entries))
+        timings = result.stage_seconds
+
+        # Stage 2: TAG
+        started = time.perf_counter()
+        tagged = self._tagger.tag_batch(stm_entries)
+        timings[PipelineStage.TAG.value] = time.perf_counter() - started
+
+        # Stage 3: EVALUATE
+        started = time.perf_counter()
+        self._evaluate_batch(tagged)
+        survivors = [
+            position
+            for position, stm_entry in enumerate(tagged)
+            if stm_entry.raw_payload.get("significance_score", 0.0) >= MIN_SIGNIFICANCE
+        ]
+        result.discarded_low_significance = len(tagged) - len(survivors)
+        timings[PipelineStage.EVALUATE.value] = time.perf_counter() - started
+
+        # Stage 4: CONSOLIDATE
+        started = time.perf_counter()
+        pending = [tagged[position] for position in survivors]
+        consolidate = self._consolidator.consolidate_stm_to_ltm
+        consolidated = [consolidate(stm_entry) for stm_entry in pending]
+        timings[PipelineStage.CONSOLIDATE.value] = time.perf_counter() - started
+
+        # DEDUPLICATE: in input order, as process_stm_entry would; only
+        # entries that consolidated are remembered as originals. Duplicates
+        # were consolidated with the rest of the batch; their results are
+        # dropped here.
+        refreshed: List[LTMMemoryEntry] = []
+        if self._deduplicator is not None:
+            started = time.perf_counter()
+            in_batch: Dict[str, int] = {}  # memory_id -> position of originals from this batch
+            merged: Dict[str, STMMemoryEntry] = {}
+            for index, (position, ltm_entry) in enumerate(zip(survivors, consolidated)):
+                stm_entry = tagged[position]
+                original = self._deduplicator.find_duplicate(stm_entry)
+                if original is not None:
+                    merge_duplicate(original, stm_entry)
+                    merged[original.memory_id] = original
+                    consolidated[index] = None
+                    result.discarded_duplicates += 1
+                elif ltm_entry is not None:
+                    self._deduplicator.remember(stm_entry)
+                    in_batch[stm_entry.memory_id] = index
+            for memory_id, original in merged.items():
+                if memory_id in in_batch:
+                    consolidated[in_batch[memory_id]] = consolidate(original)
+                elif not dry_run:
+                    ltm_entry = self._reconsolidate(original)
+                    if ltm_entry is not None:
+                        refreshed.append(ltm_entry)
+            timings[PipelineStage.DEDUPLICATE.value] = time.perf_counter() - started
+
+        for position, ltm_entry in zip(survivors, consolidated):
+            result.entries[position] = ltm_entry
+        kept = [ltm_entry for ltm_entry in consolidated if ltm_entry is not None]
+        result.consolidated = len(kept)
+        result.discarded_safety = len(pending) - len(kept) - result.discarded_duplicates
+
+        # Stage 5: INTEGRATE (one bulk index insert)
+        started = time.perf_counter()
+        if not dry_run and (kept or refreshed):
+            self._index.index_memories(kept + refreshed)
+        timings[PipelineStage.INTEGRATE.value] = time.perf_counter() - started
+
+        return result
+
+    def _reconsolidate(self, original: STMMemoryEntry) -> Optional[LTMMemoryEntry]:
+        """Re-consolidate a merged original if it is already indexed."""
+        if self._index.get_memory(original.memory_id) is None:
+            return None
+        return self._consolidator.consolidate_stm_to_ltm(original)
+
     def _tag(self, stm_entry: STMMemoryEntry) -> STMMemoryEntry:
         """Stage 2: TAG - Assign tags to memory entry.
 
         Per spec: subsystem_memory_experience.md §7.2
         Tags: emotional, thematic, relational, narrative, priority, drift-sensitivity
+        (assigned by the pipeline's TaggingEngine).
 
         Args:
             stm_entry: STM entry to tag.
@@ -106,52 +258,7 @@ class MemoryPipeline:
         Returns:
             Tagged STM entry (tags added to raw_payload).
         """
-        tags = stm_entry.raw_payload.get("tags", [])
-
-        # Extract emotional tags
-        if stm_entry.emotional_hint:
-            tags.append("emotional")
-            # Add specific emotional tags if present
-            for key in stm_entry.emotional_hint.keys():
-                if key not in tags:
-                    tags.append(f"emotional_{key}")
-
-        # Extract thematic tags from event type
-        event_type = stm_entry.raw_payload.get("event_type", "").lower()
-        if "goal" in event_type:
-            tags.append("goal")
-        if "debate" in event_type:
-            tags.append("debate")
-        if "interaction" in event_type:
-            tags.append("interaction")
-
-        # Relational tags (check for Slepp mentions)
-        content = str(stm_entry.raw_payload.get("content_summary", "")).lower()
-        if "slepp" in content:
-            tags.append("relational")
-            tags.append("slepp")
-
-        # Narrative tags (basic - full narrative tagging deferred)
-        significance = stm_entry.raw_payload.get("significance_score", 0.0)
-        if significance > 0.7:
-            tags.append("narrative_significant")
-
-        # Priority tags
-        if significance > 0.8:
-            tags.append("priority_high")
-        elif significance > 0.5:
-            tags.append("priority_medium")
-        else:
-            tags.append("priority_low")
-
-        # Drift-sensitivity tags (basic)
-        if stm_entry.raw_payload.get("identity_relevance_score", 0.0) > 0.5:
-            tags.append("drift_sensitive")
-
-        # Update payload with tags
-        stm_entry.raw_payload["tags"] = list(set(tags))  # Remove duplicates
-
-        return stm_entry
+        return self._tagger.tag(stm_entry)
 
     def _evaluate(self, stm_entry: STMMemoryEntry) -> STMMemoryEntry:
         """Stage 3: EVALUATE - Score memory significance.
@@ -209,6 +316,54 @@ class MemoryPipeline:
 
         return stm_entry
 
+    def _evaluate_batch(self, stm_entries: List[STMMemoryEntry]) -> None:
+        """Stage 3 for a batch: same scores as `_evaluate`, computed as arrays.
+
+        Args:
+            stm_entries: Tagged STM entries to evaluate (updated in place).
+        """
+        if np is None or not stm_entries:
+            for stm_entry in stm_entries:
+                self._evaluate(stm_entry)
+            return
+
+        count = len(stm_entries)
+        owners: List[int] = []  # Entry position per emotional value
+        values: List[float] = []
+        trace_lengths = np.zeros(count)
+        has_trace = np.zeros(count, dtype=bool)
+        identity = np.zeros(count)
+        for position, stm_entry in enumerate(stm_entries):
+            if stm_entry.emotional_hint:
+                for value in stm_entry.emotional_hint.values():
+                    if isinstance(value, (int, float)):
+                        owners.append(position)
+                        values.append(value)
+            cognitive_trace = stm_entry.raw_payload.get("cognitive_trace", {})
+            if cognitive_trace:
+                has_trace[position] = True
+                trace_lengths[position] = len(str(cognitive_trace))
+            identity[position] = stm_entry.raw_payload.get("identity_relevance_score", 0.0)
+
+        # Emotional significance: normalized L2 norm, capped at 1.0
+        owner_array = np.asarray(owners, dtype=np.int64)
+        value_array = np.asarray(values, dtype=np.float64)
+        sum_sq = np.bincount(owner_array, weights=value_array * value_array, minlength=count)
+        value_counts = np.bincount(owner_array, minlength=count)
+        emotional = np.zeros(count)
+        nonzero = value_counts > 0
+        emotional[nonzero] = np.minimum(1.0, np.sqrt(sum_sq[nonzero] / value_counts[nonzero]))
+
+        cognitive = np.where(has_trace, np.minimum(1.0, trace_lengths / 1000.0), 0.3)
+        significance = np.clip(emotional * 0.4 + cognitive * 0.3 + identity * 0.3, 0.0, 1.0)
+
+        for position, stm_entry in enumerate(stm_entries):
+            payload = stm_entry.raw_payload
+            payload["significance_score"] = float(significance[position])
+            payload["emotional_significance"] = float(emotional[position])
+            payload["cognitive_significance"] = float(cognitive[position])
+            payload["identity_relevance_score"] = payload.get("identity_relevance_score", 0.0)
+
     def _calculate_emotional_magnitude(self, emotional_vector: Dict[str, Any]) -> float:
         """Calculate magnitude of emotional vector.
 
@@ -235,6 +390,15 @@ class MemoryPipeline:
         """Return the memory index."""
         return self._index
 
+    def get_dedup_stats(self) -> Dict[str, Any]:
+        """Return near-duplicate metrics (checked, duplicates, dedup_rate, tracked).
+
+        Empty if deduplication is not enabled.
+        """
+        if self._deduplicator is None:
+            return {}
+        return self._deduplicator.get_stats()
+
 
 
 
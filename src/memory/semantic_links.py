@@ -0,0 +1,212 @@
+"""Semantic link scoring for Phase 6 memory indexing.
+
+Keeps a sparse memory x tag incidence matrix and scores tag overlap for one
+memory or a batch with sparse products instead of per-pair set intersections.
+
+Scores match MemoryIndex's conservative linking rule: a related memory
+sharing `s` tags scores `s * (s + bonus)`, where `bonus` is 1 within the
+temporal proximity window (24 hours) and 0 otherwise.
+
+NumPy is used when installed (SciPy additionally for batch products);
+otherwise a pure-Python fallback computes the same scores.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+try:
+    from scipy import sparse
+except ImportError:  # pragma: no cover - optional dependency
+    sparse = None
+
+
+class _Column:
+    """Growable int array of dense memory ids for one tag."""
+
+    __slots__ = ("data", "size")
+
+    def __init__(self) -> None:
+        self.data = np.empty(8, dtype=np.int64) if np is not None else []
+        self.size = 0
+
+    def append(self, dense_id: int) -> None:
+        if np is None:
+            self.data.append(dense_id)
+        else:
+            if self.size == len(self.data):
+                self.data = np.resize(self.data, 2 * len(self.data))
+            self.data[self.size] = dense_id
+        self.size += 1
+
+    def remove(self, dense_id: int) -> None:
+        if np is None:
+            self.data.remove(dense_id)
+        else:
+            live = self.data[: self.size]
+            positions = np.flatnonzero(live == dense_id)
+            if not len(positions):
+                return
+            pos = positions[0]
+            live[pos:-1] = live[pos + 1:].copy()
+        self.size -= 1
+
+    def view(self):
+        return self.data[: self.size]
+
+
+class SemanticLinkEngine:
+    """Tag-overlap link scoring over a sparse memory x tag incidence matrix.
+
+    Rows are dense memory ids (as assigned by MemoryIndex), columns are tag
+    ids. Each tag column is stored as an id array, so the overlap vector for
+    one memory (the sparse mat-vec A . a_q) is a bincount over its tags'
+    columns. Batches use a SciPy sparse product when SciPy is installed.
+    """
+
+    def __init__(self, proximity_seconds: float = 86400.0) -> None:
+        """Initialize an empty engine.
+
+        Args:
+            proximity_seconds: Window for the temporal proximity bonus.
+        """
+        self._proximity = proximity_seconds
+        self._tag_ids: Dict[str, int] = {}
+        self._columns: List[_Column] = []
+        self._rows: List[Optional[Tuple[int, ...]]] = []  # dense id -> tag ids
+        self._epochs = np.empty(0, dtype=np.float64) if np is not None else []
+        self._matrix = None  # Cached CSR incidence matrix for batch products
+
+    def add(self, dense_id: int, tags: Sequence[str], epoch: float) -> None:
+        """Add (or replace) a memory's row.
+
+        Args:
+            dense_id: Dense memory id.
+            tags: The memory's experience tags.
+            epoch: The memory's timestamp in epoch seconds.
+        """
+        if dense_id < len(self._rows) and self._rows[dense_id] is not None:
+            self.remove(dense_id)
+
+        row = []
+        for tag in dict.fromkeys(tags):
+            tag_id = self._tag_ids.get(tag)
+            if tag_id is None:
+                tag_id = self._tag_ids[tag] = len(self._columns)
+                self._columns.append(_Column())
+            self._columns[tag_id].append(dense_id)
+            row.append(tag_id)
+
+        if dense_id >= len(self._rows):
+            self._rows.extend([None] * (dense_id + 1 - len(self._rows)))
+            if np is not None:
+                if dense_id >= len(self._epochs):
+                    self._epochs = np.resize(self._epochs, max(dense_id + 1, 2 * len(self._epochs)))
+            else:
+                self._epochs.extend([0.0] * (dense_id + 1 - len(self._epochs)))
+        self._rows[dense_id] = tuple(row)
+        self._epochs[dense_id] = epoch
+        self._matrix = None
+
+    def remove(self, dense_id: int) -> None:
+        """Remove a memory's row."""
+        if dense_id >= len(self._rows) or self._rows[dense_id] is None:
+            return
+        for tag_id in self._rows[dense_id]:
+            self._columns[tag_id].remove(dense_id)
+        self._rows[dense_id] = None
+        self._matrix = None
+
+    def links_for(self, dense_id: int, max_links: int = 5) -> List[int]:
+        """Return the dense ids of the best-linked memories, best first.
+
+        Args:
+            dense_id: Dense id of the memory to link.
+            max_links: Maximum number of links.
+        """
+        if dense_id >= len(self._rows) or not self._rows[dense_id] or max_links <= 0:
+            return []
+        if np is None:
+            return self._links_python(dense_id, max_links)
+
+        columns = [self._columns[tag_id].view() for tag_id in self._rows[dense_id]]
+        shared = np.bincount(np.concatenate(columns))
+        related = np.flatnonzero(shared)
+        return self._top_k(dense_id, related, shared[related], max_links)
+
+    def links_for_batch(self, dense_ids: Sequence[int], max_links: int = 5) -> Dict[int, List[int]]:
+        """Return links for several memories at once.
+
+        Args:
+            dense_ids: Dense ids of the memories to link.
+            max_links: Maximum number of links per memory.
+
+        Returns:
+            Mapping of dense id to linked dense ids, best first.
+        """
+        if np is None or sparse is None or len(dense_ids) < 2:
+            return {dense_id: self.links_for(dense_id, max_links) for dense_id in dense_ids}
+
+        matrix = self._incidence_matrix()
+        batch = matrix[np.asarray(dense_ids, dtype=np.int64)]
+        overlaps = (batch @ matrix.T).tocsr()
+        results: Dict[int, List[int]] = {}
+        for row, dense_id in enumerate(dense_ids):
+            start, end = overlaps.indptr[row], overlaps.indptr[row + 1]
+            if max_links <= 0 or not self._rows[dense_id]:
+                results[dense_id] = []
+                continue
+            results[dense_id] = self._top_k(
+                dense_id, overlaps.indices[start:end], overlaps.data[start:end], max_links
+            )
+        return results
+
+    def _top_k(self, dense_id: int, related, shared, max_links: int) -> List[int]:
+        """Score related memories and return the top `max_links`, best first."""
+        keep = related != dense_id
+        related = related[keep]
+        if not len(related):
+            return []
+        shared = shared[keep].astype(np.float64)
+        near = np.abs(self._epochs[related] - self._epochs[dense_id]) < self._proximity
+        scores = shared * (shared + near)
+
+        if len(scores) > max_links:
+            top = np.argpartition(-scores, max_links - 1)[:max_links]
+        else:
+            top = np.arange(len(scores))
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return related[top].tolist()
+
+    def _incidence_matrix(self):
+        if self._matrix is None:
+            indptr = [0]
+            indices: List[int] = []
+            for row in self._rows:
+                if row:
+                    indices.extend(row)
+                indptr.append(len(indices))
+            data = np.ones(len(indices), dtype=np.float64)
+            self._matrix = sparse.csr_matrix(
+                (data, np.asarray(indices, dtype=np.int64), np.asarray(indptr, dtype=np.int64)),
+                shape=(len(self._rows), len(self._columns)),
+            )
+        return self._matrix
+
+    def _links_python(self, dense_id: int, max_links: int) -> List[int]:
+        shared: Counter = Counter()
+        for tag_id in self._rows[dense_id]:
+            shared.update(self._columns[tag_id].view())
+        shared.pop(dense_id, None)
+        epoch = self._epochs[dense_id]
+        scores = {
+            related: count * (count + (abs(self._epochs[related] - epoch) < self._proximity))
+            for related, count in shared.items()
+        }
+        return sorted(scores, key=scores.__getitem__, reverse=True)[:max_links]
@@ -0,0 +1,363 @@
+"""Persistent long-term memory storage for Phase 6.
+
+Provides the LTMStorage interface and SQLiteLTMStorage, a SQLite backend so
+long-term memories survive restarts and need not all be held in RAM.
+MemoryIndex can sit in front of a storage backend as a bounded hot cache.
+
+Per spec: subsystems/base1.0/subsystem_memory_experience.md
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from ..serialization import codec_for
+from .models import LTMMemoryEntry
+
+_LTM_CODEC = codec_for(LTMMemoryEntry)
+
+
+def _json_default(value: Any) -> Any:
+    """Fallback for values JSON cannot represent: sets become lists, others str."""
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    return str(value)
+
+
+def _encode_row(memory: LTMMemoryEntry) -> bytes:
+    """Encode an entry as JSON for the data column.
+
+    Entries the model codec cannot encode (e.g. a set or datetime in
+    metadata) are encoded with `_json_default`, so write-through never
+    fails on them; such values read back as lists or strings.
+    """
+    try:
+        return _LTM_CODEC.encode(memory)
+    except (TypeError, ValueError, OverflowError):
+        return json.dumps(
+            _LTM_CODEC.to_dict(memory), ensure_ascii=False, separators=(",", ":"), default=_json_default
+        ).encode("utf-8")
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS memories (
+    rowid INTEGER PRIMARY KEY,
+    memory_id TEXT NOT NULL UNIQUE,
+    ts REAL NOT NULL,
+    type TEXT NOT NULL,
+    priority TEXT NOT NULL,
+    impact_level INTEGER NOT NULL,
+    content_summary TEXT NOT NULL,
+    data BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_memories_ts ON memories (ts);
+CREATE INDEX IF NOT EXISTS idx_memories_type ON memories (type, ts);
+CREATE INDEX IF NOT EXISTS idx_memories_priority ON memories (priority, ts);
+CREATE INDEX IF NOT EXISTS idx_memories_impact ON memories (impact_level, ts);
+
+CREATE TABLE IF NOT EXISTS memory_tags (
+    memory_id TEXT NOT NULL,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (tag, memory_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_memory_tags_memory ON memory_tags (memory_id);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS memories_fts USING fts5 (
+    content_summary, content='memories', content_rowid='rowid'
+);
+CREATE TRIGGER IF NOT EXISTS memories_ai AFTER INSERT ON memories BEGIN
+    INSERT INTO memories_fts (rowid, content_summary) VALUES (new.rowid, new.content_summary);
+END;
+CREATE TRIGGER IF NOT EXISTS memories_ad AFTER DELETE ON memories BEGIN
+    INSERT INTO memories_fts (memories_fts, rowid, content_summary)
+    VALUES ('delete', old.rowid, old.content_summary);
+END;
+CREATE TRIGGER IF NOT EXISTS memories_au AFTER UPDATE ON memories BEGIN
+    INSERT INTO memories_fts (memories_fts, rowid, content_summary)
+    VALUES ('delete', old.rowid, old.content_summary);
+    INSERT INTO memories_fts (rowid, content_summary) VALUES (new.rowid, new.content_summary);
+END;
+"""
+
+_UPSERT = """
+INSERT INTO memories (memory_id, ts, type, priority, impact_level, content_summary, data)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (memory_id) DO UPDATE SET
+    ts = excluded.ts,
+    type = excluded.type,
+    priority = excluded.priority,
+    impact_level = excluded.impact_level,
+    content_summary = excluded.content_summary,
+    data = excluded.data
+"""
+
+
+class LTMStorage(ABC):
+    """Interface for persistent long-term memory storage.
+
+    Queries take the same query dictionary as `MemoryIndex.query_memories`
+    and return entries most recent first.
+    """
+
+    @abstractmethod
+    def upsert_many(self, memories: Sequence[LTMMemoryEntry]) -> None:
+        """Insert or replace memories in one batch."""
+
+    def upsert(self, memory: LTMMemoryEntry) -> None:
+        """Insert or replace one memory."""
+        self.upsert_many([memory])
+
+    @abstractmethod
+    def get_many(self, memory_ids: Sequence[str]) -> Dict[str, LTMMemoryEntry]:
+        """Get memories by ID (missing IDs are omitted)."""
+
+    def get(self, memory_id: str) -> Optional[LTMMemoryEntry]:
+        """Get one memory by ID."""
+        return self.get_many([memory_id]).get(memory_id)
+
+    @abstractmethod
+    def delete_many(self, memory_ids: Sequence[str]) -> None:
+        """Delete memories by ID."""
+
+    @abstractmethod
+    def query(self, query: Dict[str, Any], limit: Optional[int] = None) -> List[LTMMemoryEntry]:
+        """Query memories (see `MemoryIndex.query_memories`)."""
+
+    @abstractmethod
+    def search_text(self, text: str, limit: int = 10) -> List[LTMMemoryEntry]:
+        """Full-text search over content summaries, best match first."""
+
+    @abstractmethod
+    def iter_recent(self, batch_size: int = 1000) -> Iterator[LTMMemoryEntry]:
+        """Stream all memories, most recent first."""
+
+    @abstractmethod
+    def count(self) -> int:
+        """Return the number of stored memories."""
+
+    def close(self) -> None:
+        """Release resources."""
+
+
+class SQLiteLTMStorage(LTMStorage):
+    """LTM storage backed by SQLite.
+
+    - WAL journal, so reads proceed while a batch is being written.
+    - Secondary indexes on timestamp, type, priority and impact_level, and a
+      tag table for tag filters.
+    - FTS5 index on content_summary, kept in sync by triggers.
+    - Upserts are batched: `upsert_many` writes each batch of up to
+      `batch_size` memories in one transaction.
+
+    Rows hold the full entry (encoded with the model codec) alongside the
+    indexed columns. One connection is shared behind a lock.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        batch_size: int = 1000,
+        synchronous: str = "NORMAL",
+    ) -> None:
+        """Open (or create) the store.
+
+        Args:
+            path: SQLite database file path.
+            batch_size: Maximum memories written per transaction.
+            synchronous: SQLite `synchronous` pragma (OFF, NORMAL or FULL).
+        """
+        self._batch_size = batch_size
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(f"PRAGMA synchronous={synchronous}")
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    def upsert_many(self, memories: Sequence[LTMMemoryEntry]) -> None:
+        """Insert or replace memories, `batch_size` per transaction.
+
+        Args:
+            memories: Memories to write.
+        """
+        for start in range(0, len(memories), self._batch_size):
+            batch = memories[start:start + self._batch_size]
+            rows = [
+                (
+                    memory.memory_id,
+                    memory.timestamp.timestamp(),
+                    memory.type.value,
+                    memory.priority.value,
+                    memory.impact_level,
+                    memory.content_summary,
+                    _encode_row(memory),
+                )
+                for memory in batch
+            ]
+            ids = [(memory.memory_id,) for memory in batch]
+            tags = [
+                (memory.memory_id, tag)
+                for memory in batch
+                for tag in dict.fromkeys(memory.experience_tags)
+            ]
+            with self._lock, self._conn:
+                self._conn.executemany(_UPSERT, rows)
+                self._conn.executemany("DELETE FROM memory_tags WHERE memory_id = ?", ids)
+                self._conn.executemany("INSERT INTO memory_tags (memory_id, tag) VALUES (?, ?)", tags)
+
+    def get_many(self, memory_ids: Sequence[str]) -> Dict[str, LTMMemoryEntry]:
+        """Get memories by ID.
+
+        Args:
+            memory_ids: Memory IDs to fetch.
+
+        Returns:
+            Mapping of memory ID to entry (missing IDs are omitted).
+        """
+        found: Dict[str, LTMMemoryEntry] = {}
+        for start in range(0, len(memory_ids), 500):
+            chunk = list(memory_ids[start:start + 500])
+            placeholders = ",".join("?" * len(chunk))
+            for memory in self._fetch(
+                f"SELECT data FROM memories WHERE memory_id IN ({placeholders})", chunk
+            ):
+                found[memory.memory_id] = memory
+        return found
+
+    def delete_many(self, memory_ids: Sequence[str]) -> None:
+        """Delete memories by ID."""
+        ids = [(memory_id,) for memory_id in memory_ids]
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM memories WHERE memory_id = ?", ids)
+            self._conn.executemany("DELETE FROM memory_tags WHERE memory_id = ?", ids)
+
+    def query(self, query: Dict[str, Any], limit: Optional[int] = None) -> List[LTMMemoryEntry]:
+        """Query memories.
+
+        Args:
+            query: Query dictionary (tags, tag_mode, type, start_time,
+                end_time, min_significance, priority).
+            limit: Optional maximum number of results.
+
+        Returns:
+            Matching entries, most recent first.
+        """
+        clauses: List[str] = []
+        params: List[Any] = []
+
+        if "tags" in query:
+            tag_list = query["tags"]
+            if isinstance(tag_list, str):
+                tag_list = [tag_list]
+            tag_list = list(dict.fromkeys(tag_list))
+            if not tag_list:
+                return []
+            placeholders = ",".join("?" * len(tag_list))
+            if query.get("tag_mode", "any") == "all":
+                clauses.append(
+                    f"memory_id IN (SELECT memory_id FROM memory_tags WHERE tag IN ({placeholders}) "
+                    "GROUP BY memory_id HAVING COUNT(*) = ?)"
+                )
+                params.extend(tag_list)
+                params.append(len(tag_list))
+            else:
+                clauses.append(
+                    f"memory_id IN (SELECT memory_id FROM memory_tags WHERE tag IN ({placeholders}))"
+                )
+                params.extend(tag_list)
+        if "type" in query:
+            clauses.append("type = ?")
+            params.append(query["type"].value)
+        if "priority" in query:
+            priority = query["priority"]
+            clauses.append("priority = ?")
+            params.append(getattr(priority, "value", priority))
+        if "min_significance" in query:
+            # Phase 6: Use impact_level as proxy for significance
+            clauses.append("impact_level >= ?")
+            params.append(query["min_significance"])
+        if query.get("start_time"):
+            clauses.append("ts >= ?")
+            params.append(query["start_time"].timestamp())
+        if query.get("end_time"):
+            clauses.append("ts <= ?")
+            params.append(query["end_time"].timestamp())
+
+        sql = "SELECT data FROM memories"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY ts DESC"
+        if limit is not None and limit > 0:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return list(self._fetch(sql, params))
+
+    def search_text(self, text: str, limit: int = 10) -> List[LTMMemoryEntry]:
+        """Full-text search over content summaries.
+
+        Each whitespace-separated term is matched literally (FTS5 query
+        syntax in `text` is not interpreted); all terms must match.
+
+        Args:
+            text: Search text.
+            limit: Maximum number of results.
+
+        Returns:
+            Matching entries, best match first.
+        """
+        terms = ['"' + term.replace('"', '""') + '"' for term in text.split()]
+        if not terms:
+            return []
+        return list(
+            self._fetch(
+                "SELECT m.data FROM memories_fts f JOIN memories m ON m.rowid = f.rowid "
+                "WHERE memories_fts MATCH ? ORDER BY f.rank LIMIT ?",
+                (" ".join(terms), limit),
+            )
+        )
+
+    def iter_recent(self, batch_size: int = 1000) -> Iterator[LTMMemoryEntry]:
+        """Stream all memories, most recent first.
+
+        Args:
+            batch_size: Rows fetched per round trip.
+        """
+        last: Optional[Tuple[float, int]] = None
+        while True:
+            if last is None:
+                sql = "SELECT ts, rowid, data FROM memories ORDER BY ts DESC, rowid DESC LIMIT ?"
+                params: Tuple[Any, ...] = (batch_size,)
+            else:
+                sql = (
+                    "SELECT ts, rowid, data FROM memories WHERE (ts, rowid) < (?, ?) "
+                    "ORDER BY ts DESC, rowid DESC LIMIT ?"
+                )
+                params = (last[0], last[1], batch_size)
+            with self._lock:
+                rows = self._conn.execute(sql, params).fetchall()
+            if not rows:
+                return
+            for _, _, data in rows:
+                yield _LTM_CODEC.decode(data, trusted=True)
+            last = (rows[-1][0], rows[-1][1])
+
+    def count(self) -> int:
+        """Return the number of stored memories."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM memories").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _fetch(self, sql: str, params: Iterable[Any]) -> Iterator[LTMMemoryEntry]:
+        with self._lock:
+            rows = self._conn.execute(sql, list(params)).fetchall()
+        for (data,) in rows:
+            yield _LTM_CODEC.decode(data, trusted=True)
@@ -0,0 +1,159 @@
+"""STM tagging engine for the Phase 6 memory pipeline (TAG stage).
+
+Per spec: subsystem_memory_experience.md §7.2
+Tags: emotional, thematic, relational, narrative, priority, drift-sensitivity
+
+Keyword tags come from a declarative rule table, precompiled per payload
+field. Tags that depend only on the event type, emotional hint keys and
+score bands are cached (LRU), since a session repeats a small set of
+event types. Tags keep first-seen order without duplicates.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from .models import STMMemoryEntry
+
+
+@dataclass(frozen=True)
+class TagRule:
+    """Adds `tags` when `keyword` occurs (case-insensitive) in a payload field."""
+
+    field: str  # raw_payload key, e.g. "event_type" or "content_summary"
+    keyword: str
+    tags: Tuple[str, ...]
+
+
+DEFAULT_TAG_RULES: Tuple[TagRule, ...] = (
+    # Thematic tags from event type
+    TagRule("event_type", "goal", ("goal",)),
+    TagRule("event_type", "debate", ("debate",)),
+    TagRule("event_type", "interaction", ("interaction",)),
+    # Relational tags (Slepp mentions)
+    TagRule("content_summary", "slepp", ("relational", "slepp")),
+)
+
+
+class _FieldMatcher:
+    """Matches a field's keyword rules against lowercased text.
+
+    Keywords are plain substring checks, which CPython runs in C; one `re`
+    alternation over the same keywords measured several times slower.
+    """
+
+    def __init__(self, rules: Sequence[TagRule]) -> None:
+        # Rules in table order, so output order does not depend on the text
+        self._rules = tuple((rule.keyword.lower(), rule.tags) for rule in rules)
+
+    def match(self, text: str) -> Tuple[str, ...]:
+        tags: Tuple[str, ...] = ()
+        for keyword, rule_tags in self._rules:
+            if keyword in text:
+                tags += rule_tags
+        return tags
+
+
+def _score_tags(level: int, drift: bool) -> Tuple[str, ...]:
+    """Return narrative, priority and drift tags for a significance level."""
+    tags = []
+    # Narrative tags (basic - full narrative tagging deferred)
+    if level >= 2:
+        tags.append("narrative_significant")
+    # Priority tags
+    tags.append(("priority_low", "priority_medium", "priority_medium", "priority_high")[level])
+    # Drift-sensitivity tags (basic)
+    if drift:
+        tags.append("drift_sensitive")
+    return tuple(tags)
+
+
+# (significance level, drift) -> tags; levels: <=0.5, <=0.7, <=0.8, >0.8
+_SCORE_TAGS = {(level, drift): _score_tags(level, drift) for level in range(4) for drift in (False, True)}
+
+
+def _join_tags(first: Tuple[str, ...], second: Tuple[str, ...]) -> Tuple[str, ...]:
+    return tuple(dict.fromkeys(first + second))
+
+
+class TaggingEngine:
+    """Assigns STM tags from a rule table plus the built-in score tags.
+
+    Produces, in order: existing payload tags, emotional tags, event-type
+    rule tags, narrative, priority and drift-sensitivity tags, then rule
+    tags of the other fields. Tags that do not depend on text fields are
+    cached per (event type, emotion keys, significance level, drift), so
+    per-entry work is one cache lookup and one scan per text field.
+    """
+
+    def __init__(self, rules: Iterable[TagRule] = DEFAULT_TAG_RULES, cache_size: int = 1024) -> None:
+        """Initialize engine.
+
+        Args:
+            rules: Keyword rules.
+            cache_size: Maximum cached event-type/score combinations.
+        """
+        by_field: Dict[str, List[TagRule]] = {}
+        for rule in rules:
+            by_field.setdefault(rule.field, []).append(rule)
+        self._matchers = {field: _FieldMatcher(field_rules) for field, field_rules in by_field.items()}
+        self._event_matcher = self._matchers.pop("event_type", None)
+        # Everything but the text-field tags depends only on this small key
+        self._fixed_tags = lru_cache(maxsize=cache_size)(self._compute_fixed_tags)
+        self._joined = lru_cache(maxsize=cache_size)(_join_tags)
+
+    def _compute_fixed_tags(
+        self, event_type: str, emotion_keys: Tuple[str, ...], level: int, drift: bool
+    ) -> Tuple[str, ...]:
+        tags: List[str] = []
+        if emotion_keys:
+            tags.append("emotional")
+            tags.extend(f"emotional_{key}" for key in emotion_keys)
+        if self._event_matcher is not None:
+            tags.extend(self._event_matcher.match(event_type.lower()))
+        tags.extend(_SCORE_TAGS[level, drift])
+        return tuple(dict.fromkeys(tags))
+
+    def tag(self, stm_entry: STMMemoryEntry) -> STMMemoryEntry:
+        """Tag one entry (tags written to raw_payload["tags"]).
+
+        Args:
+            stm_entry: STM entry to tag.
+
+        Returns:
+            The same entry, tagged.
+        """
+        payload = stm_entry.raw_payload
+        hint = stm_entry.emotional_hint
+        significance = payload.get("significance_score", 0.0)
+        level = 3 if significance > 0.8 else 2 if significance > 0.7 else 1 if significance > 0.5 else 0
+        fixed = self._fixed_tags(
+            payload.get("event_type", ""),
+            tuple(hint) if hint else (),
+            level,
+            payload.get("identity_relevance_score", 0.0) > 0.5,
+        )
+
+        for field, matcher in self._matchers.items():
+            matched = matcher.match(str(payload.get(field, "")).lower())
+            if matched:
+                fixed = self._joined(fixed, matched)
+
+        existing = payload.get("tags")
+        payload["tags"] = list(self._joined(tuple(existing), fixed) if existing else fixed)
+        return stm_entry
+
+    def tag_batch(self, stm_entries: Iterable[STMMemoryEntry]) -> List[STMMemoryEntry]:
+        """Tag several entries.
+
+        Returns:
+            The tagged entries, in input order.
+        """
+        tag = self.tag
+        return [tag(stm_entry) for stm_entry in stm_entries]
+
+    def cache_info(self):
+        """Return tag cache statistics (hits, misses, maxsize, currsize)."""
+        return self._fixed_tags.cache_info()
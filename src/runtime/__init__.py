@@ -8,6 +8,15 @@ from .governance_loader import (
     load_governance,
 )
 from .gate import Gate
+from .replay import (
+    LatencyHistogram,
+    ReplayReport,
+    SessionReplayer,
+    find_session_logs,
+    iter_session_events,
+    merge_session_events,
+    replay_sessions_into_orchestrator,
+)
 
 __all__ = [
     "Gate",
@@ -16,5 +25,13 @@ __all__ = [
     "GovernanceSnapshot",
     "PatchesInfo",
     "load_governance",
+    # Replay
+    "LatencyHistogram",
+    "ReplayReport",
+    "SessionReplayer",
+    "find_session_logs",
+    "iter_session_events",
+    "merge_session_events",
+    "replay_sessions_into_orchestrator",
 ]
 
@@ -13,10 +13,10 @@ from .governance_loader import (
 )
 from ..gate.candidate_tracker import CandidateTracker
 from ..gate.cli_handler import CLIHandler
-from ..gate.event_logger import EventLogger
+from ..gate.event_logger import DurabilityMode, EventLogger, read_last_logged_event_id
 from ..gate.models import GateState
 from ..gate.session_manager import SessionManager
-from ..gate.state_manager import StateManager
+from ..gate.state_manager import StateCheckpointer, StateManager
 from ..state.models.event_envelope import EventEnvelope
 
 
@@ -29,6 +29,8 @@ class Gate:
         persist: bool = True,
         promote_memory: bool = False,
         memory_pipeline: Optional["MemoryPipeline"] = None,
+        log_durability: DurabilityMode = DurabilityMode.FLUSH,
+        state_flush_interval_ms: float = 200.0,
     ):
         """Initialize Gate.
 
@@ -37,6 +39,9 @@ class Gate:
             persist: Enable event logging (default: True).
             promote_memory: Enable memory promotion (default: False).
             memory_pipeline: Optional MemoryPipeline for candidate processing.
+            log_durability: Session log durability mode (default: flush per event).
+            state_flush_interval_ms: Minimum time between background writes of
+                gate_state.json (default: 200ms).
         """
         self._repo_root = repo_root
         self._persist = persist
@@ -48,13 +53,18 @@ class Gate:
 
         # Gate components
         self._state_manager = StateManager(repo_root / "data" / "gate_state.json")
+        self._checkpointer = StateCheckpointer(self._state_manager, state_flush_interval_ms)
+        self._gate_state: Optional[GateState] = None
         self._session_manager = SessionManager(repo_root / "logs" / "runtime_sessions")
-        self._event_logger = EventLogger(self._session_manager)
+        self._event_logger = EventLogger(self._session_manager, durability=log_durability)
         self._candidate_tracker = CandidateTracker(
             self._session_manager, memory_pipeline, promote_memory
         )
         self._cli_handler = CLIHandler(
-            self._session_manager, self._candidate_tracker, memory_pipeline
+            self._session_manager,
+            self._candidate_tracker,
+            memory_pipeline,
+            flush_log=self._event_logger.flush,
         )
 
         # Gate state
@@ -83,13 +93,22 @@ class Gate:
                 last_event_id="",
                 safe_mode=True,
             )
-            self._state_manager.save(gate_state)
+        else:
+            self._recover_last_event_id(gate_state)
 
         # Start session if persistence is enabled
         if self._persist:
             session = self._session_manager.start_session()
             gate_state.last_session_id = session.session_id
-            self._state_manager.save(gate_state)
+            log_file = self._session_manager.get_current_log_file()
+            gate_state.latest_log_path = str(log_file) if log_file else None
+        else:
+            # Events of this run are not logged; a previous run's log must
+            # not roll last_event_id back on the next start
+            gate_state.latest_log_path = None
+
+        self._gate_state = gate_state
+        self._checkpointer.checkpoint(gate_state)
 
         self._started = True
 
@@ -100,7 +119,7 @@ class Gate:
             Dictionary with gate status information.
         """
         session = self._session_manager.get_current_session()
-        gate_state = self._state_manager.load()
+        gate_state = self._gate_state or self._state_manager.load()
 
         status: Dict[str, Any] = {
             "started": self._started,
@@ -150,11 +169,31 @@ class Gate:
         if self._persist:
             self._event_logger.log_event(event)
 
-        # Update gate state
-        gate_state = self._state_manager.load()
-        if gate_state:
-            gate_state.last_event_id = event.event_id
-            self._state_manager.save(gate_state)
+        # Update gate state in memory; the checkpointer writes it back coalesced
+        if self._gate_state is not None:
+            self._gate_state.last_event_id = event.event_id
+            self._checkpointer.mark_dirty(self._gate_state)
+
+    def checkpoint(self) -> None:
+        """Write the in-memory gate state to disk now."""
+        if self._gate_state is not None:
+            self._checkpointer.checkpoint(self._gate_state)
+
+    def _recover_last_event_id(self, gate_state: GateState) -> None:
+        """Repair a stale checkpoint from the tail of the last session log.
+
+        gate_state.json is written back lazily, so after a crash its
+        last_event_id may lag the session log. The last complete record of
+        `latest_log_path` is authoritative.
+
+        Args:
+            gate_state: State loaded from disk (updated in place).
+        """
+        if not gate_state.latest_log_path:
+            return
+        logged_event_id = read_last_logged_event_id(Path(gate_state.latest_log_path))
+        if logged_event_id and logged_event_id != gate_state.last_event_id:
+            gate_state.last_event_id = logged_event_id
 
     def process_memory_candidate(self, stm_entry) -> Optional[Dict[str, Any]]:
         """Process a memory candidate.
@@ -187,6 +226,11 @@ class Gate:
     def shutdown(self) -> None:
         """Shutdown the gate and end current session."""
         if self._started and self._persist:
+            # Durability barrier before the session file is released
+            self._event_logger.flush()
+            self._event_logger.close()
             self._session_manager.end_session()
+        if self._started:
+            self._checkpointer.close()
         self._started = False
 
@@ -0,0 +1,308 @@
+"""Session replay engine for the runtime.
+
+Streams recorded session logs (logs/runtime_sessions/*.jsonl, or binary
+`*.nslog` logs) back through an EventBus, e.g. one wired to the
+CognitiveOrchestrator executors, to load-test them against real traffic.
+
+Events are read lazily and merged across files by `ts_utc`, so memory use
+does not grow with log size.
+"""
+
+from __future__ import annotations
+
+import heapq
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from ..events import EventBus, EventFactory, Scheduler
+from ..gate.session_log import BinarySessionLogReader
+from ..serialization import codec_for
+from ..state.container import StateContainer
+from ..state.models.event_envelope import EventEnvelope
+from ..subsystems.execution import CognitiveOrchestrator
+
+_EVENT_CODEC = codec_for(EventEnvelope)
+
+# Latency histogram bucket upper bounds, in microseconds (powers of two up to ~8.4s)
+_BUCKET_BOUNDS_US = [2 ** i for i in range(24)]
+
+
+def _ts_epoch(ts_utc: str) -> float:
+    try:
+        return datetime.fromisoformat(ts_utc.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return 0.0
+
+
+def iter_session_events(path: Union[str, Path]) -> Iterator[EventEnvelope]:
+    """Stream events from one session log.
+
+    JSONL logs are read line by line; blank and unparseable lines (e.g. a
+    torn final line) are skipped. `*.nslog` files are read as binary logs.
+
+    Args:
+        path: Session log path.
+
+    Yields:
+        EventEnvelope instances in file order.
+    """
+    path = Path(path)
+    if path.suffix == ".nslog":
+        with BinarySessionLogReader(path) as reader:
+            yield from reader
+        return
+
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                yield _EVENT_CODEC.decode(line)
+            except Exception:
+                continue
+
+
+def _keyed_events(path: Union[str, Path], index: int) -> Iterator[Tuple[float, int, EventEnvelope]]:
+    """Yield (epoch, file index, event) for one log, binding the index eagerly."""
+    for event in iter_session_events(path):
+        yield _ts_epoch(event.ts_utc), index, event
+
+
+def merge_session_events(paths: Iterable[Union[str, Path]]) -> Iterator[EventEnvelope]:
+    """Stream events from several session logs merged by `ts_utc`.
+
+    Each log is assumed to be in timestamp order (as written by the gate);
+    ties are broken by file order.
+
+    Args:
+        paths: Session log paths.
+
+    Yields:
+        EventEnvelope instances in timestamp order.
+    """
+    streams = [_keyed_events(path, index) for index, path in enumerate(paths)]
+    for _, _, event in heapq.merge(*streams, key=lambda item: (item[0], item[1])):
+        yield event
+
+
+def find_session_logs(sessions_dir: Union[str, Path]) -> List[Path]:
+    """List session logs in a runtime sessions directory.
+
+    The `latest.jsonl` pointer is skipped so its session is not replayed twice.
+
+    Args:
+        sessions_dir: Directory such as logs/runtime_sessions.
+
+    Returns:
+        Sorted session log paths.
+    """
+    sessions_dir = Path(sessions_dir)
+    paths = list(sessions_dir.glob("*.jsonl")) + list(sessions_dir.glob("*.nslog"))
+    return sorted(path for path in paths if path.name != "latest.jsonl")
+
+
+class LatencyHistogram:
+    """Log2-bucketed latency histogram (microsecond resolution)."""
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self.buckets: List[int] = [0] * (len(_BUCKET_BOUNDS_US) + 1)
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Record one observation."""
+        self.count += 1
+        self.total_seconds += seconds
+        if seconds > self.max_seconds:
+            self.max_seconds = seconds
+        micros = int(seconds * 1_000_000)
+        self.buckets[min(micros.bit_length(), len(_BUCKET_BOUNDS_US))] += 1
+
+    def percentile(self, p: float) -> float:
+        """Return an upper bound for the p-th percentile (0-100), in seconds."""
+        if self.count == 0:
+            return 0.0
+        rank = p / 100.0 * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank and n:
+                if i == len(_BUCKET_BOUNDS_US):
+                    return self.max_seconds
+                return min(_BUCKET_BOUNDS_US[i] / 1_000_000, self.max_seconds)
+        return self.max_seconds
+
+    def to_dict(self) -> Dict[str, float]:
+        """Summarize the histogram (latencies in milliseconds)."""
+        mean = self.total_seconds / self.count if self.count else 0.0
+        return {
+            "count": self.count,
+            "mean_ms": mean * 1000.0,
+            "p50_ms": self.percentile(50) * 1000.0,
+            "p90_ms": self.percentile(90) * 1000.0,
+            "p99_ms": self.percentile(99) * 1000.0,
+            "max_ms": self.max_seconds * 1000.0,
+        }
+
+
+@dataclass
+class ReplayReport:
+    """Result of one replay run."""
+
+    events: int = 0
+    handler_calls: int = 0
+    wall_seconds: float = 0.0
+    events_by_type: Dict[str, int] = field(default_factory=dict)
+    handler_latency: Dict[str, LatencyHistogram] = field(default_factory=dict)
+
+    @property
+    def events_per_second(self) -> float:
+        return self.events / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, object]:
+        """Summarize the report as plain data."""
+        return {
+            "events": self.events,
+            "handler_calls": self.handler_calls,
+            "wall_seconds": self.wall_seconds,
+            "events_per_second": self.events_per_second,
+            "events_by_type": dict(self.events_by_type),
+            "handler_latency": {
+                name: histogram.to_dict() for name, histogram in self.handler_latency.items()
+            },
+        }
+
+
+def _handler_name(handler: Callable[[EventEnvelope], None]) -> str:
+    name = getattr(handler, "__qualname__", None) or repr(handler)
+    return name.replace(".<locals>", "")
+
+
+class SessionReplayer:
+    """Replays recorded events through an EventBus.
+
+    Pacing:
+    - `speed=None` (default): as fast as possible.
+    - `speed=k`: k x real time, preserving the recorded gaps between events
+      (k=1.0 is real time, k=10.0 ten times faster).
+
+    Handler latency is measured through the bus's handler observer, so the
+    bus should be in SYNC dispatch mode.
+    """
+
+    def __init__(
+        self,
+        event_bus: EventBus,
+        speed: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Initialize the replayer.
+
+        Args:
+            event_bus: Bus to emit recorded events on.
+            speed: Real-time multiple, or None for as fast as possible.
+            clock: Monotonic clock (injectable for tests).
+            sleep: Sleep function (injectable for tests).
+
+        Raises:
+            ValueError: If speed is not positive.
+        """
+        if speed is not None and speed <= 0:
+            raise ValueError(f"speed must be positive, got: {speed}")
+        self._event_bus = event_bus
+        self._speed = speed
+        self._clock = clock
+        self._sleep = sleep
+
+    def replay(
+        self, events: Iterable[EventEnvelope], limit: Optional[int] = None
+    ) -> ReplayReport:
+        """Emit events on the bus and measure throughput and handler latency.
+
+        Args:
+            events: Events to replay, in order (e.g. `merge_session_events(...)`).
+            limit: Maximum events to replay (None for all).
+
+        Returns:
+            ReplayReport for the run.
+        """
+        report = ReplayReport()
+        histograms = report.handler_latency
+        names: Dict[int, Tuple[Callable[[EventEnvelope], None], str]] = {}
+
+        def observe(_subscription_id: str, handler: Callable[[EventEnvelope], None], elapsed: float) -> None:
+            entry = names.get(id(handler))
+            if entry is None or entry[0] is not handler:
+                entry = (handler, _handler_name(handler))
+                names[id(handler)] = entry
+            histogram = histograms.get(entry[1])
+            if histogram is None:
+                histogram = histograms[entry[1]] = LatencyHistogram()
+            histogram.record(elapsed)
+
+        by_type = report.events_by_type
+        emit = self._event_bus.emit
+        speed = self._speed
+        first_ts: Optional[float] = None
+        start = self._clock()
+
+        self._event_bus.set_handler_observer(observe)
+        try:
+            for event in events:
+                if limit is not None and report.events >= limit:
+                    break
+                if speed is not None:
+                    ts = _ts_epoch(event.ts_utc)
+                    if first_ts is None:
+                        first_ts = ts
+                    delay = start + (ts - first_ts) / speed - self._clock()
+                    if delay > 0:
+                        self._sleep(delay)
+                emit(event)
+                report.events += 1
+                by_type[event.type] = by_type.get(event.type, 0) + 1
+        finally:
+            self._event_bus.set_handler_observer(None)
+            report.wall_seconds = self._clock() - start
+
+        report.handler_calls = sum(h.count for h in histograms.values())
+        return report
+
+
+def replay_sessions_into_orchestrator(
+    paths: Iterable[Union[str, Path]],
+    speed: Optional[float] = None,
+    limit: Optional[int] = None,
+    instance_id: str = "replay",
+) -> Tuple[ReplayReport, CognitiveOrchestrator]:
+    """Replay session logs through a fresh CognitiveOrchestrator.
+
+    Builds an in-memory StateContainer, EventBus, EventFactory and Scheduler,
+    wires the orchestrator's executors onto the bus and replays the merged logs.
+
+    Args:
+        paths: Session log paths (see `find_session_logs`).
+        speed: Real-time multiple, or None for as fast as possible.
+        limit: Maximum events to replay (None for all).
+        instance_id: Instance identifier for the orchestrator.
+
+    Returns:
+        Tuple of (replay report, orchestrator holding the rebuilt state).
+    """
+    event_bus = EventBus()
+    orchestrator = CognitiveOrchestrator(
+        state_container=StateContainer(instance_id),
+        event_bus=event_bus,
+        event_factory=EventFactory(),
+        scheduler=Scheduler(),
+        instance_id=instance_id,
+    )
+    replayer = SessionReplayer(event_bus, speed=speed)
+    report = replayer.replay(merge_session_events(paths), limit=limit)
+    return report, orchestrator
@@ -0,0 +1,14 @@
+"""Serialization infrastructure.
+
+Provides a pluggable JSON backend (orjson or msgspec when installed, stdlib
+json otherwise) and pre-compiled per-model codecs for Pydantic models.
+"""
+
+from .codec import JsonBackend, ModelCodec, codec_for, get_backend
+
+__all__ = [
+    "JsonBackend",
+    "ModelCodec",
+    "codec_for",
+    "get_backend",
+]
@@ -0,0 +1,282 @@
+"""JSON codec layer for Pydantic models.
+
+JsonBackend wraps the fastest available JSON library:
+- orjson (if installed; values it rejects, such as integers beyond 64
+  bits, are encoded with stdlib json instead)
+- msgspec (if installed)
+- stdlib json (always available)
+
+ModelCodec pre-compiles a field plan for one model class so encoding skips
+pydantic's `.dict()`/`model_dump()` walk, and decoding trusted local data can
+skip validation (`construct`/`model_construct`).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import typing
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, Type, TypeVar, Union
+
+from pydantic import BaseModel
+
+M = TypeVar("M", bound=BaseModel)
+
+# Field conversion kinds
+_PLAIN = 0
+_DATETIME = 1
+_ENUM = 2
+_MODEL = 3
+
+
+class JsonBackend:
+    """A JSON library exposed as bytes-in/bytes-out dumps and loads."""
+
+    def __init__(
+        self,
+        name: str,
+        dumps: Callable[[Any], bytes],
+        dumps_indent: Callable[[Any], bytes],
+        loads: Callable[[Union[bytes, str]], Any],
+    ) -> None:
+        """Initialize a backend.
+
+        Args:
+            name: Backend name ("orjson", "msgspec" or "json").
+            dumps: Compact encoder returning UTF-8 bytes.
+            dumps_indent: Indented (2 spaces) encoder returning UTF-8 bytes.
+            loads: Decoder accepting bytes or str.
+        """
+        self.name = name
+        self.dumps = dumps
+        self.dumps_indent = dumps_indent
+        self.loads = loads
+
+    def __repr__(self) -> str:
+        return f"JsonBackend({self.name!r})"
+
+
+def _orjson_backend() -> JsonBackend:
+    import orjson
+
+    # Non-str keys are stringified like json.dumps does
+    compact = orjson.OPT_NON_STR_KEYS
+    indented = orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+    stdlib = _stdlib_backend()
+
+    def dumps(obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, option=compact)
+        except TypeError:  # e.g. integers beyond 64 bits; json.dumps handles them
+            return stdlib.dumps(obj)
+
+    def dumps_indent(obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, option=indented)
+        except TypeError:
+            return stdlib.dumps_indent(obj)
+
+    return JsonBackend("orjson", dumps, dumps_indent, orjson.loads)
+
+
+def _msgspec_backend() -> JsonBackend:
+    import msgspec
+
+    encoder = msgspec.json.Encoder()
+    decoder = msgspec.json.Decoder()
+    return JsonBackend(
+        "msgspec",
+        encoder.encode,
+        lambda obj: msgspec.json.format(encoder.encode(obj), indent=2),
+        decoder.decode,
+    )
+
+
+def _stdlib_backend() -> JsonBackend:
+    return JsonBackend(
+        "json",
+        lambda obj: json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
+        lambda obj: json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8"),
+        json.loads,
+    )
+
+
+_BACKEND_FACTORIES: Dict[str, Callable[[], JsonBackend]] = {
+    "orjson": _orjson_backend,
+    "msgspec": _msgspec_backend,
+    "json": _stdlib_backend,
+}
+_backend_cache: Dict[str, JsonBackend] = {}
+
+
+def get_backend(name: Optional[str] = None) -> JsonBackend:
+    """Return a JSON backend.
+
+    Args:
+        name: "orjson", "msgspec" or "json". None picks the NYRA_JSON_BACKEND
+            environment variable if set, else the first installed of
+            orjson, msgspec, json.
+
+    Returns:
+        The JsonBackend instance (cached per name).
+
+    Raises:
+        ValueError: If the name is unknown.
+        ImportError: If a named optional backend is not installed.
+    """
+    name = name or os.environ.get("NYRA_JSON_BACKEND")
+    candidates = [name] if name else list(_BACKEND_FACTORIES)
+    for candidate in candidates:
+        if candidate in _backend_cache:
+            return _backend_cache[candidate]
+        factory = _BACKEND_FACTORIES.get(candidate)
+        if factory is None:
+            raise ValueError(f"Unknown JSON backend: {candidate}")
+        try:
+            backend = factory()
+        except ImportError:
+            if name:
+                raise
+            continue
+        _backend_cache[candidate] = backend
+        return backend
+    raise ImportError("No JSON backend available")  # pragma: no cover - stdlib always loads
+
+
+def _model_fields(model: Type[BaseModel]) -> List[str]:
+    # Support both Pydantic v1 and v2
+    fields = getattr(model, "model_fields", None)
+    if fields is None:
+        fields = model.__fields__
+    return list(fields)
+
+
+def _classify(annotation: Any) -> Tuple[int, Any]:
+    """Map a field annotation to a conversion kind (Optional[...] unwrapped)."""
+    if typing.get_origin(annotation) is Union:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            annotation = args[0]
+    if isinstance(annotation, type):
+        if issubclass(annotation, datetime):
+            return _DATETIME, None
+        if issubclass(annotation, Enum):
+            return _ENUM, annotation
+        if issubclass(annotation, BaseModel):
+            return _MODEL, codec_for(annotation)
+    return _PLAIN, None
+
+
+class ModelCodec(Generic[M]):
+    """Pre-compiled JSON encoder/decoder for one Pydantic model class.
+
+    The field plan (name and conversion kind per field) is computed once:
+    datetimes encode as ISO 8601 strings, enums as their values and nested
+    models recursively. Containers are passed to the backend as-is.
+    """
+
+    def __init__(self, model: Type[M], backend: Optional[JsonBackend] = None) -> None:
+        """Compile the codec for a model class.
+
+        Args:
+            model: The Pydantic model class.
+            backend: JSON backend (default: `get_backend()`).
+        """
+        self.model = model
+        self.backend = backend or get_backend()
+        hints = typing.get_type_hints(model)
+        self._plan: List[Tuple[str, int, Any]] = []
+        for name in _model_fields(model):
+            kind, extra = _classify(hints.get(name, Any))
+            self._plan.append((name, kind, extra))
+        self._simple = all(kind == _PLAIN for _, kind, _ in self._plan)
+        # Support both Pydantic v1 and v2
+        self._construct = getattr(model, "model_construct", None) or model.construct
+
+    def to_dict(self, obj: M) -> Dict[str, Any]:
+        """Convert a model instance to JSON-ready primitives."""
+        values = obj.__dict__
+        if self._simple:
+            return {name: values[name] for name, _, _ in self._plan}
+        out: Dict[str, Any] = {}
+        for name, kind, extra in self._plan:
+            value = values[name]
+            if value is not None and kind != _PLAIN:
+                if kind == _DATETIME:
+                    value = value.isoformat()
+                elif kind == _ENUM:
+                    value = value.value
+                else:
+                    value = extra.to_dict(value)
+            out[name] = value
+        return out
+
+    def from_dict(self, data: Dict[str, Any], trusted: bool = False) -> M:
+        """Build a model instance from decoded primitives.
+
+        Args:
+            data: Decoded JSON object.
+            trusted: Skip validation and rebuild field types from the plan.
+                Only for data this process (or a trusted peer) produced.
+
+        Returns:
+            The model instance.
+        """
+        if not trusted:
+            return self.model(**data)
+        if not self._simple:
+            data = dict(data)
+            for name, kind, extra in self._plan:
+                value = data.get(name)
+                if value is None or kind == _PLAIN:
+                    continue
+                if kind == _DATETIME:
+                    data[name] = datetime.fromisoformat(value)
+                elif kind == _ENUM:
+                    data[name] = extra(value)
+                else:
+                    data[name] = extra.from_dict(value, trusted=True)
+        return self._construct(**data)
+
+    def encode(self, obj: M, indent: bool = False) -> bytes:
+        """Encode a model instance as UTF-8 JSON bytes."""
+        if indent:
+            return self.backend.dumps_indent(self.to_dict(obj))
+        return self.backend.dumps(self.to_dict(obj))
+
+    def encode_line(self, obj: M) -> bytes:
+        """Encode a model instance as one JSONL record (with trailing newline)."""
+        return self.backend.dumps(self.to_dict(obj)) + b"\n"
+
+    def decode(self, data: Union[bytes, str], trusted: bool = False) -> M:
+        """Decode JSON bytes/str into a model instance.
+
+        Args:
+            data: The JSON document.
+            trusted: Skip validation (see `from_dict`).
+
+        Returns:
+            The model instance.
+        """
+        return self.from_dict(self.backend.loads(data), trusted=trusted)
+
+
+_codec_cache: Dict[Type[BaseModel], ModelCodec] = {}
+
+
+def codec_for(model: Type[M]) -> ModelCodec[M]:
+    """Return the shared ModelCodec for a model class (default backend).
+
+    Args:
+        model: The Pydantic model class.
+
+    Returns:
+        The cached ModelCodec.
+    """
+    codec = _codec_cache.get(model)
+    if codec is None:
+        codec = ModelCodec(model)
+        _codec_cache[model] = codec
+    return codec
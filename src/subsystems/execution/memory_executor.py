@@ -57,7 +57,8 @@ class MemoryExecutor(SubsystemExecutor):
         """Execute memory processing.
 
         Args:
-            input_data: STM entry or raw event data to process.
+            input_data: STM entry or raw event data to process, or a list of
+                them (processed as one pipeline batch).
 
         Returns:
             Dictionary with processing results.
@@ -65,23 +66,34 @@ class MemoryExecutor(SubsystemExecutor):
         if self._pipeline is None:
             raise RuntimeError("Memory pipeline not initialized")
 
-        # Convert input to STM entry if needed
-        if isinstance(input_data, STMMemoryEntry):
-            stm_entry = input_data
-        else:
-            # Phase 6: Basic conversion
-            stm_entry = STMMemoryEntry(
-                raw_payload=input_data if isinstance(input_data, dict) else {"data": str(input_data)},
-            )
+        if isinstance(input_data, list):
+            result = self._pipeline.process_batch([self._to_stm_entry(item) for item in input_data])
+            return {
+                "memory_ids": [entry.memory_id for entry in result.consolidated_entries],
+                "status": "batch",
+                "consolidated": result.consolidated,
+                "discarded": result.processed - result.consolidated,
+                "stage_seconds": result.stage_seconds,
+            }
 
         # Process through pipeline
-        ltm_entry = self._pipeline.process_stm_entry(stm_entry)
+        ltm_entry = self._pipeline.process_stm_entry(self._to_stm_entry(input_data))
 
         if ltm_entry:
             return {"memory_id": ltm_entry.memory_id, "status": "consolidated"}
         else:
             return {"status": "discarded"}
 
+    @staticmethod
+    def _to_stm_entry(input_data: Any) -> STMMemoryEntry:
+        """Convert input to an STM entry if needed."""
+        if isinstance(input_data, STMMemoryEntry):
+            return input_data
+        # Phase 6: Basic conversion
+        return STMMemoryEntry(
+            raw_payload=input_data if isinstance(input_data, dict) else {"data": str(input_data)},
+        )
+
 
 
 
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Benchmark ModelCodec against pydantic .dict() + stdlib json.
+
+For EventEnvelope, LTMMemoryEntry, GateState and SessionSummary, reports
+encode and decode throughput (objects/s) for:
+- baseline: .dict()/model_dump() + json.dumps, json.loads + Model(**data)
+- ModelCodec on every installed backend (orjson, msgspec, json), decoding
+  both validated and trusted (construct)
+
+Usage:
+    python tools/benchmarks/bench_codec.py [--count 20000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.events.emission import EventFactory  # noqa: E402
+from src.gate.models import GateState, SessionMetadata, SessionSummary  # noqa: E402
+from src.memory.models import LTMMemoryEntry, MemoryPriority, MemoryType  # noqa: E402
+from src.serialization import ModelCodec, get_backend  # noqa: E402
+
+
+def sample_objects():
+    """Return one representative instance per benchmarked model."""
+    event = EventFactory.create(
+        "bench", "home", "interaction.message_received",
+        {"text": "hello there", "channel": "cli", "tokens": [1, 2, 3]},
+    )
+    memory = LTMMemoryEntry(
+        memory_id="m-1",
+        timestamp=datetime.now(timezone.utc),
+        type=MemoryType.CONVERSATION,
+        content_summary="Talked about the garden and the weekend plans",
+        emotional_signature_vector={"joy": 0.7, "calm": 0.4},
+        experience_tags=["interaction", "slepp", "garden"],
+        xp_yield=1.5,
+        impact_level=3,
+        priority=MemoryPriority.IMPORTANT,
+        source_subsystem="memory",
+        metadata={"significance_score": 0.8},
+    )
+    state = GateState(last_session_id="s-1", last_event_id="e-1", latest_log_path="logs/x.jsonl")
+    summary = SessionSummary(
+        session_metadata=SessionMetadata(session_id="s-1", start_timestamp="2025-01-01T00:00:00"),
+        event_summary={"total_events": 120, "event_types": {"interaction.message_received": 80}},
+        memory_candidates=[{"memory_id": f"m-{i}", "significance_score": 0.5} for i in range(5)],
+    )
+    return [event, memory, state, summary]
+
+
+def rate(count: int, fn) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        fn()
+    return count / (time.perf_counter() - start)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=20_000)
+    args = parser.parse_args()
+
+    backends = []
+    for name in ("orjson", "msgspec", "json"):
+        try:
+            backends.append(get_backend(name))
+        except ImportError:
+            print(f"(backend {name} not installed)")
+
+    print(f"{'model':<16} {'codec':<22} {'encode/s':>12} {'decode/s':>12} {'trusted/s':>12}")
+    for obj in sample_objects():
+        model = type(obj)
+        dump = getattr(obj, "model_dump", None) or obj.dict
+        baseline_doc = json.dumps(dump(), default=str)
+        enc = rate(args.count, lambda: json.dumps(dump(), default=str))
+        dec = rate(args.count, lambda: model(**json.loads(baseline_doc)))
+        print(f"{model.__name__:<16} {'baseline dict+json':<22} {enc:>12,.0f} {dec:>12,.0f} {'-':>12}")
+        for backend in backends:
+            codec = ModelCodec(model, backend)
+            doc = codec.encode(obj)
+            enc = rate(args.count, lambda: codec.encode(obj))
+            dec = rate(args.count, lambda: codec.decode(doc))
+            trusted = rate(args.count, lambda: codec.decode(doc, trusted=True))
+            print(f"{'':<16} {backend.name:<22} {enc:>12,.0f} {dec:>12,.0f} {trusted:>12,.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
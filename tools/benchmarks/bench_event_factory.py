@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Benchmark EventFactory.create against EventFactory.create_many.
+
+Reports envelopes per second for:
+- create() in a loop (uuid4 + timestamp + validation per event)
+- create_many() with full validation
+- create_many() with a shared timestamp
+- create_many() with a shared timestamp and validate=False (construct)
+
+Usage:
+    python tools/benchmarks/bench_event_factory.py [--count 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.events.emission import EventFactory  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    specs = [("interaction.message_received", {"i": i}) for i in range(args.count)]
+
+    def loop_create() -> None:
+        for event_type, payload in specs:
+            EventFactory.create("bench", "home", event_type, payload)
+
+    cases = [
+        ("create() loop", loop_create),
+        ("create_many()", lambda: EventFactory.create_many("bench", "home", specs)),
+        (
+            "create_many(shared_timestamp)",
+            lambda: EventFactory.create_many("bench", "home", specs, shared_timestamp=True),
+        ),
+        (
+            "create_many(shared_timestamp, validate=False)",
+            lambda: EventFactory.create_many(
+                "bench", "home", specs, shared_timestamp=True, validate=False
+            ),
+        ),
+    ]
+
+    baseline = None
+    for name, fn in cases:
+        start = time.perf_counter()
+        fn()
+        rate = args.count / (time.perf_counter() - start)
+        baseline = baseline or rate
+        print(f"{name:<48} {rate:>12,.0f} env/s  {rate / baseline:>5.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
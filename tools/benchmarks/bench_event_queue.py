@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Benchmark EventQueue (sorted list) against HeapEventQueue.
+
+Measures bulk fill + drain throughput for HeapEventQueue and the steady-state
+per-operation cost (enqueue + dequeue) for both queues at a given depth.
+
+EventQueue re-sorts on every enqueue, so filling it to 1M events one insert at
+a time is quadratic; its backing list is pre-filled directly and only the
+steady-state operations are timed.
+
+Usage:
+    python tools/benchmarks/bench_event_queue.py [--sizes 10000 100000 1000000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.events.queue import EventQueue, HeapEventQueue  # noqa: E402
+from src.state.models.event_envelope import EventEnvelope  # noqa: E402
+
+
+def make_events(count: int) -> list[EventEnvelope]:
+    """Build `count` envelopes, every fourth one carrying a seq."""
+    events = []
+    for i in range(count):
+        events.append(
+            EventEnvelope.construct(
+                event_id=f"00000000-0000-4000-8000-{i:012d}",
+                seq=i + 1 if i % 4 == 0 else 0,
+                ts_utc=f"2025-01-01T00:00:{(count - i) % 60:02d}.{i % 1000:03d}Z",
+                source_instance_id="bench",
+                source_kind="home",
+                type="bench.event",
+                payload={},
+                meta=None,
+            )
+        )
+    return events
+
+
+def bench_steady_state(queue, extra: list[EventEnvelope]) -> float:
+    """Return mean microseconds per enqueue+dequeue pair."""
+    start = time.perf_counter()
+    for event in extra:
+        queue.enqueue(event)
+        queue.dequeue()
+    return (time.perf_counter() - start) / len(extra) * 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--ops", type=int, default=200, help="steady-state ops per size")
+    args = parser.parse_args()
+
+    print(f"{'size':>10} {'heap fill ev/s':>16} {'heap drain ev/s':>16} "
+          f"{'heap us/op':>11} {'list us/op':>11}")
+    for size in args.sizes:
+        events = make_events(size)
+        extra = make_events(args.ops)
+
+        heap_queue = HeapEventQueue()
+        start = time.perf_counter()
+        for event in events:
+            heap_queue.enqueue(event)
+        fill_rate = size / (time.perf_counter() - start)
+
+        heap_us = bench_steady_state(heap_queue, extra)
+
+        start = time.perf_counter()
+        heap_queue.drain()
+        drain_rate = size / (time.perf_counter() - start)
+
+        list_queue = EventQueue()
+        list_queue._events = sorted(
+            events, key=lambda e: (e.seq if e.seq > 0 else float("inf"), e.ts_utc)
+        )
+        list_us = bench_steady_state(list_queue, extra)
+
+        print(f"{size:>10} {fill_rate:>16,.0f} {drain_rate:>16,.0f} "
+              f"{heap_us:>11.2f} {list_us:>11.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
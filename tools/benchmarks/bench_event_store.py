@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Benchmark SQLiteEventStore append and since() throughput.
+
+Reports:
+- append_many() throughput for several batch sizes (one transaction each)
+- submit() throughput with many small pipelined appends (group commit)
+- append() throughput with one blocking caller (one commit per event)
+- since() latency for 100-event pages
+
+Usage:
+    python tools/benchmarks/bench_event_store.py [--count 200000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.events.emission import EventFactory  # noqa: E402
+from src.events.store import SQLiteEventStore  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--synchronous", default="NORMAL")
+    args = parser.parse_args()
+
+    events = EventFactory.create_many(
+        "bench",
+        "home",
+        [("interaction.message_received", {"text": "hello", "i": i}) for i in range(args.count)],
+        shared_timestamp=True,
+        validate=False,
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SQLiteEventStore(Path(tmp) / "events.db", synchronous=args.synchronous)
+
+        for batch_size in (100, 1_000, 10_000):
+            start = time.perf_counter()
+            for i in range(0, args.count, batch_size):
+                store.append_many(events[i:i + batch_size])
+            rate = args.count / (time.perf_counter() - start)
+            print(f"append_many(batch={batch_size:>6}) {rate:>12,.0f} ev/s")
+
+        start = time.perf_counter()
+        futures = [store.submit([event]) for event in events]
+        for future in futures:
+            future.result()
+        rate = args.count / (time.perf_counter() - start)
+        print(f"submit() pipelined          {rate:>12,.0f} ev/s")
+
+        single = events[: min(2_000, args.count)]
+        start = time.perf_counter()
+        for event in single:
+            store.append(event)
+        rate = len(single) / (time.perf_counter() - start)
+        print(f"append() blocking           {rate:>12,.0f} ev/s")
+
+        last = store.last_seq()
+        reads = 2_000
+        start = time.perf_counter()
+        for _ in range(reads):
+            store.since(f"s:{random.randrange(0, last - 100)}", 100)
+        per_read = (time.perf_counter() - start) / reads * 1000
+        print(f"since(limit=100)            {per_read:>12.3f} ms/page")
+        store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
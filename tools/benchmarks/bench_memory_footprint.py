@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Benchmark the memory footprint of LTM memory sets.
+
+Builds the same synthetic memories as a list of LTMMemoryEntry models and as
+a ColumnarMemoryStore, measures each with tracemalloc, and reports the
+footprint extrapolated to 1M entries plus build and materialisation times.
+
+Usage:
+    python tools/benchmarks/bench_memory_footprint.py [--count 200000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.memory.columnar import ColumnarMemoryStore  # noqa: E402
+from src.memory.models import LTMMemoryEntry, MemoryPriority, MemoryType  # noqa: E402
+
+TAGS = ["interaction", "goal", "debate", "emotional", "slepp", "relational", "priority_low",
+        "priority_medium", "narrative_significant", "drift_sensitive"] + [f"topic_{i}" for i in range(200)]
+WORDS = "we talked about the garden weekend plans music storm river quiet walk".split()
+
+
+def make_memories(count: int):
+    """Yield synthetic memories with a realistic field mix."""
+    rng = random.Random(0)
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    for i in range(count):
+        yield LTMMemoryEntry(
+            memory_id=f"mem-{i:08d}-{rng.getrandbits(64):016x}",
+            timestamp=base + timedelta(seconds=i * 30),
+            type=rng.choice(list(MemoryType)),
+            content_summary=" ".join(rng.choices(WORDS, k=rng.randint(6, 20))),
+            emotional_signature_vector={
+                "valence": rng.uniform(-1, 1), "arousal": rng.random(), "stability": rng.random()
+            },
+            experience_tags=rng.sample(TAGS, rng.randint(2, 6)),
+            xp_yield=rng.random() * 5,
+            impact_level=rng.randint(0, 5),
+            priority=rng.choice(list(MemoryPriority)),
+            source_subsystem=rng.choice(["memory", "experience", "learning"]),
+            metadata={"significance_score": rng.random()} if i % 4 == 0 else {},
+        )
+
+
+def measure(build):
+    """Return (result, traced bytes, seconds) for a builder."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size, elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200_000)
+    args = parser.parse_args()
+    scale = 1_000_000 / args.count
+
+    models, model_bytes, model_seconds = measure(lambda: list(make_memories(args.count)))
+    # tracemalloc only counts allocations made while building the store
+    store, store_bytes, store_seconds = measure(lambda: _build_store(models))
+
+    print(f"{'':24}{'MB per 1M':>12}{'bytes/entry':>14}{'build s':>10}")
+    print(f"{'LTMMemoryEntry list':24}{model_bytes * scale / 1e6:>12,.0f}"
+          f"{model_bytes / args.count:>14,.0f}{model_seconds:>10.2f}")
+    print(f"{'ColumnarMemoryStore':24}{store_bytes * scale / 1e6:>12,.0f}"
+          f"{store_bytes / args.count:>14,.0f}{store_seconds:>10.2f}")
+    print(f"store.nbytes()          {store.nbytes() * scale / 1e6:>12,.0f}")
+
+    rows = random.Random(1).sample(range(store.row_count), min(20_000, args.count))
+    start = time.perf_counter()
+    for row in rows:
+        store.materialize(row)
+    per_entry = (time.perf_counter() - start) / len(rows) * 1e6
+    print(f"materialize()           {per_entry:>12.1f} us/entry")
+    return 0
+
+
+def _build_store(memories) -> ColumnarMemoryStore:
+    store = ColumnarMemoryStore()
+    store.add_many(memories)
+    return store
+
+
+if __name__ == "__main__":
+    sys.exit(main())
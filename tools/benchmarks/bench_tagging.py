@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Benchmark the memory pipeline TaggingEngine.
+
+Tags STM entries built from recorded session logs (or a synthetic corpus
+if none are found) and reports entries per second for:
+- tag() in a loop, default rules
+- tag_batch(), default rules
+- tag_batch() with 40 extra keyword rules
+
+Usage:
+    python tools/benchmarks/bench_tagging.py [--count 100000] [--sessions logs/runtime_sessions]
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.memory.models import STMMemoryEntry  # noqa: E402
+from src.memory.tagging import DEFAULT_TAG_RULES, TaggingEngine, TagRule  # noqa: E402
+from src.runtime.replay import find_session_logs, merge_session_events  # noqa: E402
+
+EVENT_TYPES = ["interaction.message_received", "goal.created", "goal.progress", "debate.opened",
+               "system.tick", "presence.update"] + [f"custom.event_{i}" for i in range(20)]
+WORDS = "we talked about the garden weekend plans music storm river quiet walk slepp".split()
+
+
+def load_payloads(sessions_dir: Path):
+    """Return (event_type, content_summary) pairs from recorded sessions."""
+    events = merge_session_events(find_session_logs(sessions_dir)) if sessions_dir.is_dir() else ()
+    return [(event.type, " ".join(str(value) for value in event.payload.values())) for event in events]
+
+
+def synthetic_payloads(count: int):
+    """Return synthetic (event_type, content_summary) pairs."""
+    rng = random.Random(0)
+    return [(rng.choice(EVENT_TYPES), " ".join(rng.choices(WORDS, k=rng.randint(4, 30)))) for _ in range(count)]
+
+
+def make_entries(payloads, count: int):
+    """Build `count` fresh STM entries, cycling through the payloads."""
+    rng = random.Random(1)
+    return [
+        STMMemoryEntry(
+            raw_payload={
+                "event_type": event_type,
+                "content_summary": content,
+                "significance_score": rng.random(),
+                "identity_relevance_score": rng.random(),
+            },
+            emotional_hint={"valence": 0.2, "arousal": 0.4} if rng.random() < 0.5 else None,
+        )
+        for event_type, content in itertools.islice(itertools.cycle(payloads), count)
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--sessions", type=Path, default=Path("logs/runtime_sessions"))
+    args = parser.parse_args()
+
+    payloads = load_payloads(args.sessions)
+    source = f"{len(payloads)} recorded events"
+    if len(payloads) < 100:
+        payloads = synthetic_payloads(10_000)
+        source = "synthetic corpus"
+    print(f"corpus: {source}")
+
+    extra_rules = DEFAULT_TAG_RULES + tuple(
+        TagRule("content_summary", f"topic{i}", (f"topic_{i}",)) for i in range(40)
+    )
+    default_engine = TaggingEngine()
+    extended_engine = TaggingEngine(extra_rules)
+
+    def loop_tag(entries) -> None:
+        for entry in entries:
+            default_engine.tag(entry)
+
+    cases = [
+        ("tag() loop", loop_tag),
+        ("tag_batch()", default_engine.tag_batch),
+        ("tag_batch() +40 rules", extended_engine.tag_batch),
+    ]
+    for name, run in cases:
+        entries = make_entries(payloads, args.count)
+        start = time.perf_counter()
+        run(entries)
+        elapsed = time.perf_counter() - start
+        print(f"{name:24} {args.count / elapsed:>12,.0f} entries/s")
+    print(f"cache: {default_engine.cache_info()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
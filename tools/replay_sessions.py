@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""Replay recorded runtime sessions through the CognitiveOrchestrator.
+
+Usage:
+    python tools/replay_sessions.py                      # logs/runtime_sessions, as fast as possible
+    python tools/replay_sessions.py --speed 10 a.jsonl b.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(REPO_ROOT / "src"))  # StateContainer imports state classes by top-level name
+
+from src.runtime.replay import (  # noqa: E402
+    find_session_logs,
+    replay_sessions_into_orchestrator,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("logs", nargs="*", type=Path, help="Session logs (default: all recorded sessions)")
+    parser.add_argument("--speed", type=float, default=None, help="Real-time multiple (default: as fast as possible)")
+    parser.add_argument("--limit", type=int, default=None, help="Maximum events to replay")
+    args = parser.parse_args()
+
+    paths = args.logs or find_session_logs(REPO_ROOT / "logs" / "runtime_sessions")
+    if not paths:
+        print("No session logs found", file=sys.stderr)
+        return 1
+
+    report, _ = replay_sessions_into_orchestrator(paths, speed=args.speed, limit=args.limit)
+    print(json.dumps(report.to_dict(), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Convert gate session logs between JSONL and the compact binary format.
+
+Usage:
+    python tools/session_log_convert.py to-binary logs/runtime_sessions/x.jsonl x.nslog
+    python tools/session_log_convert.py to-jsonl x.nslog x.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.gate.session_log import (  # noqa: E402
+    Compression,
+    convert_binary_to_jsonl,
+    convert_jsonl_to_binary,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("direction", choices=["to-binary", "to-jsonl"])
+    parser.add_argument("source", type=Path)
+    parser.add_argument("destination", type=Path)
+    parser.add_argument(
+        "--compression",
+        choices=[c.name.lower() for c in Compression],
+        default="zlib",
+        help="Frame compression for to-binary (default: zlib)",
+    )
+    args = parser.parse_args()
+
+    if args.direction == "to-binary":
+        count = convert_jsonl_to_binary(
+            args.source, args.destination, Compression[args.compression.upper()]
+        )
+    else:
+        count = convert_binary_to_jsonl(args.source, args.destination)
+
+    src_size = args.source.stat().st_size
+    dst_size = args.destination.stat().st_size
+    print(f"{count} events: {src_size} -> {dst_size} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())